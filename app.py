@@ -1,25 +1,245 @@
 # Main Flask application
 
-from flask import Flask, render_template, request, jsonify
-from utils import calculate_readiness_score, get_readiness_level
+from flask import Flask, Request, Response, render_template, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from utils import calculate_readiness_score, get_readiness_level, create_job_ranking_index, ResumeAnalysisCache, hash_file_stream, create_application_store, ApplicationStatistics, ReminderScheduler, FeedbackCache, LLMRequestLimiter, LLMQueueFullError, FeedbackUnavailableError, PRIORITY_IN_PROGRESS, PRIORITY_NEW, get_prompt_key, create_session_store, StaticAssetCache, choose_content_encoding, compress_body, COMPRESSIBLE_MIMETYPES, parse_fields, select_fields, stream_json_array, compress_stream
 import os
-from werkzeug.utils import secure_filename
+import json
+import time
+import click
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+class UploadRequest(Request):
+    """Request that keeps uploaded files in memory up to UPLOAD_IN_MEMORY_MAX"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Spills to an anonymous temp file only for uploads over the threshold
+        return SpooledTemporaryFile(max_size=app.config['UPLOAD_IN_MEMORY_MAX'], mode='rb+')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes and decodes with orjson
+    Output matches the default provider (sorted keys, HTTP dates); values
+    orjson can't encode (e.g. integers over 64 bits) fall back to it
+    """
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            # json.dumps options (indent, separators, ...) need the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode()
+    
+    def dumps_bytes(self, obj, option=0):
+        """Encode obj as JSON bytes (orjson OPT_* flags may be added)"""
+        option |= orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            text = super().dumps(obj, indent=2 if option & orjson.OPT_INDENT_2 else None)
+            return (text + '\n' if option & orjson.OPT_APPEND_NEWLINE else text).encode()
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_APPEND_NEWLINE
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(self.dumps_bytes(obj, option), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
-# Configure upload folder and allowed extensions
-UPLOAD_FOLDER = 'data/uploads'
+app.request_class = UploadRequest
+# Configure allowed upload extensions
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # 10MB max file size
-# Create upload folder if it doesn't exist
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+app.config['UPLOAD_IN_MEMORY_MAX'] = 2 * 1024 * 1024  # Uploads up to 2MB are parsed in memory
+app.config['RESUME_CACHE_MAX_ENTRIES'] = 256
+app.config['RESUME_CACHE_TTL'] = 24 * 60 * 60  # Seconds
+app.config['RESUME_CACHE_DIR'] = os.getenv('RESUME_CACHE_DIR')  # e.g. data/resume_cache; unset = memory only
+app.config['RESUME_CACHE_MAX_DISK_ENTRIES'] = 1024  # Files kept in RESUME_CACHE_DIR
+app.config['APPLICATION_STORE'] = os.getenv('APPLICATION_STORE', 'sqlite')  # 'sqlite' or 'memory'
+app.config['APPLICATION_DB_PATH'] = os.getenv('APPLICATION_DB_PATH', 'data/careerbot.db')
+app.config['JOB_STORE'] = os.getenv('JOB_STORE', 'sqlite')  # 'sqlite' or 'memory'
+app.config['JOB_DB_PATH'] = os.getenv('JOB_DB_PATH', 'data/careerbot.db')
+app.config['REMINDER_CHECK_INTERVAL'] = int(os.getenv('REMINDER_CHECK_INTERVAL', '60'))  # Seconds; 0 disables the background check
+app.config['REMINDER_LOCK_PATH'] = os.getenv('REMINDER_LOCK_PATH', 'data/reminder_scheduler.lock')  # Only its holder runs the check
+app.config['FEEDBACK_CACHE_MAX_ENTRIES'] = 1024
+app.config['FEEDBACK_CACHE_TTL'] = 7 * 24 * 60 * 60  # Seconds
+app.config['FEEDBACK_CACHE_NEAR_DUPLICATES'] = os.getenv('FEEDBACK_CACHE_NEAR_DUPLICATES', '1') == '1'  # Reuse feedback for near-identical answers
+app.config['LLM_MAX_CONCURRENT'] = int(os.getenv('LLM_MAX_CONCURRENT', '8'))  # Per worker process
+app.config['LLM_RATE_LIMIT'] = float(os.getenv('LLM_RATE_LIMIT', '0'))  # Requests per second per worker; 0 = no limit
+app.config['LLM_MAX_QUEUE'] = int(os.getenv('LLM_MAX_QUEUE', '100'))
+app.config['LLM_QUEUE_TIMEOUT'] = 30  # Seconds a request may wait for a slot
+app.config['SESSION_STORE'] = os.getenv('SESSION_STORE', 'sqlite')  # 'sqlite', 'memory' or 'redis'
+app.config['SESSION_DB_PATH'] = os.getenv('SESSION_DB_PATH', 'data/careerbot.db')
+app.config['REDIS_URL'] = os.getenv('REDIS_URL')  # e.g. redis://localhost:6379/0; unset = in-process stand-in
+app.config['SESSION_TTL'] = int(os.getenv('SESSION_TTL', str(6 * 60 * 60)))  # Seconds of inactivity before a session expires
+app.config['SESSION_MAX_ENTRIES'] = int(os.getenv('SESSION_MAX_ENTRIES', '10000'))
+app.config['COMPRESS_MIN_SIZE'] = 500  # Bytes; smaller responses are sent uncompressed
+app.config['COMPRESS_LEVEL'] = 6  # 1 (fastest) to 9 (smallest) for dynamic responses
+app.config['STATIC_MAX_AGE'] = 365 * 24 * 60 * 60  # Seconds browsers keep versioned static files
+app.config['JSON_PROVIDER'] = os.getenv('JSON_PROVIDER', 'orjson')  # 'orjson' (if installed) or 'stdlib'
+app.config['JSON_STREAM_THRESHOLD'] = 1000  # Collections with more items are streamed
+app.config['JSON_STREAM_CHUNK'] = 200  # Items per chunk of a streamed JSON array
+MAX_BATCH_JOBS = 1000  # Max jobs per /api/analyze-gap-batch request
+MAX_BATCH_ANSWERS = 50  # Max answers per /api/grade-answers request
+MAX_SPEECH_BATCH = 5000  # Max answers per /api/analyze-speech request
+MAX_APPLICATIONS_PAGE = 500  # Max page size for /api/get-applications
+# Faster JSON for every response when orjson is installed
+if orjson is not None and app.config['JSON_PROVIDER'] == 'orjson':
+    app.json = OrjsonProvider(app)
 
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+
+# Static files, held in memory with a content hash and precompressed copies
+static_assets = StaticAssetCache(app.static_folder)
+
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    # url_for('static', ...) gets ?v=<content hash>, so a changed file gets a new URL
+    if endpoint == 'static' and 'filename' in values:
+        version = static_assets.version(values['filename'])
+        if version:
+            values.setdefault('v', version)
+
+
+def serve_static(filename):
+    """
+    Serve a static file in the best encoding the client accepts
+    Versioned URLs (?v=<current hash>) may be cached for STATIC_MAX_AGE;
+    other requests must revalidate with the ETag
+    """
+    asset = static_assets.get(filename)
+    if asset is None:
+        return app.send_static_file(filename)
+    
+    encoding = choose_content_encoding(request.accept_encodings) if len(asset.variants) > 1 else None
+    response = Response(asset.variants[encoding], mimetype=asset.mimetype)
+    if encoding:
+        response.content_encoding = encoding
+    if len(asset.variants) > 1:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(f'{asset.version}-{encoding or "identity"}')
+    
+    if request.args.get('v') == asset.version:
+        response.cache_control.public = True
+        response.cache_control.max_age = app.config['STATIC_MAX_AGE']
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+app.view_functions['static'] = serve_static
+
+
+def not_modified(etag):
+    """
+    Return a 304 response if the client already has this version, else None
+    
+    Parameters:
+    etag (str): Version tag of the data the endpoint would return
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+
+@app.after_request
+def compress_response(response):
+    """
+    Add validators to JSON reads and compress text responses
+    
+    GET responses without an ETag get one from their body (so repeat
+    reads cost a 304), and tags are weak because the compressed and
+    uncompressed bodies are the same data. Streams (SSE) and responses that
+    already have an encoding are left alone; streamed JSON is gzipped as
+    it goes.
+    """
+    if response.direct_passthrough or response.status_code != 200:
+        return response
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES or 'Content-Encoding' in response.headers:
+        return response
+    
+    if response.is_streamed:
+        response.vary.add('Accept-Encoding')
+        if response.mimetype == 'application/json' and request.accept_encodings['gzip']:
+            response.response = compress_stream(response.response, app.config['COMPRESS_LEVEL'])
+            response.content_encoding = 'gzip'
+            etag, weak = response.get_etag()
+            if etag and not weak:
+                response.set_etag(etag, weak=True)
+        return response
+    
+    if request.method == 'GET' and response.mimetype == 'application/json':
+        if response.get_etag()[0] is None:
+            response.add_etag(weak=True)
+        response.cache_control.no_cache = True
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = choose_content_encoding(request.accept_encodings)
+    data = response.get_data()
+    if encoding and len(data) >= app.config['COMPRESS_MIN_SIZE']:
+        etag, weak = response.get_etag()
+        response.set_data(compress_body(data, encoding, app.config['COMPRESS_LEVEL']))
+        response.content_encoding = encoding
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+    return response
+
+
+def json_collection_response(key, items, **fields):
+    """
+    Build the JSON response {key: items, **fields}
+    
+    Collections over JSON_STREAM_THRESHOLD items are streamed in chunks
+    (same JSON, but the first bytes go out before the rest is encoded).
+    
+    Parameters:
+    key (str): Name of the list in the response
+    items (list): The collection
+    fields: Other top-level values
+    """
+    if len(items) <= app.config['JSON_STREAM_THRESHOLD']:
+        return jsonify({key: items, **fields})
+    
+    dumps = app.json.dumps
+    
+    def generate():
+        yield '{' + dumps(key) + ':'
+        yield from stream_json_array(items, dumps, app.config['JSON_STREAM_CHUNK'])
+        # The other keys, reusing the encoder's closing brace
+        yield (',' + dumps(fields)[1:] if fields else '}') + '\n'
+    
+    return Response(generate(), mimetype='application/json')
+
+
 # Route for dashboard (home page)
 @app.route('/')
 def home():
@@ -156,6 +376,150 @@ def analyze_gap():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+
+# API endpoint to rank many jobs against one user's skills
+@app.route('/api/analyze-gap-batch', methods=['POST'])
+def analyze_gap_batch():
+    """
+    Compare user skills with the requirements of many jobs at once
+    Expects JSON with 'user_skills' and a 'jobs' array, where each job is
+    either {'id', 'title', 'required_skills'} or a plain list of skills
+    """
+    try:
+        # Get data from request
+        data = request.get_json()
+        user_skills = data.get('user_skills', [])
+        jobs = data.get('jobs', [])
+        
+        # Validate input
+        if not user_skills:
+            return jsonify({'error': 'Please provide your skills'}), 400
+        if not isinstance(user_skills, list) or not all(isinstance(skill, str) for skill in user_skills):
+            return jsonify({'error': 'user_skills must be a list of strings'}), 400
+        if not jobs:
+            return jsonify({'error': 'Please provide at least one job'}), 400
+        if not isinstance(jobs, list):
+            return jsonify({'error': 'jobs must be a list'}), 400
+        if len(jobs) > MAX_BATCH_JOBS:
+            return jsonify({'error': f'Too many jobs (maximum {MAX_BATCH_JOBS} per request)'}), 400
+        for index, job in enumerate(jobs):
+            required_skills = job.get('required_skills') if isinstance(job, dict) else job
+            if not isinstance(required_skills, list) or not all(isinstance(skill, str) for skill in required_skills):
+                return jsonify({'error': f'Job {index} must be a list of skills or an object with a required_skills list'}), 400
+        
+        # Score and rank every job
+        from utils import rank_jobs_by_skill_gap
+        results = rank_jobs_by_skill_gap(user_skills, jobs)
+        
+        return jsonify({
+            'results': results,
+            'total_jobs': len(results)
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# Job postings for ranking, stored in SQLite by default; each worker keeps
+# its NumPy index in step with the table's change version
+job_postings = create_job_ranking_index(
+    backend=app.config['JOB_STORE'],
+    db_path=app.config['JOB_DB_PATH']
+)
+
+
+# API endpoint to store job postings for ranking
+@app.route('/api/add-jobs', methods=['POST'])
+def add_jobs():
+    """
+    Add or replace job postings in the ranking index
+    Expects JSON with a 'jobs' array; each job needs an 'id' and either
+    'required_skills' or a 'description' to extract skills from
+    """
+    try:
+        # Get jobs from request
+        data = request.get_json()
+        jobs = data.get('jobs', [])
+        
+        # Validate input
+        if not jobs:
+            return jsonify({'error': 'Please provide at least one job'}), 400
+        if any(not isinstance(job, dict) or job.get('id') in (None, '') for job in jobs):
+            return jsonify({'error': 'Every job needs an id'}), 400
+        
+        # Store (or replace) the postings
+        added = job_postings.add_jobs(jobs)
+        
+        return jsonify({
+            'message': 'Jobs added successfully',
+            'added': added,
+            'total_jobs': len(job_postings)
+        }), 201
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# API endpoint to remove a job posting from the ranking index
+@app.route('/api/delete-job/<job_id>', methods=['DELETE'])
+def delete_job(job_id):
+    """
+    Delete a stored job posting
+    """
+    try:
+        if not job_postings.remove_job(job_id):
+            return jsonify({'error': 'Job not found'}), 404
+        
+        return jsonify({'message': 'Job deleted successfully'}), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# API endpoint to rank stored job postings for a user
+@app.route('/api/rank-jobs', methods=['POST'])
+def rank_jobs():
+    """
+    Rank every stored job posting against the user's skills
+    Expects JSON with 'user_skills', optional 'metric'
+    (coverage, jaccard or weighted) and optional 'top_k'
+    """
+    try:
+        # Get data from request
+        data = request.get_json()
+        user_skills = data.get('user_skills', [])
+        metric = data.get('metric', 'weighted')
+        top_k = int(data.get('top_k', 20))
+        
+        # Validate input
+        if not user_skills:
+            return jsonify({'error': 'Please provide your skills'}), 400
+        if top_k < 1 or top_k > MAX_BATCH_JOBS:
+            return jsonify({'error': f'top_k must be between 1 and {MAX_BATCH_JOBS}'}), 400
+        
+        # Score every stored job at once
+        results = job_postings.rank(user_skills, metric=metric, top_k=top_k)
+        
+        return jsonify({
+            'results': results,
+            'metric': metric,
+            'total_jobs': len(job_postings)
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Content-addressed cache of resume analyses (keyed by SHA-256 of the file)
+resume_cache = ResumeAnalysisCache(
+    max_entries=app.config['RESUME_CACHE_MAX_ENTRIES'],
+    ttl_seconds=app.config['RESUME_CACHE_TTL'],
+    persist_dir=app.config['RESUME_CACHE_DIR'],
+    max_disk_entries=app.config['RESUME_CACHE_MAX_DISK_ENTRIES']
+)
+
+
 # API endpoint to upload and analyze resume
 @app.route('/api/analyze-resume', methods=['POST'])
 def analyze_resume_endpoint():
@@ -178,20 +542,21 @@ def analyze_resume_endpoint():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Only PDF and DOCX files are allowed'}), 400
         
-        # Save the file securely
-        filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
+        # Repeat uploads of the same file are answered from the cache
+        digest = hash_file_stream(file.stream)
+        cached = resume_cache.get(digest)
+        if cached is not None:
+            return jsonify(dict(cached['analysis'], cached=True)), 200
         
-        # Extract text based on file type
+        # Parse straight from the upload stream - small uploads never touch disk
         from utils import extract_text_from_pdf, extract_text_from_docx, analyze_resume, generate_resume_improvements
         
-        file_extension = filename.rsplit('.', 1)[1].lower()
+        file_extension = file.filename.rsplit('.', 1)[1].lower()
         
         if file_extension == 'pdf':
-            resume_text = extract_text_from_pdf(file_path)
+            resume_text = extract_text_from_pdf(file.stream)
         elif file_extension == 'docx':
-            resume_text = extract_text_from_docx(file_path)
+            resume_text = extract_text_from_docx(file.stream)
         else:
             return jsonify({'error': 'Unsupported file type'}), 400
         
@@ -206,21 +571,47 @@ def analyze_resume_endpoint():
         improvements = generate_resume_improvements(analysis)
         analysis['improvements'] = improvements
         
-        # Clean up - delete the uploaded file
-        os.remove(file_path)
+        # Cache by content so the next upload of this file skips all of the above
+        resume_cache.set(digest, resume_text, analysis)
         
         # Return analysis results
-        return jsonify(analysis), 200
+        return jsonify(dict(analysis, cached=False)), 200
         
     except Exception as e:
-        # Clean up file if it exists
-        if 'file_path' in locals() and os.path.exists(file_path):
-            os.remove(file_path)
-        
         return jsonify({'error': str(e)}), 500
     
-# In-memory storage for job applications (in production, use a database)
-job_applications = []
+# Storage for job applications (SQLite by default, see create_application_store)
+application_store = create_application_store(
+    backend=app.config['APPLICATION_STORE'],
+    db_path=app.config['APPLICATION_DB_PATH']
+)
+# Running counters and follow-up index, kept in sync with the store's changes
+application_statistics = ApplicationStatistics(application_store)
+
+
+def log_due_reminders(reminders):
+    """Push newly due follow-up reminders to the server log"""
+    for reminder in reminders:
+        application = reminder['application']
+        app.logger.info('Follow-up due: %s - %s (%d days overdue)',
+                        application['company'], application['position'], reminder['days_overdue'])
+
+
+# Follow-up reminders, refreshed in the background as they fall due
+reminder_scheduler = ReminderScheduler(
+    application_statistics,
+    interval=app.config['REMINDER_CHECK_INTERVAL'],
+    on_due=log_due_reminders,
+    lock_path=app.config['REMINDER_LOCK_PATH']
+)
+
+
+@app.before_request
+def start_reminder_scheduler():
+    # Started on the first request (after any fork); of all the workers,
+    # only the one holding REMINDER_LOCK_PATH runs the background check
+    if app.config['REMINDER_CHECK_INTERVAL'] > 0:
+        reminder_scheduler.start()
 
 
 # API endpoint to add a new job application
@@ -245,7 +636,7 @@ def add_application():
         application = create_job_application(job_data)
         
         # Add to storage
-        job_applications.append(application)
+        application_store.add(application)
         
         return jsonify({
             'message': 'Application added successfully',
@@ -256,21 +647,91 @@ def add_application():
         return jsonify({'error': str(e)}), 500
 
 
-# API endpoint to get all applications
+# API endpoint to get applications (paginated, filtered or as a delta)
 @app.route('/api/get-applications', methods=['GET'])
 def get_applications():
     """
-    Get all job applications
+    Get job applications, newest first
+    
+    Query parameters:
+    status, company, date_from, date_to: Optional filters (dates as YYYY-MM-DD)
+    limit: Page size (up to MAX_APPLICATIONS_PAGE); omit to get every match
+    cursor: The 'next_cursor' of the previous page
+    since: A 'version' from an earlier response; returns only the
+           applications changed and the ids deleted (or no longer matching
+           the filters) after it. With limit, at most that many changes are
+           returned and 'has_more' says whether to ask again from 'version'
+    fields: Comma-separated application fields to return (e.g. id,company,status)
+    Responses carry an ETag, so an unchanged list costs one 304.
     """
     try:
-        # Sort by date (newest first)
-        sorted_apps = sorted(job_applications, key=lambda x: x['created_at'], reverse=True)
+        fields = parse_fields(request.args.get('fields'))
+        # The store version changes on every write, so it doubles as the ETag
+        version = application_store.current_version()
+        etag = f'applications-{version}'
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+        
+        limit = request.args.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1 or limit > MAX_APPLICATIONS_PAGE:
+                return jsonify({'error': f'limit must be between 1 and {MAX_APPLICATIONS_PAGE}'}), 400
+        
+        date_from = request.args.get('date_from')
+        date_to = request.args.get('date_to')
+        for name, value in (('date_from', date_from), ('date_to', date_to)):
+            if value:
+                try:
+                    datetime.strptime(value, '%Y-%m-%d')
+                except ValueError:
+                    return jsonify({'error': f'{name} must be a date in YYYY-MM-DD format'}), 400
+        
+        filters = {
+            'status': request.args.get('status'),
+            'company': request.args.get('company'),
+            'date_from': date_from,
+            'date_to': date_to
+        }
         
-        return jsonify({
-            'applications': sorted_apps,
-            'total': len(sorted_apps)
-        }), 200
+        since = request.args.get('since')
+        if since is not None:
+            # Delta mode: only what changed after the client's version
+            if not (since.isascii() and since.isdigit()):
+                return jsonify({'error': "since must be a 'version' number from an earlier response"}), 400
+            if request.args.get('cursor'):
+                return jsonify({'error': 'cursor cannot be combined with since'}), 400
+            changed, deleted, reached = application_store.changes_since(int(since), limit=limit, **filters)
+            response = json_collection_response(
+                'applications', select_fields(changed, fields),
+                deleted=deleted,
+                version=reached,
+                has_more=limit is not None and reached < application_store.current_version()
+            )
+            response.set_etag(etag, weak=True)
+            return response, 200
+        
+        applications, next_cursor, total = application_store.query_applications(
+            cursor=request.args.get('cursor'),
+            limit=limit,
+            **filters
+        )
+        
+        response = json_collection_response(
+            'applications', select_fields(applications, fields),
+            total=total,
+            next_cursor=next_cursor,
+            version=version
+        )
+        response.set_etag(etag, weak=True)
+        return response, 200
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -289,20 +750,12 @@ def update_status(application_id):
         if not new_status:
             return jsonify({'error': 'Status is required'}), 400
         
-        # Find the application
-        application = None
-        for app in job_applications:
-            if app['id'] == application_id:
-                application = app
-                break
+        # Read, update and save in one step, so concurrent updates aren't lost
+        updated_app = application_store.update_status(application_id, new_status)
         
-        if not application:
+        if not updated_app:
             return jsonify({'error': 'Application not found'}), 404
         
-        # Update status
-        from utils import update_application_status
-        updated_app = update_application_status(application, new_status)
-        
         return jsonify({
             'message': 'Status updated successfully',
             'application': updated_app
@@ -322,11 +775,7 @@ def delete_application(application_id):
     """
     try:
         # Find and remove the application
-        global job_applications
-        original_length = len(job_applications)
-        job_applications = [app for app in job_applications if app['id'] != application_id]
-        
-        if len(job_applications) == original_length:
+        if not application_store.delete(application_id):
             return jsonify({'error': 'Application not found'}), 404
         
         return jsonify({'message': 'Application deleted successfully'}), 200
@@ -342,13 +791,21 @@ def get_reminders():
     Get all pending follow-up reminders
     """
     try:
-        from utils import get_follow_up_reminders
-        reminders = get_follow_up_reminders(job_applications)
+        # Reminders change only with the date or the stored applications
+        today = datetime.now().strftime('%Y-%m-%d')
+        etag = f'reminders-{today}-{application_store.current_version()}'
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
-        return jsonify({
+        reminders = reminder_scheduler.get_reminders(today)
+        
+        response = jsonify({
             'reminders': reminders,
             'count': len(reminders)
-        }), 200
+        })
+        response.set_etag(etag, weak=True)
+        return response, 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -361,10 +818,17 @@ def get_statistics():
     Get statistics about job applications
     """
     try:
-        from utils import get_application_statistics
-        stats = get_application_statistics(job_applications)
+        today = datetime.now().strftime('%Y-%m-%d')
+        etag = f'statistics-{today}-{application_store.current_version()}'
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
-        return jsonify(stats), 200
+        stats = application_statistics.get_statistics(today)
+        
+        response = jsonify(stats)
+        response.set_etag(etag, weak=True)
+        return response, 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -378,11 +842,7 @@ def generate_email(application_id):
     """
     try:
         # Find the application
-        application = None
-        for app in job_applications:
-            if app['id'] == application_id:
-                application = app
-                break
+        application = application_store.get(application_id)
         
         if not application:
             return jsonify({'error': 'Application not found'}), 404
@@ -400,8 +860,14 @@ def generate_email(application_id):
         return jsonify({'error': str(e)}), 500
 
 
-# In-memory storage for interview sessions
-interview_sessions = {}
+# Storage for interview sessions, shared across workers (see create_session_store)
+session_store = create_session_store(
+    backend=app.config['SESSION_STORE'],
+    db_path=app.config['SESSION_DB_PATH'],
+    redis_url=app.config['REDIS_URL'],
+    max_entries=app.config['SESSION_MAX_ENTRIES'],
+    ttl_seconds=app.config['SESSION_TTL']
+)
 
 
 # API endpoint to start a new interview
@@ -409,24 +875,33 @@ interview_sessions = {}
 def start_interview():
     """
     Start a new mock interview session
-    Expects JSON with company and role
+    Expects JSON with company and role, and optionally difficulty,
+    competency and seed (to replay the same questions)
     """
     try:
         # Get company and role from request
         data = request.get_json()
         company = data.get('company', 'General')
         role = data.get('role', 'Software Engineer')
+        seed = data.get('seed')
         
         # Validate input
         if not company or not role:
             return jsonify({'error': 'Company and role are required'}), 400
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+            return jsonify({'error': 'seed must be an integer'}), 400
         
         # Create interview session
         from utils import create_interview_session
-        session = create_interview_session(company, role)
+        session = create_interview_session(
+            company, role,
+            difficulty=data.get('difficulty'),
+            competency=data.get('competency'),
+            seed=seed
+        )
         
         # Store session
-        interview_sessions[session['session_id']] = session
+        session_store.save(session)
         
         # Return first question
         return jsonify({
@@ -435,19 +910,145 @@ def start_interview():
             'role': session['role'],
             'total_questions': len(session['questions']),
             'current_question': session['questions'][0],
-            'question_number': 1
+            'question_number': 1,
+            'seed': session['question_seed']
         }), 201
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def build_answer_data(question, answer, ai_feedback, filler_analysis):
+    """
+    Combine the AI feedback and filler-word analysis for one answer
+    
+    Parameters:
+    question (str): The question that was answered
+    answer (str): User's answer
+    ai_feedback (dict): Result of analyze_interview_answer
+    filler_analysis (dict): Result of detect_filler_words
+    """
+    return {
+        'question': question,
+        'answer': answer,
+        'content_score': ai_feedback['content_score'],
+        'communication_score': ai_feedback['communication_score'],
+        'confidence_score': filler_analysis['confidence_score'],
+        'feedback': ai_feedback['raw_feedback'],
+        'filler_words': filler_analysis['filler_words'],
+        'total_fillers': filler_analysis['total_fillers'],
+        'hedges': filler_analysis['hedges'],
+        'total_hedges': filler_analysis['total_hedges'],
+        'repeated_words': filler_analysis['repeated_words'],
+        'words_per_sentence': filler_analysis['words_per_sentence']
+    }
+
+
+def record_answer(session, answer_data):
+    """
+    Store a graded answer in the session and build the submit-answer response
+    
+    Parameters:
+    session (dict): The interview session
+    answer_data (dict): Result of build_answer_data
+    """
+    # Store answer
+    session['answers'].append(answer_data)
+    
+    # Move to next question
+    session['current_question'] += 1
+    session_store.save(session)
+    
+    # Check if interview is complete
+    if session['current_question'] >= len(session['questions']):
+        # Interview complete
+        from utils import calculate_overall_score
+        final_scores = calculate_overall_score(session)
+        
+        return {
+            'status': 'complete',
+            'feedback': answer_data,
+            'final_scores': final_scores,
+            'total_answered': len(session['answers'])
+        }
+    
+    # More questions remaining
+    next_question = session['questions'][session['current_question']]
+    
+    return {
+        'status': 'continue',
+        'feedback': answer_data,
+        'next_question': next_question,
+        'question_number': session['current_question'] + 1,
+        'total_questions': len(session['questions'])
+    }
+
+
+# Cache of AI feedback, keyed on question + normalized answer
+feedback_cache = FeedbackCache(
+    max_entries=app.config['FEEDBACK_CACHE_MAX_ENTRIES'],
+    ttl_seconds=app.config['FEEDBACK_CACHE_TTL'],
+    near_duplicates=app.config['FEEDBACK_CACHE_NEAR_DUPLICATES']
+)
+
+
+# Bounds concurrent LLM calls and shares identical in-flight prompts
+llm_limiter = LLMRequestLimiter(
+    max_concurrent=app.config['LLM_MAX_CONCURRENT'],
+    rate_per_second=app.config['LLM_RATE_LIMIT'],
+    max_queue=app.config['LLM_MAX_QUEUE'],
+    queue_timeout=app.config['LLM_QUEUE_TIMEOUT']
+)
+
+
+def grade_answers(pairs, priority=PRIORITY_NEW):
+    """
+    Grade several (question, answer) pairs with parallel AI calls
+    Returns one build_answer_data result per pair, in order; raises
+    FeedbackUnavailableError if any AI call failed
+    
+    Parameters:
+    pairs (list): (question, answer) tuples
+    priority (int): Queue priority for the AI calls
+    """
+    from utils import analyze_interview_answer, detect_filler_words
+    
+    def grade(pair):
+        question, answer = pair
+        ai_feedback = feedback_cache.get(question, answer)
+        if ai_feedback is None:
+            ai_feedback = llm_limiter.run(
+                get_prompt_key(question, answer),
+                lambda: analyze_interview_answer(question, answer),
+                priority=priority
+            )
+            if 'error' in ai_feedback:
+                raise FeedbackUnavailableError(ai_feedback['error'])
+            feedback_cache.set(question, answer, ai_feedback)
+        return build_answer_data(question, answer, ai_feedback, detect_filler_words(answer))
+    
+    # All answers are in flight at once; the limiter still caps the total
+    with ThreadPoolExecutor(max_workers=min(len(pairs), app.config['LLM_MAX_CONCURRENT'])) as executor:
+        return list(executor.map(grade, pairs))
+
+
+def sse_event(event, data):
+    """Format one Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {app.json.dumps(data)}\n\n"
+
+
 # API endpoint to submit an answer
 @app.route('/api/submit-answer', methods=['POST'])
 def submit_answer():
     """
     Submit an answer and get AI feedback
     Expects JSON with session_id and answer
+    With ?stream=1 the feedback is sent as Server-Sent Events: 'filler'
+    (local filler-word analysis, sent first), 'token' (feedback text as it
+    is generated), 'score' (each score once it is known) and 'done' (the
+    same payload as the regular JSON response)
     """
     try:
         # Get data from request
@@ -456,63 +1057,245 @@ def submit_answer():
         answer = data.get('answer', '').strip()
         
         # Validate input
-        if not session_id or session_id not in interview_sessions:
+        session = session_store.get(session_id) if session_id else None
+        if session is None:
             return jsonify({'error': 'Invalid session ID'}), 400
         
         if not answer or len(answer) < 10:
             return jsonify({'error': 'Please provide a meaningful answer (at least 10 characters)'}), 400
         
-        # Get session
-        session = interview_sessions[session_id]
+        # Get current question
         current_q_index = session['current_question']
         question = session['questions'][current_q_index]
         
-        # Analyze answer with AI
-        from utils import analyze_interview_answer, detect_filler_words
-        ai_feedback = analyze_interview_answer(question, answer)
+        from utils import analyze_interview_answer, detect_filler_words, stream_interview_answer
         filler_analysis = detect_filler_words(answer)
         
-        # Combine feedback
-        answer_data = {
-            'question': question,
-            'answer': answer,
-            'content_score': ai_feedback['content_score'],
-            'communication_score': ai_feedback['communication_score'],
-            'confidence_score': filler_analysis['confidence_score'],
-            'feedback': ai_feedback['raw_feedback'],
-            'filler_words': filler_analysis['filler_words'],
-            'total_fillers': filler_analysis['total_fillers']
-        }
-        
-        # Store answer
-        session['answers'].append(answer_data)
+        # Same (or nearly the same) answer to this question seen before?
+        cached_feedback = feedback_cache.get(question, answer)
+        
+        # Sessions already under way are served before new ones when busy
+        priority = PRIORITY_IN_PROGRESS if session['answers'] else PRIORITY_NEW
+        
+        if request.args.get('stream') == '1':
+            def generate():
+                # Local analysis is instant, so it goes out before the AI call
+                yield sse_event('filler', filler_analysis)
+                try:
+                    if cached_feedback is not None:
+                        yield sse_event('token', {'text': cached_feedback['raw_feedback']})
+                        result = record_answer(session, build_answer_data(question, answer, cached_feedback, filler_analysis))
+                        yield sse_event('done', dict(result, cached=True))
+                        return
+                    
+                    with llm_limiter.slot(priority):
+                        for event, payload in stream_interview_answer(question, answer):
+                            if event == 'token':
+                                yield sse_event('token', {'text': payload})
+                            elif event == 'score':
+                                yield sse_event('score', payload)
+                            elif 'error' in payload:
+                                # Not recorded, so the answer can be submitted again
+                                yield sse_event('error', {'error': f"AI feedback unavailable: {payload['error']}"})
+                            else:
+                                feedback_cache.set(question, answer, payload)
+                                result = record_answer(session, build_answer_data(question, answer, payload, filler_analysis))
+                                yield sse_event('done', dict(result, cached=False))
+                except Exception as e:
+                    yield sse_event('error', {'error': str(e)})
+            
+            return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'  # Don't let nginx buffer the stream
+            })
+        
+        if cached_feedback is not None:
+            result = record_answer(session, build_answer_data(question, answer, cached_feedback, filler_analysis))
+            return jsonify(dict(result, cached=True)), 200
+        
+        # Analyze answer with AI (queued if too many calls are in flight)
+        ai_feedback = llm_limiter.run(
+            get_prompt_key(question, answer),
+            lambda: analyze_interview_answer(question, answer),
+            priority=priority
+        )
+        if 'error' in ai_feedback:
+            # Not recorded, so the answer can be submitted again
+            raise FeedbackUnavailableError(ai_feedback['error'])
+        feedback_cache.set(question, answer, ai_feedback)
+        
+        result = record_answer(session, build_answer_data(question, answer, ai_feedback, filler_analysis))
+        return jsonify(dict(result, cached=False)), 200
+        
+    except LLMQueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    except FeedbackUnavailableError as e:
+        return jsonify({'error': f'AI feedback unavailable: {e}'}), 503
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# API endpoint to submit several answers of an interview at once
+@app.route('/api/submit-all-answers', methods=['POST'])
+def submit_all_answers():
+    """
+    Grade the remaining answers of an interview session in one request
+    Expects JSON with session_id and 'answers' (in question order,
+    starting at the current question)
+    """
+    try:
+        # Get data from request
+        data = request.get_json()
+        session_id = data.get('session_id')
+        answers = data.get('answers', [])
         
-        # Move to next question
-        session['current_question'] += 1
+        # Validate input
+        session = session_store.get(session_id) if session_id else None
+        if session is None:
+            return jsonify({'error': 'Invalid session ID'}), 400
         
-        # Check if interview is complete
-        if session['current_question'] >= len(session['questions']):
-            # Interview complete
+        if not isinstance(answers, list) or not all(isinstance(answer, str) for answer in answers):
+            return jsonify({'error': "'answers' must be a list of answer texts"}), 400
+        answers = [answer.strip() for answer in answers]
+        remaining = session['questions'][session['current_question']:]
+        
+        if not answers:
+            return jsonify({'error': 'Please provide at least one answer'}), 400
+        if len(answers) > len(remaining):
+            return jsonify({'error': f'Only {len(remaining)} questions remain in this interview'}), 400
+        if any(len(answer) < 10 for answer in answers):
+            return jsonify({'error': 'Please provide a meaningful answer (at least 10 characters) for every question'}), 400
+        
+        # Grade everything in parallel, then record in question order
+        priority = PRIORITY_IN_PROGRESS if session['answers'] else PRIORITY_NEW
+        results = grade_answers(list(zip(remaining, answers)), priority=priority)
+        for answer_data in results:
+            response = record_answer(session, answer_data)
+        
+        response.pop('feedback')
+        response['results'] = results
+        if response['status'] != 'complete':
+            # record_answer only adds final_scores once every question is answered
             from utils import calculate_overall_score
-            final_scores = calculate_overall_score(session)
-            
-            return jsonify({
-                'status': 'complete',
-                'feedback': answer_data,
-                'final_scores': final_scores,
-                'total_answered': len(session['answers'])
-            }), 200
-        else:
-            # More questions remaining
-            next_question = session['questions'][session['current_question']]
-            
-            return jsonify({
-                'status': 'continue',
-                'feedback': answer_data,
-                'next_question': next_question,
-                'question_number': session['current_question'] + 1,
-                'total_questions': len(session['questions'])
-            }), 200
+            response['scores_so_far'] = calculate_overall_score(session)
+        
+        return jsonify(response), 200
+        
+    except LLMQueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    except FeedbackUnavailableError as e:
+        return jsonify({'error': f'AI feedback unavailable: {e}'}), 503
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# API endpoint to grade answers outside of an interview session
+@app.route('/api/grade-answers', methods=['POST'])
+def grade_answers_endpoint():
+    """
+    Grade a list of question/answer pairs (e.g. collected at a practice event)
+    Expects JSON with 'answers': [{'question': ..., 'answer': ...}, ...]
+    """
+    try:
+        # Get data from request
+        data = request.get_json()
+        items = data.get('answers', [])
+        
+        # Validate input
+        if not isinstance(items, list):
+            return jsonify({'error': "'answers' must be a list of {'question', 'answer'} objects"}), 400
+        if not items:
+            return jsonify({'error': 'Please provide at least one answer'}), 400
+        if len(items) > MAX_BATCH_ANSWERS:
+            return jsonify({'error': f'Too many answers (max {MAX_BATCH_ANSWERS} per request)'}), 400
+        
+        pairs = []
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                return jsonify({'error': f"Answer {i + 1} must be an object with 'question' and 'answer'"}), 400
+            question = str(item.get('question', '')).strip()
+            answer = str(item.get('answer', '')).strip()
+            if not question or len(answer) < 10:
+                return jsonify({'error': f'Answer {i + 1} needs a question and an answer of at least 10 characters'}), 400
+            pairs.append((question, answer))
+        
+        results = grade_answers(pairs)
+        
+        from utils import calculate_overall_score
+        return jsonify({
+            'results': results,
+            'overall_scores': calculate_overall_score({'answers': results}),
+            'total_graded': len(results)
+        }), 200
+        
+    except LLMQueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    except FeedbackUnavailableError as e:
+        return jsonify({'error': f'AI feedback unavailable: {e}'}), 503
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# API endpoint to analyze the speech quality of many answers
+@app.route('/api/analyze-speech', methods=['POST'])
+def analyze_speech_endpoint():
+    """
+    Measure fillers, hedging, repetition and sentence length for a batch of
+    answers (no AI calls)
+    Expects JSON with 'answers': a list of answer texts
+    """
+    try:
+        data = request.get_json()
+        answers = data.get('answers', [])
+        
+        if not isinstance(answers, list) or not answers:
+            return jsonify({'error': 'Please provide a list of answers'}), 400
+        if len(answers) > MAX_SPEECH_BATCH:
+            return jsonify({'error': f'At most {MAX_SPEECH_BATCH} answers per request'}), 400
+        
+        from utils import analyze_speech_batch
+        # Worker processes cost more than they save for a single request
+        results, summary = analyze_speech_batch(answers, workers=1)
+        
+        return jsonify({
+            'results': results,
+            'summary': summary
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# API endpoint to report cache metrics
+@app.route('/api/cache-stats', methods=['GET'])
+def cache_stats():
+    """
+    Get hit/miss metrics for the resume analysis and interview feedback
+    caches, and the size of the interview session store
+    """
+    try:
+        return jsonify({
+            'resume_cache': resume_cache.memory.stats(),
+            'feedback_cache': feedback_cache.stats(),
+            'session_store': session_store.stats()
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# API endpoint to report LLM queue and backend metrics
+@app.route('/api/llm-stats', methods=['GET'])
+def llm_stats():
+    """
+    Get queue depth, wait times and backend latency for AI feedback calls
+    """
+    try:
+        from utils import get_feedback_backend
+        return jsonify({
+            'limiter': llm_limiter.stats(),
+            'backend': get_feedback_backend().stats()
+        }), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -523,27 +1306,147 @@ def submit_answer():
 def get_interview_results(session_id):
     """
     Get complete interview results
+    ?fields= selects parts of the response, e.g. scores,answers.content_score
     """
     try:
         # Validate session
-        if session_id not in interview_sessions:
+        session = session_store.get(session_id)
+        if session is None:
             return jsonify({'error': 'Session not found'}), 404
         
-        session = interview_sessions[session_id]
-        
         # Calculate scores
         from utils import calculate_overall_score
         scores = calculate_overall_score(session)
         
-        # Return complete results
-        return jsonify({
+        # Return complete results (or the selected fields)
+        return jsonify(select_fields({
             'session': session,
             'scores': scores,
             'answers': session['answers']
-        }), 200
+        }, parse_fields(request.args.get('fields')))), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500     
+
+
+# CLI command to score a whole directory of resumes
+@app.cli.command('score-resumes')
+@click.argument('input_dir', type=click.Path(exists=True, file_okay=False))
+@click.option('--output', '-o', default='resume_scores.jsonl', show_default=True,
+              help='JSONL file to append results to (re-running resumes from it)')
+@click.option('--workers', '-w', type=int, default=None, help='Worker processes (default: CPU count)')
+@click.option('--timings', is_flag=True, help='Record per-rule scoring times and print the totals per rule')
+def score_resumes_command(input_dir, output, workers, timings):
+    """
+    Score every PDF/DOCX resume under INPUT_DIR
+    Example: flask score-resumes data/cohort --output cohort.jsonl --timings
+    """
+    from utils import score_resume_directory
+    
+    def report(done, total, record):
+        # Progress goes to stderr so stdout stays clean
+        status = record['status']
+        detail = record['analysis']['total_score'] if status == 'ok' else record['error']
+        click.echo(f"[{done}/{total}] {record['file']}: {status} ({detail})", err=True)
+    
+    summary = score_resume_directory(input_dir, output, workers=workers, progress=report, collect_timings=timings)
+    click.echo(
+        f"Scored {summary['ok']} resumes, {summary['error']} failed, "
+        f"{summary['skipped']} already done (of {summary['total']}). Results: {output}"
+    )
+    
+    if timings and summary['ok']:
+        # Slowest rules first, with the average per scored resume
+        click.echo('Rule timings (ms): total / per resume')
+        for rule, total_ms in sorted(summary['timings'].items(), key=lambda item: item[1], reverse=True):
+            click.echo(f"  {rule:<14} {total_ms:10.3f} / {total_ms / summary['ok']:.4f}")
+
+
+# CLI command to analyze stored interview answers offline
+@app.cli.command('speech-stats')
+@click.argument('input_file', type=click.File('r', encoding='utf-8'))
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default=None,
+              help='JSONL file for the per-answer metrics')
+@click.option('--workers', '-w', type=int, default=None, help='Worker processes (default: CPU count)')
+def speech_stats_command(input_file, output, workers):
+    """
+    Summarize fillers, hedging and repetition over a JSONL file of answers
+    Each line is an object with an 'answer' field, or an interview
+    session with an 'answers' list (as stored by the session store)
+    Example: flask speech-stats answers.jsonl --output speech.jsonl
+    """
+    from utils import analyze_speech_batch
+    
+    answers = []
+    for line in input_file:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if 'answers' in record:
+            answers.extend(answer['answer'] for answer in record['answers'])
+        else:
+            answers.append(record['answer'])
+    
+    results, summary = analyze_speech_batch(answers, workers=workers)
+    if output:
+        for result in results:
+            output.write(json.dumps(result) + '\n')
+    click.echo(json.dumps(summary, indent=2))
+
+
+# CLI command to write compressed copies of the static files
+@app.cli.command('compress-static')
+def compress_static_command():
+    """
+    Write .gz (and .br, with brotli installed) next to each static file,
+    so workers serve them without compressing at startup
+    Example: flask compress-static
+    """
+    written = static_assets.write_precompressed()
+    for path in written:
+        click.echo(f"{path}: {os.path.getsize(path)} bytes")
+    click.echo(f"Wrote {len(written)} files")
+
+
+@app.cli.command('bench-feedback')
+@click.option('--requests', '-n', 'total', type=int, default=200, show_default=True, help='Answers to grade')
+@click.option('--concurrency', '-c', type=int, default=16, show_default=True, help='Requests in flight at once')
+@click.option('--backend', '-b', default=None, help='LLM backend(s), e.g. mock or groq,openai (default: LLM_BACKEND)')
+def bench_feedback_command(total, concurrency, backend):
+    """
+    Measure interview feedback throughput and tail latency
+    Example: LLM_BACKEND=mock flask bench-feedback -n 500 -c 32
+    """
+    from utils import analyze_interview_answer, create_feedback_backend, get_feedback_backend, get_question_bank
+    
+    feedback_backend = create_feedback_backend(backend) if backend else get_feedback_backend()
+    questions = [question['text'] for question in get_question_bank().questions]
+    
+    def grade(i):
+        question = questions[i % len(questions)]
+        answer = f"Answer {i}: the situation was a deadline at work, so I planned the task, took action and delivered {i % 50}% faster."
+        started = time.perf_counter()
+        feedback = analyze_interview_answer(question, answer, backend=feedback_backend)
+        return time.perf_counter() - started, 'error' in feedback
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(grade, range(total)))
+    elapsed = time.perf_counter() - started
+    
+    latencies = sorted(latency for latency, _ in results)
+    errors = sum(1 for _, failed in results if failed)
+    
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+    
+    click.echo(f"Backend: {feedback_backend.name}  requests: {total}  concurrency: {concurrency}  errors: {errors}")
+    click.echo(f"Throughput: {total / elapsed:.1f} req/s over {elapsed:.2f}s")
+    click.echo(f"Latency ms: p50 {percentile(50):.0f}  p95 {percentile(95):.0f}  p99 {percentile(99):.0f}  max {latencies[-1] * 1000:.0f}")
+    for stats in feedback_backend.stats().get('backends', []):
+        click.echo(f"  {stats['name']}: {stats['requests']} requests, {stats['failures']} failed, avg {stats['latency_ms']} ms")
+
+
 if __name__ == '__main__':
     # Run the Flask app in debug mode
     app.run(debug=True, port=5000)
\ No newline at end of file
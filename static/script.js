@@ -516,22 +516,74 @@ async function addJobApplication() {
     }
 }
 
+// Applications already on the page, kept in sync with the server via
+// /api/get-applications?since=<version> instead of re-fetching the whole list
+const APPLICATIONS_PAGE_SIZE = 50;
+const applicationsState = {
+    byId: new Map(),
+    version: null,
+    nextCursor: null
+};
+
 async function loadApplications() {
     try {
-        const response = await fetch('/api/get-applications');
-        if (!response.ok) throw new Error('Failed to load applications');
-        const result = await response.json();
-        displayApplications(result.applications);
+        if (applicationsState.version === null) {
+            await loadApplicationsPage();
+        } else {
+            await syncApplications();
+        }
+        displayApplications(sortedApplications());
     } catch (error) {
         console.error('Error loading applications:', error);
     }
 }
 
+async function loadApplicationsPage(cursor) {
+    let url = `/api/get-applications?limit=${APPLICATIONS_PAGE_SIZE}`;
+    if (cursor) url += `&cursor=${encodeURIComponent(cursor)}`;
+    
+    const response = await fetch(url);
+    if (!response.ok) throw new Error('Failed to load applications');
+    const result = await response.json();
+    
+    result.applications.forEach(app => applicationsState.byId.set(app.id, app));
+    applicationsState.nextCursor = result.next_cursor;
+    if (applicationsState.version === null) applicationsState.version = result.version;
+}
+
+async function loadMoreApplications() {
+    try {
+        await loadApplicationsPage(applicationsState.nextCursor);
+        displayApplications(sortedApplications());
+    } catch (error) {
+        console.error('Error loading applications:', error);
+    }
+}
+
+async function syncApplications() {
+    const response = await fetch(`/api/get-applications?since=${applicationsState.version}`);
+    if (!response.ok) throw new Error('Failed to load applications');
+    const result = await response.json();
+    
+    const cursor = applicationsState.nextCursor;
+    result.applications.forEach(app => {
+        // Rows older than the loaded pages arrive with "Load more"
+        if (!cursor || app.id > cursor) applicationsState.byId.set(app.id, app);
+    });
+    result.deleted.forEach(id => applicationsState.byId.delete(id));
+    applicationsState.version = result.version;
+}
+
+function sortedApplications() {
+    // IDs sort by creation time, so this is newest first
+    return Array.from(applicationsState.byId.values()).sort((a, b) => (a.id < b.id ? 1 : -1));
+}
+
 function displayApplications(applications) {
     const container = document.getElementById('applicationsContainer');
     if (!container) return;
     
-    if (applications.length === 0) {
+    if (applications.length === 0 && !applicationsState.nextCursor) {
         container.innerHTML = '<p class="empty-state">No applications yet. Add your first application to start tracking!</p>';
         return;
     }
@@ -541,6 +593,14 @@ function displayApplications(applications) {
         const card = createApplicationCard(app);
         container.appendChild(card);
     });
+    
+    if (applicationsState.nextCursor) {
+        const loadMore = document.createElement('button');
+        loadMore.className = 'action-btn action-btn-primary';
+        loadMore.textContent = 'Load more';
+        loadMore.onclick = loadMoreApplications;
+        container.appendChild(loadMore);
+    }
 }
 
 function createApplicationCard(app) {
@@ -648,11 +708,27 @@ async function loadStatistics() {
     }
 }
 
+// Both the notification bar and the reminders modal use one fetch:
+// the result is shared until an application changes (checkReminders)
+let remindersRequest = null;
+
+function fetchReminders() {
+    if (!remindersRequest) {
+        const request = fetch('/api/get-reminders').then(response => {
+            if (!response.ok) throw new Error('Failed to load reminders');
+            return response.json();
+        });
+        // Let the next call retry after a failure
+        request.catch(() => { if (remindersRequest === request) remindersRequest = null; });
+        remindersRequest = request;
+    }
+    return remindersRequest;
+}
+
 async function checkReminders() {
     try {
-        const response = await fetch('/api/get-reminders');
-        if (!response.ok) throw new Error('Failed to load reminders');
-        const result = await response.json();
+        remindersRequest = null;
+        const result = await fetchReminders();
         
         const notificationsBar = document.getElementById('notificationsBar');
         const notificationCount = document.getElementById('notificationCount');
@@ -672,9 +748,7 @@ async function checkReminders() {
 
 async function showReminders() {
     try {
-        const response = await fetch('/api/get-reminders');
-        if (!response.ok) throw new Error('Failed to load reminders');
-        const result = await response.json();
+        const result = await fetchReminders();
         
         const remindersList = document.getElementById('remindersList');
         remindersList.innerHTML = '';
@@ -805,7 +879,8 @@ async function submitAnswer() {
         button.innerHTML = '<span class="loading"></span> Analyzing...';
         button.disabled = true;
         
-        const response = await fetch('/api/submit-answer', {
+        // Streamed: feedback appears as it is generated instead of all at once
+        const response = await fetch('/api/submit-answer?stream=1', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ session_id: currentSessionId, answer: answer })
@@ -816,12 +891,10 @@ async function submitAnswer() {
             throw new Error(error.error || 'Failed to submit answer');
         }
         
-        const result = await response.json();
+        const result = await readFeedbackStream(response);
         currentFeedback = result;
         displayFeedback(result.feedback);
-        
-        document.getElementById('interviewInProgress').style.display = 'none';
-        document.getElementById('feedbackSection').style.display = 'block';
+        showFeedbackSection();
         
         if (result.status === 'complete') {
             document.getElementById('nextQuestionBtn').textContent = 'View Final Results';
@@ -830,9 +903,9 @@ async function submitAnswer() {
             };
         }
         
-        document.getElementById('feedbackSection').scrollIntoView({ behavior: 'smooth' });
-        
     } catch (error) {
+        document.getElementById('feedbackSection').style.display = 'none';
+        document.getElementById('interviewInProgress').style.display = 'block';
         alert('Error submitting answer: ' + error.message);
     } finally {
         button.textContent = 'Submit Answer';
@@ -840,6 +913,69 @@ async function submitAnswer() {
     }
 }
 
+// Reads the Server-Sent Events sent by /api/submit-answer?stream=1 and
+// shows the feedback as it arrives; resolves with the final ('done') result
+async function readFeedbackStream(response) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const feedbackText = document.getElementById('aiFeedbackText');
+    let buffer = '';
+    let result = null;
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const message = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            const eventMatch = message.match(/^event: (.*)$/m);
+            const dataMatch = message.match(/^data: (.*)$/m);
+            if (!eventMatch || !dataMatch) continue;
+            const data = JSON.parse(dataMatch[1]);
+            
+            if (eventMatch[1] === 'filler') {
+                // The filler-word analysis is local, so it arrives first
+                displayFeedback({
+                    content_score: '…',
+                    communication_score: '…',
+                    confidence_score: data.confidence_score,
+                    feedback: '',
+                    filler_words: data.filler_words,
+                    total_fillers: data.total_fillers
+                });
+                showFeedbackSection();
+            } else if (eventMatch[1] === 'token') {
+                feedbackText.textContent += data.text;
+            } else if (eventMatch[1] === 'score') {
+                if (data.content_score !== undefined) {
+                    document.getElementById('contentScore').textContent = data.content_score + '/10';
+                }
+                if (data.communication_score !== undefined) {
+                    document.getElementById('communicationScore').textContent = data.communication_score + '/10';
+                }
+            } else if (eventMatch[1] === 'done') {
+                result = data;
+            } else if (eventMatch[1] === 'error') {
+                throw new Error(data.error);
+            }
+        }
+    }
+    
+    if (!result) throw new Error('Feedback stream ended early');
+    return result;
+}
+
+function showFeedbackSection() {
+    if (document.getElementById('feedbackSection').style.display === 'block') return;
+    document.getElementById('interviewInProgress').style.display = 'none';
+    document.getElementById('feedbackSection').style.display = 'block';
+    document.getElementById('feedbackSection').scrollIntoView({ behavior: 'smooth' });
+}
+
 function displayFeedback(feedback) {
     document.getElementById('contentScore').textContent = feedback.content_score + '/10';
     document.getElementById('communicationScore').textContent = feedback.communication_score + '/10';
@@ -879,7 +1015,9 @@ function nextQuestion() {
 
 async function showFinalResults(scores) {
     try {
-        const response = await fetch(`/api/interview-results/${currentSessionId}`);
+        // Only what the summary shows, not the whole session with every AI feedback text
+        const fields = 'scores,answers.question,answers.content_score,answers.communication_score,answers.confidence_score';
+        const response = await fetch(`/api/interview-results/${currentSessionId}?fields=${fields}`);
         
         if (!response.ok) {
             throw new Error('Failed to load results');
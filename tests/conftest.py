@@ -0,0 +1,47 @@
+# Shared fixtures for the CareerBot tests
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py builds its stores at import time, so point them at a throwaway
+# directory (and turn off background work and the real LLM) first
+TEST_DATA_DIR = tempfile.mkdtemp(prefix='careerbot-tests-')
+os.environ.update({
+    'APPLICATION_DB_PATH': os.path.join(TEST_DATA_DIR, 'careerbot.db'),
+    'SESSION_DB_PATH': os.path.join(TEST_DATA_DIR, 'careerbot.db'),
+    'JOB_DB_PATH': os.path.join(TEST_DATA_DIR, 'careerbot.db'),
+    'REMINDER_LOCK_PATH': os.path.join(TEST_DATA_DIR, 'reminder_scheduler.lock'),
+    'REMINDER_CHECK_INTERVAL': '0',
+    'LLM_BACKEND': 'mock',
+    'MOCK_LLM_LATENCY': '0',
+    'MOCK_LLM_JITTER': '0',
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as careerbot_app  # noqa: E402
+from utils import create_application_store, create_job_application  # noqa: E402
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def application_store(request, tmp_path):
+    """A fresh, empty application store of each backend"""
+    return create_application_store(request.param, db_path=str(tmp_path / 'careerbot.db'))
+
+
+@pytest.fixture
+def make_application():
+    """Build an application the way /api/add-application does"""
+    def make(company='Acme', position='Engineer', **fields):
+        return create_job_application(dict(fields, company=company, position=position))
+    return make
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    """Flask test client whose endpoints use a fresh SQLite application store"""
+    store = create_application_store('sqlite', db_path=str(tmp_path / 'careerbot.db'))
+    monkeypatch.setattr(careerbot_app, 'application_store', store)
+    careerbot_app.app.config['TESTING'] = True
+    return careerbot_app.app.test_client()
@@ -0,0 +1,171 @@
+# Tests for the job application stores (memory and SQLite backends)
+import multiprocessing
+import threading
+
+from utils import ApplicationStatistics, create_application_store, create_job_application
+
+
+def add_applications(store, make_application, count, **fields):
+    """Add count applications and return them, oldest first"""
+    applications = [make_application(company=f'Company {i}', **fields) for i in range(count)]
+    for application in applications:
+        store.add(application)
+    return applications
+
+
+def test_since_returns_only_changes(application_store, make_application):
+    first, second, third = add_applications(application_store, make_application, 3)
+    version = application_store.current_version()
+    
+    # Nothing changed yet
+    changed, deleted, reached = application_store.changes_since(version)
+    assert changed == [] and deleted == [] and reached == version
+    
+    new = make_application(company='Newco')
+    application_store.add(new)
+    application_store.update_status(first['id'], 'Viewed')
+    application_store.delete(second['id'])
+    
+    changed, deleted, reached = application_store.changes_since(version)
+    assert [app['id'] for app in changed] == [new['id'], first['id']]  # newest first
+    assert changed[1]['status'] == 'Viewed'
+    assert deleted == [second['id']]
+    assert reached == application_store.current_version() == version + 3
+    assert third['id'] not in [app['id'] for app in changed]
+
+
+def test_since_applies_filters_and_limit(application_store, make_application):
+    first, second = add_applications(application_store, make_application, 2, status='Applied')
+    version = application_store.current_version()
+    application_store.update_status(first['id'], 'Rejected')
+    application_store.update_status(second['id'], 'Viewed')
+    
+    # Rows that left the filtered view are reported as deleted from it
+    changed, deleted, _ = application_store.changes_since(version, status='Viewed')
+    assert [app['id'] for app in changed] == [second['id']]
+    assert deleted == [first['id']]
+    
+    # A limit returns the oldest changes first and says where to continue
+    changed, deleted, reached = application_store.changes_since(version, limit=1)
+    assert [app['id'] for app in changed] == [first['id']] and deleted == []
+    assert reached == version + 1
+    changed, deleted, reached = application_store.changes_since(reached, limit=1)
+    assert [app['id'] for app in changed] == [second['id']]
+    assert reached == application_store.current_version()
+
+
+def test_cursor_pages_neither_overlap_nor_skip(application_store, make_application):
+    applications = add_applications(application_store, make_application, 23)
+    
+    seen = []
+    cursor = None
+    while True:
+        page, cursor, total = application_store.query_applications(cursor=cursor, limit=5)
+        assert total == 23
+        assert len(page) <= 5
+        seen.extend(app['id'] for app in page)
+        if cursor is None:
+            break
+    
+    assert len(seen) == len(set(seen)) == 23
+    assert seen == sorted((app['id'] for app in applications), reverse=True)
+
+
+def test_cursor_pages_with_filters(application_store, make_application):
+    add_applications(application_store, make_application, 7, status='Applied')
+    offers = add_applications(application_store, make_application, 6, status='Offer')
+    
+    seen = []
+    cursor = None
+    while True:
+        page, cursor, total = application_store.query_applications(status='Offer', cursor=cursor, limit=4)
+        assert total == 6
+        seen.extend(app['id'] for app in page)
+        if cursor is None:
+            break
+    
+    assert seen == sorted((app['id'] for app in offers), reverse=True)
+
+
+def test_get_applications_since_endpoint(client):
+    for company in ('Acme', 'Beta'):
+        client.post('/api/add-application', json={'company': company, 'position': 'Engineer'})
+    version = client.get('/api/get-applications').get_json()['version']
+    
+    added = client.post('/api/add-application', json={'company': 'Gamma', 'position': 'Engineer'})
+    result = client.get(f'/api/get-applications?since={version}').get_json()
+    assert [app['id'] for app in result['applications']] == [added.get_json()['application']['id']]
+    assert result['deleted'] == []
+    assert result['version'] == version + 1
+    
+    response = client.get('/api/get-applications?since=abc')
+    assert response.status_code == 400
+
+
+def test_get_applications_total_counts_every_match(client):
+    for i in range(5):
+        client.post('/api/add-application', json={'company': 'Acme', 'position': f'Engineer {i}'})
+    
+    result = client.get('/api/get-applications?limit=2').get_json()
+    assert len(result['applications']) == 2
+    assert result['total'] == 5
+    assert result['next_cursor']
+
+
+def _add_from_process(db_path, count, application_id, statuses):
+    """Worker process: add applications and update one shared application"""
+    store = create_application_store('sqlite', db_path=db_path)
+    for i in range(count):
+        store.add(create_job_application({'company': f'Company {i}', 'position': 'Engineer'}))
+        store.update_status(application_id, statuses[i % len(statuses)])
+
+
+def test_concurrent_processes_do_not_interfere(tmp_path, make_application):
+    db_path = str(tmp_path / 'careerbot.db')
+    store = create_application_store('sqlite', db_path=db_path)
+    shared = make_application(company='Shared')
+    store.add(shared)
+    start_version = store.current_version()
+    
+    context = multiprocessing.get_context('fork')
+    workers = [
+        context.Process(target=_add_from_process, args=(db_path, 25, shared['id'], statuses))
+        for statuses in (['Viewed'], ['Interviewed'], ['Offer'], ['Rejected'])
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+    
+    # Every insert and every status update got its own version
+    assert store.count() == 1 + 4 * 25
+    assert store.current_version() == start_version + 4 * 25 * 2
+    ids = [app['id'] for app in store.list_applications()]
+    assert len(ids) == len(set(ids))
+    
+    changed, deleted, _ = store.changes_since(start_version)
+    assert len(changed) == 4 * 25 + 1 and deleted == []
+    assert store.get(shared['id'])['status'] in ('Viewed', 'Interviewed', 'Offer', 'Rejected')
+
+
+def test_concurrent_threads_keep_statistics_exact(application_store, make_application):
+    statistics = ApplicationStatistics(application_store)
+    applications = add_applications(application_store, make_application, 40)
+    statistics.sync()
+    
+    def update(offset):
+        for application in applications[offset::4]:
+            application_store.update_status(application['id'], 'Interview Scheduled')
+            statistics.sync()
+    
+    threads = [threading.Thread(target=update, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    result = statistics.get_statistics()
+    assert result['total_applications'] == 40
+    assert result['status_breakdown'] == {'Interview Scheduled': 40}
+    assert result['interviews'] == 40
@@ -0,0 +1,83 @@
+# Tests for ETag revalidation and response compression
+import gzip
+import json
+
+import app as careerbot_app
+
+
+def add_applications(client, count):
+    for i in range(count):
+        client.post('/api/add-application', json={
+            'company': f'Company {i}',
+            'position': 'Software Engineer',
+            'notes': 'Referred by a former colleague; follow up after the onsite.'
+        })
+
+
+def test_repeated_request_gets_304(client):
+    add_applications(client, 3)
+    
+    first = client.get('/api/get-applications')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    
+    repeat = client.get('/api/get-applications', headers={'If-None-Match': etag})
+    assert repeat.status_code == 304
+    assert repeat.get_data() == b''
+    assert repeat.headers['ETag'] == etag
+    
+    # Any write changes the tag, so the next read gets the new data
+    add_applications(client, 1)
+    changed = client.get('/api/get-applications', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert len(changed.get_json()['applications']) == 4
+
+
+def test_repeated_request_gets_304_for_body_tagged_json(client):
+    # Endpoints without their own ETag are tagged from the response body
+    added = client.post('/api/add-application', json={'company': 'Acme', 'position': 'Engineer'})
+    url = f"/api/generate-email/{added.get_json()['application']['id']}"
+    
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+    assert client.get(url, headers={'If-None-Match': 'W/"stale"'}).status_code == 200
+
+
+def test_gzip_output_matches_plain_output(client):
+    add_applications(client, 20)
+    
+    plain = client.get('/api/get-applications')
+    compressed = client.get('/api/get-applications', headers={'Accept-Encoding': 'gzip'})
+    
+    assert 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert len(compressed.get_data()) < len(plain.get_data())
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+    
+    # Both encodings carry the same (weak) tag, so either revalidates
+    assert compressed.headers['ETag'] == plain.headers['ETag']
+    assert compressed.headers['ETag'].startswith('W/')
+
+
+def test_streamed_gzip_output_matches_plain_output(client, monkeypatch):
+    monkeypatch.setitem(careerbot_app.app.config, 'JSON_STREAM_THRESHOLD', 5)
+    monkeypatch.setitem(careerbot_app.app.config, 'JSON_STREAM_CHUNK', 2)
+    add_applications(client, 12)
+    
+    plain = client.get('/api/get-applications')
+    compressed = client.get('/api/get-applications', headers={'Accept-Encoding': 'gzip'})
+    
+    assert plain.is_streamed and compressed.is_streamed
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    body = gzip.decompress(compressed.get_data())
+    assert body == plain.get_data()
+    assert len(json.loads(body)['applications']) == 12
+
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get('/api/get-statistics', headers={'Accept-Encoding': 'gzip'})
+    assert len(response.get_data()) < careerbot_app.app.config['COMPRESS_MIN_SIZE']
+    assert 'Content-Encoding' not in response.headers
@@ -0,0 +1,40 @@
+# Tests for the job posting ranking index and its SQLite store
+from utils import create_job_ranking_index
+
+
+JOBS = [
+    {'id': 'backend', 'title': 'Backend Engineer', 'required_skills': ['Python', 'SQL', 'Docker']},
+    {'id': 'frontend', 'title': 'Frontend Engineer', 'required_skills': ['JavaScript', 'React', 'CSS']},
+    {'id': 'data', 'title': 'Data Analyst', 'required_skills': ['Python', 'SQL', 'Excel']},
+]
+
+
+def test_rank_orders_by_metric():
+    index = create_job_ranking_index('memory')
+    index.add_jobs(JOBS)
+    
+    results = index.rank(['python', 'sql', 'docker'], metric='coverage', top_k=3)
+    assert [result['id'] for result in results] == ['backend', 'data', 'frontend']
+    assert results[0]['coverage'] == 100.0
+    assert results[0]['missing_skills'] == []
+
+
+def test_postings_are_shared_between_processes_and_survive_restarts(tmp_path):
+    db_path = str(tmp_path / 'careerbot.db')
+    worker_a = create_job_ranking_index('sqlite', db_path)
+    worker_b = create_job_ranking_index('sqlite', db_path)
+    
+    worker_a.add_jobs(JOBS)
+    assert len(worker_b) == 3
+    assert worker_b.rank(['react', 'css'], top_k=1)[0]['id'] == 'frontend'
+    
+    # Replacing and deleting in one worker shows up in the other
+    worker_b.add_jobs([{'id': 'frontend', 'title': 'UI Engineer', 'required_skills': ['Figma']}])
+    assert worker_b.remove_job('data')
+    assert not worker_a.remove_job('data')
+    assert worker_a.get_job('frontend')['title'] == 'UI Engineer'
+    assert [result['id'] for result in worker_a.rank(['figma'], top_k=5)] == ['frontend', 'backend']
+    
+    restarted = create_job_ranking_index('sqlite', db_path)
+    assert len(restarted) == 2
+    assert restarted.get_job('data') is None
@@ -3,7 +3,53 @@ import PyPDF2
 from docx import Document
 import re
 import os
-from groq import Groq
+import string
+import json
+import logging
+import mimetypes
+import time
+import asyncio
+import gzip
+import hashlib
+import heapq
+import queue
+import random
+import sqlite3
+import tempfile
+import threading
+import weakref
+import zlib
+from array import array
+from collections import deque, namedtuple, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from types import MappingProxyType
+import httpx
+import numpy as np
+from groq import Groq, AsyncGroq, DefaultHttpxClient, DefaultAsyncHttpxClient
+from openai import OpenAI, AsyncOpenAI
+from werkzeug.security import safe_join
+
+try:
+    import brotli  # Optional: without it responses are gzip-compressed only
+except ImportError:
+    brotli = None
+
+try:
+    import orjson  # Optional: faster decoding of stored JSON
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl  # Unix only: lets one worker process own the reminder scheduler
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Decoder for the JSON the stores write (json.dumps output of plain records)
+json_loads = orjson.loads if orjson is not None else json.loads
 
 def calculate_readiness_score(user_data):
     """
@@ -148,6 +194,207 @@ def get_readiness_level(score):
         return "Developing Readiness"
     else:
         return "Needs Significant Preparation"
+# Characters that continue a skill token. A skill only matches when it is not
+# glued to one of these on either side, so 'r' no longer matches inside
+# 'react' and 'go' no longer matches inside 'google'.
+SKILL_TOKEN_CHARS = 'a-z0-9_+#'
+
+
+def _build_skill_trie(terms):
+    """Build a character trie (nested dicts) from a collection of terms"""
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True  # End-of-term marker
+    return trie
+
+
+def _trie_to_regex(node):
+    """
+    Convert a character trie into an equivalent regex
+    
+    Shared prefixes are factored out, so the regex engine walks the trie
+    instead of trying every alternative at every position. Matching cost
+    depends on the text length, not on the number of skills.
+    """
+    is_end = '' in node
+    branches = []
+    single_chars = []
+    
+    for char in sorted(key for key in node if key != ''):
+        child_pattern = _trie_to_regex(node[char])
+        if child_pattern:
+            branches.append(re.escape(char) + child_pattern)
+        else:
+            single_chars.append(re.escape(char))
+    
+    if single_chars:
+        if len(single_chars) == 1:
+            branches.append(single_chars[0])
+        else:
+            branches.append('[' + ''.join(single_chars) + ']')
+    
+    if not branches:
+        return ''
+    
+    if len(branches) == 1:
+        pattern = branches[0]
+    else:
+        pattern = '(?:' + '|'.join(branches) + ')'
+    
+    if is_end:
+        # The term can also stop here, e.g. 'java' inside 'java(script)?'
+        pattern = '(?:' + pattern + ')?'
+    
+    return pattern
+
+
+def compile_skill_pattern(skills):
+    """
+    Compile a set of lowercase skills into a single word-boundary regex
+    that finds every skill in one pass over the text
+    
+    Parameters:
+    skills (iterable): Lowercase skill names
+    """
+    trie_pattern = _trie_to_regex(_build_skill_trie(skills))
+    if not trie_pattern:
+        # Empty vocabulary: a pattern that never matches
+        return re.compile(r'(?!)')
+    return re.compile(
+        f'(?<![{SKILL_TOKEN_CHARS}])' + trie_pattern + f'(?![{SKILL_TOKEN_CHARS}])'
+    )
+
+
+# Skill taxonomy (canonical skills, aliases, categories and resources)
+# Lives in a data file so the vocabulary can grow without code changes
+SKILL_TAXONOMY_PATH = os.getenv(
+    'SKILL_TAXONOMY_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skills_taxonomy.json')
+)
+
+# Immutable in-memory index built from the taxonomy file
+#   skills: canonical name -> {'name', 'category', 'aliases', 'resources'}
+#   aliases: lowercase name or alias -> canonical name
+#   categories: category -> tuple of canonical names
+#   default_resources: generic resources with a {skill} placeholder
+#   pattern: compiled matcher over every name and alias
+#   mtime: modification time of the file the index was built from
+SkillTaxonomy = namedtuple(
+    'SkillTaxonomy',
+    ['skills', 'aliases', 'categories', 'default_resources', 'pattern', 'mtime']
+)
+
+_skill_taxonomy = None
+_skill_taxonomy_lock = threading.Lock()
+
+
+def build_skill_taxonomy(taxonomy_data, mtime=0):
+    """
+    Build the immutable skill index from parsed taxonomy data
+    
+    Parameters:
+    taxonomy_data (dict): Parsed taxonomy file with a 'skills' list
+    mtime (float): Modification time of the source file
+    """
+    skills = {}
+    aliases = {}
+    categories = {}
+    
+    for entry in taxonomy_data.get('skills', []):
+        name = entry['name']
+        category = entry.get('category', 'Other')
+        skill_aliases = tuple(entry.get('aliases', []))
+        resources = tuple(MappingProxyType(dict(resource)) for resource in entry.get('resources', []))
+        
+        skills[name] = MappingProxyType({
+            'name': name,
+            'category': category,
+            'aliases': skill_aliases,
+            'resources': resources
+        })
+        categories.setdefault(category, []).append(name)
+        
+        # The canonical name is an alias of itself
+        for term in (name,) + skill_aliases:
+            aliases[term.lower()] = name
+    
+    default_resources = tuple(
+        MappingProxyType(dict(resource)) for resource in taxonomy_data.get('default_resources', [])
+    )
+    
+    return SkillTaxonomy(
+        skills=MappingProxyType(skills),
+        aliases=MappingProxyType(aliases),
+        categories=MappingProxyType({category: tuple(names) for category, names in categories.items()}),
+        default_resources=default_resources,
+        pattern=compile_skill_pattern(aliases),
+        mtime=mtime
+    )
+
+
+def load_skill_taxonomy(path=None):
+    """
+    Load and index the skill taxonomy file
+    
+    Parameters:
+    path (str): Path to the taxonomy JSON file (defaults to SKILL_TAXONOMY_PATH)
+    """
+    path = path or SKILL_TAXONOMY_PATH
+    mtime = os.path.getmtime(path)
+    with open(path, 'r', encoding='utf-8') as file:
+        taxonomy_data = json.load(file)
+    return build_skill_taxonomy(taxonomy_data, mtime)
+
+
+def get_skill_taxonomy():
+    """
+    Return the current skill taxonomy index
+    
+    The file is only re-read when its mtime changes. The new index is built
+    on the side and swapped in with a single assignment, so requests never
+    see a half-built taxonomy. If the file is broken or temporarily missing
+    after the first load, the previous index keeps serving.
+    """
+    global _skill_taxonomy
+    
+    taxonomy = _skill_taxonomy
+    try:
+        mtime = os.path.getmtime(SKILL_TAXONOMY_PATH)
+    except OSError:
+        if taxonomy is not None:
+            return taxonomy
+        raise
+    
+    if taxonomy is not None and taxonomy.mtime == mtime:
+        return taxonomy
+    
+    with _skill_taxonomy_lock:
+        # Another thread may have reloaded while we waited
+        if _skill_taxonomy is not None and _skill_taxonomy.mtime == mtime:
+            return _skill_taxonomy
+        try:
+            _skill_taxonomy = load_skill_taxonomy(SKILL_TAXONOMY_PATH)
+        except (OSError, ValueError, KeyError):
+            if _skill_taxonomy is None:
+                raise
+        return _skill_taxonomy
+
+
+def normalize_skill(skill):
+    """
+    Map a skill name or alias to its canonical name
+    Unknown skills are returned trimmed but otherwise unchanged
+    
+    Parameters:
+    skill (str): Skill name as typed by the user or found in a job post
+    """
+    skill = skill.strip()
+    return get_skill_taxonomy().aliases.get(skill.lower(), skill)
+
+
 def extract_skills_from_job(job_description):
     """
     Extract technical skills from a job description
@@ -157,48 +404,59 @@ def extract_skills_from_job(job_description):
     job_description (str): The job description text
     """
     
-    # Common technical skills database
-    # In a real app, this would be much larger or use AI
-    skills_database = {
-        # Programming Languages
-        'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift',
-        'kotlin', 'go', 'rust', 'typescript', 'r', 'matlab', 'scala',
-        
-        # Web Technologies
-        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express',
-        'django', 'flask', 'fastapi', 'spring', 'asp.net', 'jquery',
-        
-        # Databases
-        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra',
-        'oracle', 'dynamodb', 'sqlite', 'nosql',
-        
-        # Data Science & ML
-        'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-        'scikit-learn', 'pandas', 'numpy', 'data analysis', 'statistics',
-        'nlp', 'computer vision', 'keras', 'data science',
-        
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
-        'git', 'github', 'gitlab', 'ci/cd', 'terraform', 'ansible',
-        
-        # Other Tools
-        'excel', 'power bi', 'tableau', 'jira', 'agile', 'scrum',
-        'linux', 'bash', 'api', 'rest', 'graphql', 'microservices'
-    }
-    
     # Convert job description to lowercase for matching
     job_text = job_description.lower()
     
-    # Find matching skills
-    found_skills = []
-    for skill in skills_database:
-        if skill in job_text:
-            found_skills.append(skill.title())  # Capitalize for display
+    taxonomy = get_skill_taxonomy()
+    
+    # Find matching skills in a single pass over the text and map
+    # aliases such as 'k8s' to their canonical name
+    found_skills = {taxonomy.aliases[match.group(0)] for match in taxonomy.pattern.finditer(job_text)}
+    
+    return sorted(found_skills, key=str.lower)
+
+
+def skill_key(skill, aliases=None):
+    """
+    Comparison key for a skill: the lowercase canonical name, so that
+    'k8s', 'Kubernetes' and ' kubernetes ' all compare equal
+    
+    Parameters:
+    skill (str): Skill name or alias
+    aliases (mapping): Alias index to use (defaults to the current taxonomy)
+    """
+    if aliases is None:
+        aliases = get_skill_taxonomy().aliases
+    skill = skill.strip().lower()
+    return aliases.get(skill, skill).lower()
+
+
+def normalize_skill_set(skills):
+    """
+    Convert a list of skills into a frozenset of comparison keys
     
-    # Remove duplicates and sort
-    found_skills = sorted(list(set(found_skills)))
+    Parameters:
+    skills (list): List of skill names or aliases
+    """
+    aliases = get_skill_taxonomy().aliases
+    return frozenset(skill_key(skill, aliases) for skill in skills if skill and skill.strip())
+
+
+def get_gap_readiness(readiness_percentage):
+    """
+    Convert a skill match percentage into a readiness status and recommendation
     
-    return found_skills
+    Parameters:
+    readiness_percentage (float): Percentage of required skills the user has
+    """
+    if readiness_percentage >= 80:
+        return "Highly Ready", "You have most required skills! Apply with confidence."
+    elif readiness_percentage >= 60:
+        return "Ready with Minor Gaps", "You're qualified! Learn the missing skills while applying."
+    elif readiness_percentage >= 40:
+        return "Moderately Ready", "Spend 2-3 weeks learning key missing skills before applying."
+    else:
+        return "Needs Preparation", "Focus on building foundational skills first."
 
 
 def analyze_skill_gap(user_skills, required_skills):
@@ -207,24 +465,25 @@ def analyze_skill_gap(user_skills, required_skills):
     Returns analysis with matching and missing skills
     
     Parameters:
-    user_skills (list): List of skills user has
+    user_skills (list or frozenset): List of skills user has, or a set
+        already built with normalize_skill_set
     required_skills (list): List of skills required by job
     """
     
-    # Convert to lowercase for comparison
-    user_skills_lower = [skill.lower() for skill in user_skills]
-    required_skills_lower = [skill.lower() for skill in required_skills]
+    # Normalize once so each membership test is O(1)
+    if isinstance(user_skills, frozenset):
+        user_skill_keys = user_skills
+    else:
+        user_skill_keys = normalize_skill_set(user_skills)
     
-    # Find matching skills
+    # Split required skills into matching and missing in one pass
+    aliases = get_skill_taxonomy().aliases
     matching_skills = []
-    for skill in required_skills:
-        if skill.lower() in user_skills_lower:
-            matching_skills.append(skill)
-    
-    # Find missing skills
     missing_skills = []
     for skill in required_skills:
-        if skill.lower() not in user_skills_lower:
+        if skill_key(skill, aliases) in user_skill_keys:
+            matching_skills.append(skill)
+        else:
             missing_skills.append(skill)
     
     # Calculate readiness percentage
@@ -234,18 +493,7 @@ def analyze_skill_gap(user_skills, required_skills):
         readiness_percentage = 0
     
     # Determine readiness level
-    if readiness_percentage >= 80:
-        readiness_status = "Highly Ready"
-        recommendation = "You have most required skills! Apply with confidence."
-    elif readiness_percentage >= 60:
-        readiness_status = "Ready with Minor Gaps"
-        recommendation = "You're qualified! Learn the missing skills while applying."
-    elif readiness_percentage >= 40:
-        readiness_status = "Moderately Ready"
-        recommendation = "Spend 2-3 weeks learning key missing skills before applying."
-    else:
-        readiness_status = "Needs Preparation"
-        recommendation = "Focus on building foundational skills first."
+    readiness_status, recommendation = get_gap_readiness(readiness_percentage)
     
     return {
         'matching_skills': matching_skills,
@@ -259,6 +507,45 @@ def analyze_skill_gap(user_skills, required_skills):
     }
 
 
+def rank_jobs_by_skill_gap(user_skills, jobs):
+    """
+    Score one user's skills against many jobs and rank them
+    Returns a list of results sorted by readiness (best match first)
+    
+    Parameters:
+    user_skills (list): List of skills user has
+    jobs (list): Each job is a dict with 'required_skills' (and optionally
+        'id' and 'title'), or simply a list of required skills
+    """
+    
+    # Normalize the user's skills once for the whole batch
+    user_skill_keys = normalize_skill_set(user_skills)
+    
+    results = []
+    for index, job in enumerate(jobs):
+        if isinstance(job, dict):
+            required_skills = job.get('required_skills', [])
+            job_id = job.get('id', index)
+            title = job.get('title', '')
+        else:
+            required_skills = job
+            job_id = index
+            title = ''
+        
+        analysis = analyze_skill_gap(user_skill_keys, required_skills)
+        analysis['id'] = job_id
+        analysis['title'] = title
+        results.append(analysis)
+    
+    # Rank by readiness, then by number of matching skills
+    results.sort(key=lambda x: (x['readiness_percentage'], x['total_matching']), reverse=True)
+    
+    for rank, result in enumerate(results, start=1):
+        result['rank'] = rank
+    
+    return results
+
+
 def get_learning_resources(skill):
     """
     Provide free learning resources for a skill
@@ -268,62 +555,469 @@ def get_learning_resources(skill):
     skill (str): The skill to find resources for
     """
     
-    # Basic resource database
-    # In production, this would be more comprehensive
-    resources = {
-        'python': [
-            {'name': 'Python.org Tutorial', 'url': 'https://docs.python.org/3/tutorial/', 'type': 'Documentation'},
-            {'name': 'freeCodeCamp Python Course', 'url': 'https://www.freecodecamp.org/', 'type': 'Course'},
-        ],
-        'javascript': [
-            {'name': 'MDN JavaScript Guide', 'url': 'https://developer.mozilla.org/en-US/docs/Web/JavaScript/Guide', 'type': 'Documentation'},
-            {'name': 'JavaScript.info', 'url': 'https://javascript.info/', 'type': 'Tutorial'},
-        ],
-        'react': [
-            {'name': 'Official React Docs', 'url': 'https://react.dev/', 'type': 'Documentation'},
-            {'name': 'freeCodeCamp React', 'url': 'https://www.freecodecamp.org/', 'type': 'Course'},
-        ],
-        'sql': [
-            {'name': 'SQLBolt', 'url': 'https://sqlbolt.com/', 'type': 'Interactive Tutorial'},
-            {'name': 'W3Schools SQL', 'url': 'https://www.w3schools.com/sql/', 'type': 'Tutorial'},
-        ],
-        'machine learning': [
-            {'name': 'Google ML Crash Course', 'url': 'https://developers.google.com/machine-learning/crash-course', 'type': 'Course'},
-            {'name': 'Kaggle Learn', 'url': 'https://www.kaggle.com/learn', 'type': 'Interactive'},
-        ],
-    }
+    taxonomy = get_skill_taxonomy()
     
-    # Return resources for the skill or generic resources
-    skill_lower = skill.lower()
-    if skill_lower in resources:
-        return resources[skill_lower]
-    else:
-        # Generic resources for any skill
-        return [
-            {'name': 'YouTube Tutorials', 'url': f'https://www.youtube.com/results?search_query={skill}+tutorial', 'type': 'Video'},
-            {'name': 'freeCodeCamp', 'url': 'https://www.freecodecamp.org/', 'type': 'Course'},
-            {'name': 'Coursera Free Courses', 'url': f'https://www.coursera.org/search?query={skill}', 'type': 'Course'},
-        ]
+    # Return resources for the skill (or one of its aliases)
+    canonical = taxonomy.aliases.get(skill.strip().lower())
+    if canonical and taxonomy.skills[canonical]['resources']:
+        return [dict(resource) for resource in taxonomy.skills[canonical]['resources']]
+    
+    # Generic resources for any skill
+    return [
+        {key: value.replace('{skill}', skill) for key, value in resource.items()}
+        for resource in taxonomy.default_resources
+    ]
+class JobRankingIndex:
+    """
+    In-memory index of job postings for ranking jobs against a user's skills
+    
+    Postings are stored as a sparse skill incidence matrix (one row per job,
+    one column per skill key) kept in flat coordinate arrays. Ranking turns
+    the user's skills into a boolean vector and scores every job at once
+    with NumPy, instead of calling analyze_skill_gap once per job.
+    
+    With a store (a JobPostingStore), postings are saved there and every
+    process's index follows the store's change version, the same way
+    ApplicationStatistics follows the application store.
+    
+    Metrics:
+        coverage - share of the job's required skills the user has
+        jaccard  - overlap / union of the user's and the job's skills
+        weighted - like coverage, but rare skills (high IDF) count more
+    """
+    
+    METRICS = ('coverage', 'jaccard', 'weighted')
+    
+    def __init__(self, store=None):
+        self.store = store
+        self.version = None           # last store version applied
+        self._lock = threading.Lock()
+        self._vocabulary = {}         # skill key -> column
+        self._jobs = []               # row -> job dict (None once removed)
+        self._row_by_id = {}          # job id -> row
+        self._entry_rows = array('i')  # row of each non-zero entry
+        self._entry_cols = array('i')  # column of each non-zero entry
+        self._removed = 0
+        self._arrays = None           # cached NumPy view, rebuilt after changes
+    
+    def __len__(self):
+        self.sync()
+        return len(self._row_by_id)
+    
+    def sync(self):
+        """Apply the store's changes since the last call (no-op without a store)"""
+        if self.store is None:
+            return
+        version = self.store.current_version()
+        if version == self.version:
+            return
+        with self._lock:
+            if version == self.version:
+                return
+            changed, deleted, version = self.store.changes_since(self.version or 0)
+            self._store_rows(changed)
+            for job_id in deleted:
+                self._remove_row(job_id)
+            self._arrays = None
+            self.version = version
+    
+    def add_jobs(self, jobs):
+        """
+        Add or replace job postings
+        Returns the number of jobs stored
+        
+        Parameters:
+        jobs (list): Dicts with 'id' and 'required_skills' (or a
+            'description' to extract skills from), plus optional
+            'title' and 'company'
+        """
+        prepared = []
+        for job in jobs:
+            required_skills = job.get('required_skills')
+            if required_skills is None:
+                required_skills = extract_skills_from_job(job.get('description', ''))
+            prepared.append({
+                'id': str(job['id']),
+                'title': job.get('title', ''),
+                'company': job.get('company', ''),
+                'required_skills': list(required_skills)
+            })
+        
+        if self.store is not None:
+            self.store.save_jobs(prepared)
+            self.sync()
+            return len(prepared)
+        
+        with self._lock:
+            self._store_rows(prepared)
+            self._arrays = None
+        
+        return len(prepared)
+    
+    def _store_rows(self, jobs):
+        """Add or replace prepared jobs in the matrix (caller holds the lock)"""
+        for job in jobs:
+            self._remove_row(job['id'])
+            row = len(self._jobs)
+            self._jobs.append(job)
+            self._row_by_id[job['id']] = row
+            for key in normalize_skill_set(job['required_skills']):
+                column = self._vocabulary.setdefault(key, len(self._vocabulary))
+                self._entry_rows.append(row)
+                self._entry_cols.append(column)
+    
+    def remove_job(self, job_id):
+        """
+        Remove a job posting
+        Returns True if the job existed
+        
+        Parameters:
+        job_id (str): ID of the job posting
+        """
+        if self.store is not None:
+            removed = self.store.delete_job(str(job_id))
+            self.sync()
+            return removed
+        
+        with self._lock:
+            removed = self._remove_row(str(job_id))
+            if removed:
+                self._arrays = None
+            return removed
+    
+    def get_job(self, job_id):
+        """Return a stored job posting or None"""
+        self.sync()
+        row = self._row_by_id.get(str(job_id))
+        return None if row is None else self._jobs[row]
+    
+    def _remove_row(self, job_id):
+        """Tombstone a job's row (caller holds the lock)"""
+        row = self._row_by_id.pop(job_id, None)
+        if row is None:
+            return False
+        self._jobs[row] = None
+        self._removed += 1
+        return True
+    
+    def _compact(self):
+        """Drop tombstoned rows once they make up half the matrix (caller holds the lock)"""
+        jobs = [job for job in self._jobs if job is not None]
+        self._jobs = []
+        self._row_by_id = {}
+        self._entry_rows = array('i')
+        self._entry_cols = array('i')
+        self._removed = 0
+        for job in jobs:
+            row = len(self._jobs)
+            self._jobs.append(job)
+            self._row_by_id[job['id']] = row
+            for key in normalize_skill_set(job['required_skills']):
+                self._entry_rows.append(row)
+                self._entry_cols.append(self._vocabulary.setdefault(key, len(self._vocabulary)))
+    
+    def _get_arrays(self):
+        """Build (or reuse) the NumPy arrays used for scoring"""
+        arrays = self._arrays
+        if arrays is not None:
+            return arrays
+        
+        with self._lock:
+            if self._arrays is not None:
+                return self._arrays
+            
+            if self._removed and self._removed * 2 > len(self._jobs):
+                self._compact()
+            
+            num_rows = len(self._jobs)
+            rows = np.frombuffer(self._entry_rows, dtype=np.int32).copy()
+            cols = np.frombuffer(self._entry_cols, dtype=np.int32).copy()
+            alive = np.array([job is not None for job in self._jobs], dtype=bool)
+            
+            # Skill weights: inverse document frequency over live jobs
+            live_entries = alive[rows]
+            doc_freq = np.bincount(cols[live_entries], minlength=len(self._vocabulary))
+            idf = np.log((1 + alive.sum()) / (1 + doc_freq)) + 1.0
+            entry_weights = idf[cols]
+            
+            arrays = {
+                'rows': rows,
+                'cols': cols,
+                'alive': alive,
+                'entry_weights': entry_weights,
+                'job_sizes': np.bincount(rows, minlength=num_rows).astype(np.float64),
+                'job_weights': np.bincount(rows, weights=entry_weights, minlength=num_rows),
+                'vocabulary_size': len(self._vocabulary),
+                'vocabulary': dict(self._vocabulary),  # Snapshot matching the columns above
+                'jobs': list(self._jobs)
+            }
+            self._arrays = arrays
+            return arrays
+    
+    def score(self, user_skills):
+        """
+        Score every stored job for a user
+        Returns (jobs, scores) where scores maps metric name -> array
+        
+        Parameters:
+        user_skills (list): List of skills user has
+        """
+        self.sync()
+        arrays = self._get_arrays()
+        user_keys = normalize_skill_set(user_skills)
+        
+        # Boolean user vector over the skill vocabulary. Skills that no
+        # job requires don't get a column but still count for Jaccard.
+        user_vector = np.zeros(arrays['vocabulary_size'], dtype=bool)
+        vocabulary = arrays['vocabulary']
+        user_cols = [vocabulary[key] for key in user_keys if key in vocabulary]
+        user_vector[user_cols] = True
+        
+        hits = user_vector[arrays['cols']]
+        num_rows = len(arrays['jobs'])
+        matched = np.bincount(arrays['rows'], weights=hits, minlength=num_rows)
+        matched_weight = np.bincount(arrays['rows'], weights=hits * arrays['entry_weights'], minlength=num_rows)
+        
+        job_sizes = arrays['job_sizes']
+        union = job_sizes + len(user_keys) - matched
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = {
+                'coverage': np.where(job_sizes > 0, matched / job_sizes, 0.0),
+                'jaccard': np.where(union > 0, matched / union, 0.0),
+                'weighted': np.where(arrays['job_weights'] > 0, matched_weight / arrays['job_weights'], 0.0)
+            }
+        scores['matched'] = matched
+        
+        # Removed jobs never rank
+        for metric in self.METRICS:
+            scores[metric][~arrays['alive']] = -1.0
+        
+        return arrays['jobs'], scores
+    
+    def rank(self, user_skills, metric='weighted', top_k=20):
+        """
+        Rank stored jobs for a user
+        Returns the top_k jobs with their scores and skill gap
+        
+        Parameters:
+        user_skills (list): List of skills user has
+        metric (str): One of METRICS to sort by
+        top_k (int): Number of jobs to return
+        """
+        if metric not in self.METRICS:
+            raise ValueError(f"Invalid metric. Must be one of: {list(self.METRICS)}")
+        
+        jobs, scores = self.score(user_skills)
+        ranking = scores[metric]
+        live_count = len(ranking) - int((ranking < 0).sum())
+        top_k = max(0, min(top_k, live_count))
+        if top_k == 0:
+            return []
+        
+        # Partial sort: only the top_k rows are fully ordered. Ties are
+        # broken by the number of matching skills.
+        candidates = np.argpartition(-ranking, top_k - 1)[:top_k]
+        order = np.lexsort((-scores['matched'][candidates], -ranking[candidates]))
+        top_rows = candidates[order]
+        
+        user_skill_keys = normalize_skill_set(user_skills)
+        results = []
+        for rank, row in enumerate(top_rows, start=1):
+            job = jobs[row]
+            gap = analyze_skill_gap(user_skill_keys, job['required_skills'])
+            results.append({
+                'rank': rank,
+                'id': job['id'],
+                'title': job['title'],
+                'company': job['company'],
+                'coverage': round(float(scores['coverage'][row]) * 100, 1),
+                'jaccard': round(float(scores['jaccard'][row]) * 100, 1),
+                'weighted_score': round(float(scores['weighted'][row]) * 100, 1),
+                'readiness_status': gap['readiness_status'],
+                'matching_skills': gap['matching_skills'],
+                'missing_skills': gap['missing_skills']
+            })
+        
+        return results
+
+
+class JobPostingStore:
+    """
+    Job postings in SQLite (WAL mode), shared by every worker process
+    
+    Each posting is stored as JSON with the change version of its last
+    write; deletions leave a tombstone. Every write bumps the table's
+    version, so a JobRankingIndex can check one number and pull only the
+    postings changed since its last look (changes_since).
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS job_postings (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            version INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS deleted_job_postings (
+            id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS store_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO store_meta (key, value) VALUES ('job_postings_version', 0);
+        CREATE INDEX IF NOT EXISTS idx_job_postings_version ON job_postings (version);
+        CREATE INDEX IF NOT EXISTS idx_deleted_job_postings_version ON deleted_job_postings (version);
+    """
+    
+    def __init__(self, db_path, pool_size=8, timeout=30):
+        self.db_path = db_path
+        self._connection = SQLiteConnectionPool(db_path, pool_size, timeout).connection
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+    
+    @staticmethod
+    def _next_version(conn):
+        # The UPDATE takes the write lock, so versions are unique across processes
+        conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'job_postings_version'")
+        return conn.execute("SELECT value FROM store_meta WHERE key = 'job_postings_version'").fetchone()[0]
+    
+    def save_jobs(self, jobs):
+        """
+        Add or replace job postings in one transaction
+        
+        Parameters:
+        jobs (list): Prepared job dicts (see JobRankingIndex.add_jobs)
+        """
+        with self._connection() as conn:
+            version = self._next_version(conn)
+            conn.executemany(
+                'INSERT OR REPLACE INTO job_postings (id, data, version) VALUES (?, ?, ?)',
+                [(job['id'], json.dumps(job), version) for job in jobs]
+            )
+            conn.executemany('DELETE FROM deleted_job_postings WHERE id = ?', [(job['id'],) for job in jobs])
+    
+    def delete_job(self, job_id):
+        """Delete a job posting; returns True if it existed"""
+        with self._connection() as conn:
+            cursor = conn.execute('DELETE FROM job_postings WHERE id = ?', (job_id,))
+            if cursor.rowcount == 0:
+                return False
+            conn.execute(
+                'INSERT OR REPLACE INTO deleted_job_postings (id, version) VALUES (?, ?)',
+                (job_id, self._next_version(conn))
+            )
+        return True
+    
+    def changes_since(self, version):
+        """
+        Return the postings changed and deleted after the given version
+        
+        Returns:
+        tuple: (changed jobs, deleted ids, current version)
+        """
+        with self._connection() as conn:
+            # Read the version first: anything written meanwhile is simply
+            # returned again by the next call
+            conn.execute('BEGIN')
+            current = self.current_version(conn)
+            rows = conn.execute(
+                'SELECT data FROM job_postings WHERE version > ? ORDER BY version', (version,)
+            ).fetchall()
+            deleted = conn.execute(
+                'SELECT id FROM deleted_job_postings WHERE version > ?', (version,)
+            ).fetchall()
+        return [json_loads(row[0]) for row in rows], [row[0] for row in deleted], current
+    
+    def current_version(self, conn=None):
+        """Return the postings' change version (increases on every write)"""
+        if conn is not None:
+            return conn.execute("SELECT value FROM store_meta WHERE key = 'job_postings_version'").fetchone()[0]
+        with self._connection() as conn:
+            return self.current_version(conn)
+    
+    def count(self):
+        """Return the number of stored job postings"""
+        with self._connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM job_postings').fetchone()[0]
+
+
+def create_job_ranking_index(backend='sqlite', db_path=None):
+    """
+    Create the job posting ranking index
+    
+    Parameters:
+    backend (str): 'sqlite' (postings persisted and shared across workers)
+        or 'memory' (postings live only in this process)
+    db_path (str): SQLite database file (for the sqlite backend)
+    """
+    if backend == 'memory':
+        return JobRankingIndex()
+    if backend == 'sqlite':
+        return JobRankingIndex(store=JobPostingStore(db_path or os.path.join('data', 'careerbot.db')))
+    raise ValueError(f"Unknown job posting store backend: {backend}")
+
+
 import PyPDF2
 from docx import Document
 import re
 
 
-def extract_text_from_pdf(file_path):
+# PDF extraction limits
+MAX_PDF_PAGES = 20                # Resumes longer than this are not read further
+MAX_RESUME_CHARS = 20000          # ~3000 words, well past the 800-word "too long" mark
+
+
+def iter_pdf_pages(source, max_pages=MAX_PDF_PAGES):
+    """
+    Yield the text of each page of a PDF, in page order
+    
+    Pages are extracted one at a time as the caller asks for them, so the
+    caller can stop early without reading the rest of the file.
+    
+    Parameters:
+    source (str or file-like): Path to the PDF file, or a binary file-like
+        object such as an upload stream or BytesIO
+    max_pages (int): Maximum number of pages to read (None for all)
+    """
+    is_path = isinstance(source, (str, os.PathLike))
+    file = open(source, 'rb') if is_path else source
+    try:
+        pdf_reader = PyPDF2.PdfReader(file)
+        num_pages = len(pdf_reader.pages)
+        if max_pages is not None:
+            num_pages = min(num_pages, max_pages)
+        
+        for i in range(num_pages):
+            yield pdf_reader.pages[i].extract_text() or ''
+    finally:
+        if is_path:
+            file.close()
+
+
+def extract_text_from_pdf(file_path, max_pages=MAX_PDF_PAGES, max_chars=MAX_RESUME_CHARS):
     """
     Extract text content from a PDF file
+    Stops reading once max_chars of text have been collected
     
     Parameters:
-    file_path (str): Path to the PDF file
+    file_path (str or file-like): Path to the PDF file, or a binary
+        file-like object (e.g. an uploaded file's stream)
+    max_pages (int): Maximum number of pages to read (None for all)
+    max_chars (int): Stop after this much text (None for no limit)
     """
     try:
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            # Extract text from all pages
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-        return text
+        pages = []
+        collected = 0
+        for page_text in iter_pdf_pages(file_path, max_pages=max_pages):
+            pages.append(page_text)
+            collected += len(page_text)
+            if max_chars is not None and collected >= max_chars:
+                break
+        
+        # Join once instead of growing a string page by page
+        text = "\n".join(pages)
+        return text if max_chars is None else text[:max_chars]
     except Exception as e:
         raise Exception(f"Error reading PDF: {str(e)}")
 
@@ -333,28 +1027,148 @@ def extract_text_from_docx(file_path):
     Extract text content from a Word document
     
     Parameters:
-    file_path (str): Path to the DOCX file
+    file_path (str or file-like): Path to the DOCX file, or a binary
+        file-like object (e.g. an uploaded file's stream)
     """
     try:
         doc = Document(file_path)
-        # Extract text from all paragraphs
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        # Extract text from all paragraphs and join once
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
     except Exception as e:
         raise Exception(f"Error reading DOCX: {str(e)}")
 
 
-def analyze_resume(resume_text):
+# Important resume keywords (ATS)
+RESUME_KEYWORDS = (
+    'experience', 'education', 'skills', 'project', 'achievement',
+    'developed', 'managed', 'led', 'created', 'implemented'
+)
+
+# Strong action verbs that show impact
+RESUME_ACTION_VERBS = (
+    'achieved', 'improved', 'increased', 'reduced', 'developed',
+    'created', 'implemented', 'designed', 'led', 'managed',
+    'optimized', 'built', 'launched', 'generated', 'delivered'
+)
+
+# Section headings that show an organized structure
+RESUME_SECTIONS = ('experience', 'education', 'skills', 'projects')
+
+
+def _build_resume_word_rules():
+    """
+    Map each lowercase word to the resume rules it satisfies, e.g.
+    'developed' -> (('keyword', 'developed'), ('action_verb', 'developed'))
+    Singular/plural forms of keywords and sections count as the same word.
+    """
+    rules = {}
+    
+    def add(words, rule, term):
+        for word in words:
+            rules.setdefault(word, set()).add((rule, term))
+    
+    for keyword in RESUME_KEYWORDS:
+        add({keyword, keyword + 's', keyword.rstrip('s')}, 'keyword', keyword)
+    for verb in RESUME_ACTION_VERBS:
+        add({verb}, 'action_verb', verb)
+    for section in RESUME_SECTIONS:
+        add({section, section.rstrip('s')}, 'section', section)
+    add({'linkedin'}, 'linkedin', 'linkedin')
+    
+    return {word: tuple(word_rules) for word, word_rules in rules.items()}
+
+
+RESUME_WORD_RULES = _build_resume_word_rules()
+
+# Punctuation stripped from the ends of each word before rule lookup
+RESUME_WORD_PUNCTUATION = string.punctuation + '•–—·'
+
+# Contact info patterns, compiled once. The phone pattern matches the same
+# numbers as '\d{10}|\d{3}[-.\s]\d{3}[-.\s]\d{4}' but starts with a shared
+# \d{3} prefix, which lets the regex engine skip non-digits quickly.
+RESUME_EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+RESUME_PHONE_PATTERN = re.compile(r'\d{3}(?:\d{7}|[-.\s]\d{3}[-.\s]\d{4})')
+
+
+def _has_email(resume_text):
+    """Check for an email address, only looking around each '@'"""
+    at = resume_text.find('@')
+    while at != -1:
+        # An address has no whitespace, so it fits in a window around the '@'
+        if RESUME_EMAIL_PATTERN.search(resume_text, max(0, at - 64), at + 256):
+            return True
+        at = resume_text.find('@', at + 1)
+    return False
+
+
+def scan_resume_text(resume_text):
+    """
+    Tokenize a resume once and collect everything the scoring rules need
+    
+    The text is split into words a single time; the distinct words are
+    looked up in the precomputed rule index (RESUME_WORD_RULES) instead of
+    scanning the whole text once per keyword and verb.
+    
+    Parameters:
+    resume_text (str): The extracted resume text
+    """
+    tokens = resume_text.split()
+    
+    keywords = set()
+    action_verbs = set()
+    sections = set()
+    has_linkedin = False
+    
+    # Each distinct token is normalized once, however often it appears
+    for token in set(tokens):
+        word_rules = RESUME_WORD_RULES.get(token.lower().strip(RESUME_WORD_PUNCTUATION))
+        if not word_rules:
+            # e.g. 'linkedin.com/in/name' or 'skills/tools'
+            if 'linkedin' in token.lower():
+                has_linkedin = True
+            continue
+        for rule, term in word_rules:
+            if rule == 'keyword':
+                keywords.add(term)
+            elif rule == 'action_verb':
+                action_verbs.add(term)
+            elif rule == 'section':
+                sections.add(term)
+            else:
+                has_linkedin = True
+    
+    return {
+        'word_count': len(tokens),
+        'keywords': keywords,
+        'action_verbs': action_verbs,
+        'sections': sections,
+        'has_email': _has_email(resume_text),
+        'has_phone': bool(RESUME_PHONE_PATTERN.search(resume_text)),
+        'has_bullets': '•' in resume_text or '-' in resume_text or '*' in resume_text,
+        'has_linkedin': has_linkedin
+    }
+
+
+def analyze_resume(resume_text, collect_timings=False):
     """
     Analyze resume and provide detailed feedback
     Returns scores and recommendations
     
+    The text is tokenized once by scan_resume_text; each rule below only
+    looks at the collected tokens.
+    
     Parameters:
     resume_text (str): The extracted resume text
+    collect_timings (bool): Add per-rule timings (ms) under 'timings'
     """
     
+    timings = {}
+    started = time.perf_counter()
+    
+    # Single pass over the text
+    scan = scan_resume_text(resume_text)
+    timings['tokenize'] = time.perf_counter() - started
+    
     # Initialize scores (each category out of 20 points)
     scores = {
         'length_score': 0,
@@ -367,9 +1181,10 @@ def analyze_resume(resume_text):
     feedback = []
     
     # Calculate word count
-    word_count = len(resume_text.split())
+    word_count = scan['word_count']
     
     # 1. Length Analysis (20 points)
+    started = time.perf_counter()
     if word_count >= 400 and word_count <= 600:
         scores['length_score'] = 20
         feedback.append("✓ Perfect length! Your resume is concise and complete.")
@@ -385,22 +1200,14 @@ def analyze_resume(resume_text):
     else:
         scores['length_score'] = 5
         feedback.append("✗ Resume is too short. Add more relevant experience and skills.")
+    timings['length'] = time.perf_counter() - started
     
     # 2. Keywords Analysis (20 points)
+    started = time.perf_counter()
     # Check for important resume keywords
-    important_keywords = [
-        'experience', 'education', 'skills', 'project', 'achievement',
-        'developed', 'managed', 'led', 'created', 'implemented'
-    ]
-    
-    keywords_found = 0
-    resume_lower = resume_text.lower()
-    
-    for keyword in important_keywords:
-        if keyword in resume_lower:
-            keywords_found += 1
+    keywords_found = len(scan['keywords'])
     
-    keyword_percentage = (keywords_found / len(important_keywords)) * 100
+    keyword_percentage = (keywords_found / len(RESUME_KEYWORDS)) * 100
     
     if keyword_percentage >= 70:
         scores['keywords_score'] = 20
@@ -411,11 +1218,13 @@ def analyze_resume(resume_text):
     else:
         scores['keywords_score'] = 10
         feedback.append("✗ Missing important keywords. Add more action verbs and specific achievements.")
+    timings['keywords'] = time.perf_counter() - started
     
     # 3. Formatting Check (20 points)
+    started = time.perf_counter()
     # Check for bullet points or organized structure
-    has_bullets = '•' in resume_text or '-' in resume_text or '*' in resume_text
-    has_sections = any(section in resume_lower for section in ['experience', 'education', 'skills', 'projects'])
+    has_bullets = scan['has_bullets']
+    has_sections = bool(scan['sections'])
     
     if has_bullets and has_sections:
         scores['formatting_score'] = 20
@@ -426,12 +1235,14 @@ def analyze_resume(resume_text):
     else:
         scores['formatting_score'] = 10
         feedback.append("✗ Poor structure. Add clear sections: Experience, Education, Skills, Projects.")
+    timings['formatting'] = time.perf_counter() - started
     
     # 4. Contact Information (20 points)
+    started = time.perf_counter()
     # Check for email, phone, and LinkedIn
-    has_email = bool(re.search(r'[\w\.-]+@[\w\.-]+\.\w+', resume_text))
-    has_phone = bool(re.search(r'\d{10}|\d{3}[-.\s]\d{3}[-.\s]\d{4}', resume_text))
-    has_linkedin = 'linkedin' in resume_lower
+    has_email = scan['has_email']
+    has_phone = scan['has_phone']
+    has_linkedin = scan['has_linkedin']
     
     contact_count = sum([has_email, has_phone, has_linkedin])
     
@@ -444,18 +1255,11 @@ def analyze_resume(resume_text):
     else:
         scores['contact_info_score'] = 10
         feedback.append("✗ Missing contact information! Add email, phone, and LinkedIn.")
+    timings['contact_info'] = time.perf_counter() - started
     
     # 5. Action Verbs Analysis (20 points)
-    strong_action_verbs = [
-        'achieved', 'improved', 'increased', 'reduced', 'developed',
-        'created', 'implemented', 'designed', 'led', 'managed',
-        'optimized', 'built', 'launched', 'generated', 'delivered'
-    ]
-    
-    action_verbs_found = 0
-    for verb in strong_action_verbs:
-        if verb in resume_lower:
-            action_verbs_found += 1
+    started = time.perf_counter()
+    action_verbs_found = len(scan['action_verbs'])
     
     if action_verbs_found >= 5:
         scores['action_verbs_score'] = 20
@@ -466,6 +1270,7 @@ def analyze_resume(resume_text):
     else:
         scores['action_verbs_score'] = 10
         feedback.append("✗ Weak language! Replace passive descriptions with strong action verbs.")
+    timings['action_verbs'] = time.perf_counter() - started
     
     # Calculate total score
     total_score = sum(scores.values())
@@ -481,7 +1286,7 @@ def analyze_resume(resume_text):
         overall = "Your resume needs major work before applying to jobs."
     
     # Return complete analysis
-    return {
+    result = {
         'total_score': total_score,
         'scores': scores,
         'feedback': feedback,
@@ -491,6 +1296,11 @@ def analyze_resume(resume_text):
         'has_phone': has_phone,
         'has_linkedin': has_linkedin
     }
+    
+    if collect_timings:
+        result['timings'] = {rule: round(seconds * 1000, 4) for rule, seconds in timings.items()}
+    
+    return result
 
 
 def generate_resume_improvements(analysis):
@@ -553,9 +1363,440 @@ def generate_resume_improvements(analysis):
     
     return improvements
 
-from datetime import datetime, timedelta
-import json
-
+class LRUCache:
+    """
+    Thread-safe in-memory cache with a size bound (least recently used
+    entries are evicted first) and an optional time-to-live per entry
+    
+    Keeps hit/miss/eviction counters so callers can report cache metrics.
+    """
+    
+    def __init__(self, max_entries=1024, ttl_seconds=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[0] is not None and entry[0] <= now):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, key, value, ttl_seconds=None):
+        """Store a value, evicting the least recently used entries if full"""
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def __contains__(self, key):
+        """True if key is cached and not expired (does not count as a lookup)"""
+        entry = self._entries.get(key)
+        return entry is not None and (entry[0] is None or entry[0] > time.monotonic())
+    
+    def pop(self, key, default=None):
+        """Remove and return a value"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """Return cache metrics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0
+        }
+
+
+def hash_file_stream(stream, chunk_size=64 * 1024):
+    """
+    Return the SHA-256 hex digest of a binary stream, read in chunks
+    The stream is rewound so it can be parsed afterwards
+    
+    Parameters:
+    stream (file-like): Binary stream positioned at the start
+    """
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+class ResumeAnalysisCache:
+    """
+    Content-addressed cache of resume analyses
+    
+    Entries are keyed by the SHA-256 of the uploaded file bytes and hold the
+    extracted text and the full analysis. The in-memory layer is an LRU with
+    a TTL. If persist_dir is set, entries are also written there as JSON so
+    they survive restarts and are shared between workers. The directory is
+    bounded too: every `prune_every` writes, expired files are deleted and
+    then the least recently used ones beyond max_disk_entries.
+    """
+    
+    def __init__(self, max_entries=256, ttl_seconds=24 * 60 * 60, persist_dir=None,
+                 max_disk_entries=None, prune_every=32):
+        self.memory = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.ttl_seconds = ttl_seconds
+        self.persist_dir = persist_dir
+        self.max_disk_entries = max_disk_entries or max_entries * 4
+        self.prune_every = prune_every
+        self._writes = 0
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+    
+    def _path_for(self, digest):
+        return os.path.join(self.persist_dir, f"{digest}.json")
+    
+    def get(self, digest):
+        """
+        Return {'text', 'analysis'} for a file digest, or None
+        
+        Parameters:
+        digest (str): SHA-256 hex digest of the file bytes
+        """
+        entry = self.memory.get(digest)
+        if entry is not None or not self.persist_dir:
+            return entry
+        
+        # Fall back to the on-disk copy
+        try:
+            with open(self._path_for(digest), 'r', encoding='utf-8') as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            return None
+        
+        if self.ttl_seconds and time.time() - stored.get('stored_at', 0) > self.ttl_seconds:
+            try:
+                os.remove(self._path_for(digest))
+            except OSError:
+                pass
+            return None
+        
+        entry = {'text': stored['text'], 'analysis': stored['analysis']}
+        self.memory.set(digest, entry)
+        try:
+            # Mark as recently used for prune()
+            os.utime(self._path_for(digest))
+        except OSError:
+            pass
+        return entry
+    
+    def set(self, digest, text, analysis):
+        """
+        Cache the extracted text and analysis for a file digest
+        
+        Parameters:
+        digest (str): SHA-256 hex digest of the file bytes
+        text (str): Extracted resume text
+        analysis (dict): Result of analyze_resume (with improvements)
+        """
+        entry = {'text': text, 'analysis': analysis}
+        self.memory.set(digest, entry)
+        
+        if not self.persist_dir:
+            return
+        
+        # Write to a uniquely named temp file and rename, so readers never
+        # see half a file and concurrent writers don't collide. A failed
+        # write (full disk, read-only directory) only loses the disk copy.
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.persist_dir,
+                                             suffix='.tmp', delete=False) as file:
+                temp_path = file.name
+                json.dump(dict(entry, stored_at=time.time()), file)
+            os.replace(temp_path, self._path_for(digest))
+        except OSError as e:
+            logger.warning('Could not persist resume analysis %s: %s', digest, e)
+            if temp_path:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return
+        
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self.prune()
+    
+    def prune(self):
+        """
+        Delete expired cache files, then the least recently used ones over
+        max_disk_entries. Returns the number of files deleted.
+        """
+        files = []
+        try:
+            with os.scandir(self.persist_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.json', '.tmp')):
+                        try:
+                            files.append((entry.stat().st_mtime, entry.path, entry.name.endswith('.tmp')))
+                        except OSError:
+                            pass
+        except OSError as e:
+            logger.warning('Could not prune resume cache: %s', e)
+            return 0
+        
+        now = time.time()
+        expired = []
+        cached = []  # Oldest (least recently used) first
+        for mtime, path, is_temp in sorted(files):
+            if is_temp:
+                # Left behind by a writer that crashed mid-write
+                if now - mtime > 60 * 60:
+                    expired.append(path)
+            elif self.ttl_seconds and now - mtime > self.ttl_seconds:
+                expired.append(path)
+            else:
+                cached.append(path)
+        excess = cached[:max(0, len(cached) - self.max_disk_entries)]
+        
+        removed = 0
+        for path in expired + excess:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+
+def find_resume_files(input_dir):
+    """
+    List every PDF/DOCX file under a directory, sorted for a stable order
+    
+    Parameters:
+    input_dir (str): Directory to search (recursively)
+    """
+    paths = []
+    for root, _dirs, files in os.walk(input_dir):
+        for name in files:
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def score_resume_file(file_path, collect_timings=False):
+    """
+    Extract, analyze and generate improvements for one resume file
+    Returns a JSON-serializable record; errors are recorded, not raised
+    
+    Parameters:
+    file_path (str): Path to a PDF or DOCX file
+    collect_timings (bool): Include analyze_resume's per-rule timings (ms)
+    """
+    record = {'file': file_path}
+    try:
+        with open(file_path, 'rb') as file:
+            record['sha256'] = hash_file_stream(file)
+            if file_path.lower().endswith('.pdf'):
+                resume_text = extract_text_from_pdf(file)
+            else:
+                resume_text = extract_text_from_docx(file)
+        
+        if not resume_text or len(resume_text.strip()) < 50:
+            raise ValueError('Could not extract text from resume or resume is too short')
+        
+        analysis = analyze_resume(resume_text, collect_timings=collect_timings)
+        analysis['improvements'] = generate_resume_improvements(analysis)
+        record['status'] = 'ok'
+        record['analysis'] = analysis
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = str(e)
+    return record
+
+
+def load_scored_files(output_path):
+    """
+    Read the files already scored in a JSONL results file
+    
+    A line cut short by a crash is removed so the file can be appended to.
+    
+    Parameters:
+    output_path (str): Path to the JSONL results file
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    
+    valid_size = 0
+    with open(output_path, 'rb') as file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                done.add(json.loads(line)['file'])
+            except (ValueError, KeyError):
+                break
+            valid_size += len(line)
+    
+    if valid_size != os.path.getsize(output_path):
+        with open(output_path, 'r+b') as file:
+            file.truncate(valid_size)
+    
+    return done
+
+
+def iter_score_resumes(file_paths, workers=None, max_in_flight=None, collect_timings=False):
+    """
+    Score resume files across a process pool
+    Yields records as they complete (not necessarily in input order)
+    
+    Parameters:
+    file_paths (list): Paths of the files to score
+    workers (int): Number of worker processes (defaults to CPU count)
+    max_in_flight (int): Cap on submitted-but-unfinished files, so huge
+        directories don't queue every path up front
+    collect_timings (bool): Include per-rule timings in each record
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for file_path in file_paths:
+            pending.add(pool.submit(score_resume_file, file_path, collect_timings))
+            if len(pending) >= max_in_flight:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def score_resume_directory(input_dir, output_path, workers=None, progress=None, collect_timings=False):
+    """
+    Score every resume under input_dir and append results to a JSONL file
+    
+    Files already present in output_path are skipped, so an interrupted
+    run picks up where it stopped. Each record is flushed as soon as it is
+    written.
+    
+    Parameters:
+    input_dir (str): Directory containing PDF/DOCX resumes
+    output_path (str): JSONL file to append results to
+    workers (int): Number of worker processes
+    progress (callable): Called as progress(done, total, record) after each file
+    collect_timings (bool): Record per-rule timings and total them (ms)
+        per rule in the summary's 'timings'
+    """
+    all_files = find_resume_files(input_dir)
+    already_done = load_scored_files(output_path)
+    todo = [path for path in all_files if path not in already_done]
+    
+    summary = {'total': len(all_files), 'skipped': len(all_files) - len(todo), 'ok': 0, 'error': 0}
+    if collect_timings:
+        summary['timings'] = {}
+    
+    with open(output_path, 'a', encoding='utf-8') as output:
+        records = iter_score_resumes(todo, workers=workers, collect_timings=collect_timings)
+        for done, record in enumerate(records, start=1):
+            output.write(json.dumps(record) + '\n')
+            output.flush()
+            summary[record['status']] += 1
+            if collect_timings and record['status'] == 'ok':
+                for rule, ms in record['analysis']['timings'].items():
+                    summary['timings'][rule] = summary['timings'].get(rule, 0) + ms
+            if progress:
+                progress(done, len(todo), record)
+    
+    return summary
+
+
+from datetime import datetime, timedelta
+import json
+
+
+# Crockford base32 alphabet used by ULIDs (no I, L, O, U)
+ULID_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+_id_lock = threading.Lock()
+_last_id_ms = 0
+_last_id_random = 0
+
+
+def _reset_id_state():
+    """Forget the last ID so a forked process doesn't continue the parent's sequence"""
+    global _last_id_ms, _last_id_random
+    _last_id_ms = 0
+    _last_id_random = 0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_id_state)
+
+
+def generate_id(prefix=''):
+    """
+    Generate a unique, time-sortable ID (ULID format)
+    
+    The first 10 characters encode the millisecond timestamp and the last 16
+    are random, so IDs sort in creation order as plain strings and two
+    processes practically never collide. Within one process, IDs created in
+    the same millisecond increment the random part, so they stay strictly
+    increasing.
+    
+    Parameters:
+    prefix (str): Prepended to the ID, e.g. 'job_'
+    """
+    global _last_id_ms, _last_id_random
+    
+    with _id_lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms <= _last_id_ms:
+            # Same millisecond (or the clock went back): keep counting up
+            now_ms = _last_id_ms
+            random_part = _last_id_random + 1
+            if random_part >> 80:
+                now_ms += 1
+                random_part = int.from_bytes(os.urandom(10), 'big')
+        else:
+            random_part = int.from_bytes(os.urandom(10), 'big')
+        _last_id_ms = now_ms
+        _last_id_random = random_part
+    
+    value = (now_ms << 80) | random_part
+    chars = []
+    for _ in range(26):
+        chars.append(ULID_ALPHABET[value & 31])
+        value >>= 5
+    return prefix + ''.join(reversed(chars))
+
 
 def create_job_application(job_data):
     """
@@ -570,8 +1811,8 @@ def create_job_application(job_data):
         - status: Current status (default: 'Applied')
     """
     
-    # Generate unique ID based on timestamp
-    application_id = f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    # Generate a unique, time-sortable ID
+    application_id = generate_id('job_')
     
     # Create application object
     application = {
@@ -743,236 +1984,2359 @@ def get_application_statistics(applications):
         'offers': status_counts.get('Offer', 0),
         'rejections': status_counts.get('Rejected', 0)
     }
-    
-    # Initialize Groq client
-def get_groq_client():
-    """Initialize and return Groq client"""
-    api_key = os.getenv('GROQ_API_KEY')
-    if not api_key:
-        raise Exception("GROQ_API_KEY not found in environment variables")
-    return Groq(api_key=api_key)
-
-
-# Company-specific interview questions database
-COMPANY_QUESTIONS = {
-    'google': [
-        "Tell me about a time you solved a complex technical problem.",
-        "How would you design a scalable system for millions of users?",
-        "Explain a technical concept to a non-technical person.",
-        "Describe your approach to debugging a production issue."
-    ],
-    'amazon': [
-        "Tell me about a time you failed and what you learned.",
-        "Describe a situation where you had to work with limited resources.",
-        "How do you prioritize tasks when everything is urgent?",
-        "Tell me about a time you went above and beyond for a customer."
-    ],
-    'microsoft': [
-        "How would you improve one of our products?",
-        "Describe a time you had to learn a new technology quickly.",
-        "How do you handle disagreements with team members?",
-        "Tell me about a project you're most proud of."
-    ],
-    'startup': [
-        "Why do you want to work at a startup?",
-        "Describe a time you wore multiple hats to get something done.",
-        "How do you handle ambiguity and rapid change?",
-        "What would you do in your first 90 days here?"
-    ],
-    'general': [
-        "Tell me about yourself.",
-        "What are your greatest strengths and weaknesses?",
-        "Where do you see yourself in 5 years?",
-        "Why should we hire you?",
-        "Tell me about a challenging project you worked on."
-    ]
-}
 
 
-def get_interview_questions(company, role, num_questions=5):
-    """
-    Get interview questions based on company and role
+# Storage for job applications
+# Every backend implements the same small interface, so the app code does
+# not care whether applications live in memory or in SQLite.
+#
+# Each add/update/delete bumps a store-wide change version. Clients remember
+# the version they last saw and ask for changes_since() instead of
+# re-downloading everything; deletions are kept as tombstones for that.
+class ApplicationStore(ABC):
+    """Interface for job application storage backends"""
     
-    Parameters:
-    company (str): Company name or type
-    role (str): Job role
-    num_questions (int): Number of questions to return
-    """
+    @abstractmethod
+    def add(self, application):
+        """Store a new application"""
     
-    # Normalize company name
-    company_lower = company.lower()
+    @abstractmethod
+    def get(self, application_id):
+        """Return the application with this id, or None"""
     
-    # Select question set
-    if 'google' in company_lower:
-        questions = COMPANY_QUESTIONS['google'].copy()
-    elif 'amazon' in company_lower:
-        questions = COMPANY_QUESTIONS['amazon'].copy()
-    elif 'microsoft' in company_lower:
-        questions = COMPANY_QUESTIONS['microsoft'].copy()
-    elif 'startup' in company_lower or 'small' in company_lower:
-        questions = COMPANY_QUESTIONS['startup'].copy()
-    else:
-        questions = COMPANY_QUESTIONS['general'].copy()
+    @abstractmethod
+    def update(self, application):
+        """Save changes to an existing application"""
+    
+    @abstractmethod
+    def update_status(self, application_id, new_status):
+        """
+        Change an application's status atomically (see update_application_status)
+        
+        The read and the write happen as one step, so concurrent updates
+        from other threads or worker processes are never lost.
+        
+        Parameters:
+        application_id (str): The application to update
+        new_status (str): New status value (ValueError if invalid)
+        
+        Returns:
+        dict: The updated application, or None if it doesn't exist
+        """
+    
+    @abstractmethod
+    def delete(self, application_id):
+        """Delete an application; returns True if it existed"""
+    
+    @abstractmethod
+    def list_applications(self):
+        """Return all applications, newest first (IDs sort by creation time)"""
     
-    # Add role-specific questions
-    role_lower = role.lower()
-    if 'data' in role_lower or 'analyst' in role_lower:
-        questions.append("How do you approach analyzing a large dataset?")
-        questions.append("Explain a time you used data to drive a decision.")
-    elif 'developer' in role_lower or 'engineer' in role_lower:
-        questions.append("Describe your development workflow.")
-        questions.append("How do you ensure code quality?")
+    @abstractmethod
+    def query_applications(self, status=None, company=None, date_from=None, date_to=None,
+                           cursor=None, limit=None):
+        """
+        Return one page of applications, newest first
+        
+        Parameters:
+        status (str): Only applications with this status
+        company (str): Only applications for this company (case-insensitive)
+        date_from (str): Only applications with date_applied on or after this date (YYYY-MM-DD)
+        date_to (str): Only applications with date_applied on or before this date (YYYY-MM-DD)
+        cursor (str): Application id to continue after (the previous page's next_cursor)
+        limit (int): Page size; None returns every match
+        
+        Returns:
+        tuple: (applications, next_cursor, total); next_cursor is None on the
+            last page, total counts every match of the filters (all pages)
+        """
+    
+    @abstractmethod
+    def changes_since(self, version, status=None, company=None, date_from=None, date_to=None,
+                      limit=None):
+        """
+        Return what changed after the given change version
+        
+        With filters, changed applications that no longer match them are
+        reported as deleted, so a filtered view can drop them. With a limit,
+        only the oldest `limit` changes are returned and the version reached
+        is the last one included; ask again from it for the rest.
+        
+        Parameters:
+        version (int): Change version the caller has already seen
+        status, company, date_from, date_to: Same filters as query_applications
+        limit (int): Maximum number of changes (changed plus deleted); None for all
+        
+        Returns:
+        tuple: (changed applications newest first, deleted ids, version reached)
+        """
+    
+    @abstractmethod
+    def current_version(self):
+        """Return the store's change version (increases on every write)"""
+    
+    @abstractmethod
+    def list_due_follow_ups(self, today_date):
+        """Return applications whose follow-up date is on or before today_date"""
     
-    # Return requested number of questions
-    import random
-    random.shuffle(questions)
-    return questions[:num_questions]
+    @abstractmethod
+    def count(self):
+        """Return the number of stored applications"""
 
 
-def analyze_interview_answer(question, answer):
+def _company_key(company):
+    """Normalize a company name for filtering"""
+    return (company or '').strip().lower()
+
+
+def application_matches(application, status=None, company=None, date_from=None, date_to=None):
     """
-    Use AI to analyze the interview answer and provide feedback
+    Check an application against the get-applications filters
     
     Parameters:
-    question (str): The interview question
-    answer (str): User's answer
+    application (dict): The application
+    status (str): Required status
+    company (str): Required company (case-insensitive)
+    date_from (str): Earliest date_applied (YYYY-MM-DD)
+    date_to (str): Latest date_applied (YYYY-MM-DD)
     """
-    
-    try:
-        client = get_groq_client()
-        
-        # Create prompt for AI analysis
-        prompt = f"""You are an expert interview coach. Analyze this interview answer and provide constructive feedback.
+    if status and application['status'] != status:
+        return False
+    if company and _company_key(application.get('company')) != _company_key(company):
+        return False
+    if date_from and application.get('date_applied', '') < date_from:
+        return False
+    if date_to and application.get('date_applied', '') > date_to:
+        return False
+    return True
 
-Question: {question}
 
-Candidate's Answer: {answer}
+def merge_changes(changes, deletions, version, current, limit=None, filters=None):
+    """
+    Combine changed rows and tombstones into a changes_since() result
+    
+    Parameters:
+    changes (list): (version, application) pairs changed after version, oldest first
+    deletions (list): (version, id) pairs deleted after version, oldest first
+    version (int): Change version the caller has already seen
+    current (int): The store's current change version
+    limit (int): Maximum number of changes to return (None for all)
+    filters (dict): application_matches filters; non-matching rows count as deleted
+    """
+    events = heapq.merge(
+        ((changed_at, False, application) for changed_at, application in changes),
+        ((deleted_at, True, application_id) for deleted_at, application_id in deletions),
+        key=lambda event: event[0]
+    )
+    changed = []
+    deleted = []
+    reached = current
+    last = version
+    for count, (changed_at, is_deleted, item) in enumerate(events):
+        if limit is not None and count == limit:
+            # More changes follow; the caller continues from the last one sent
+            reached = last
+            break
+        if is_deleted:
+            deleted.append(item)
+        elif filters and not application_matches(item, **filters):
+            deleted.append(item['id'])
+        else:
+            changed.append(item)
+        last = changed_at
+    changed.sort(key=lambda app: app['id'], reverse=True)
+    return changed, deleted, reached
 
-Provide feedback in the following format:
-1. Content Score (1-10): Rate how well they answered the question
-2. Communication Score (1-10): Rate clarity and structure
-3. Strengths: List 2-3 things they did well
-4. Areas for Improvement: List 2-3 specific suggestions
-5. Better Answer Example: Provide a brief example of a stronger answer
 
-Keep feedback honest but encouraging. Be specific and actionable."""
+class MemoryApplicationStore(ApplicationStore):
+    """
+    In-process storage (the original behaviour): fast, but lost on restart
+    and not shared between gunicorn workers
+    """
+    
+    def __init__(self):
+        self._applications = {}  # id -> application, in insertion order
+        self._version = 0
+        self._changed = OrderedDict()  # id -> version of its last change, oldest first
+        self._deleted = OrderedDict()  # tombstones: id -> version it was deleted at
+        self._lock = threading.Lock()
+    
+    def _record_change(self, application_id, deleted=False):
+        self._version += 1
+        if deleted:
+            self._changed.pop(application_id, None)
+            self._deleted[application_id] = self._version
+        else:
+            self._changed[application_id] = self._version
+            self._changed.move_to_end(application_id)
+    
+    def add(self, application):
+        with self._lock:
+            self._applications[application['id']] = application
+            self._record_change(application['id'])
+    
+    def get(self, application_id):
+        return self._applications.get(application_id)
+    
+    def update(self, application):
+        with self._lock:
+            self._applications[application['id']] = application
+            self._record_change(application['id'])
+    
+    def update_status(self, application_id, new_status):
+        with self._lock:
+            application = self._applications.get(application_id)
+            if application is None:
+                return None
+            application = update_application_status(dict(application), new_status)
+            self._applications[application_id] = application
+            self._record_change(application_id)
+            return application
+    
+    def delete(self, application_id):
+        with self._lock:
+            if self._applications.pop(application_id, None) is None:
+                return False
+            self._record_change(application_id, deleted=True)
+            return True
+    
+    def list_applications(self):
+        # IDs are created in increasing order, so insertion order is creation order
+        return list(reversed(self._applications.values()))
+    
+    def query_applications(self, status=None, company=None, date_from=None, date_to=None,
+                           cursor=None, limit=None):
+        page = []
+        total = 0
+        next_cursor = None
+        for app in reversed(list(self._applications.values())):
+            if not application_matches(app, status, company, date_from, date_to):
+                continue
+            total += 1
+            if cursor and app['id'] >= cursor:
+                continue
+            if limit is not None and len(page) == limit:
+                next_cursor = page[-1]['id']
+            elif next_cursor is None:
+                page.append(app)
+        return page, next_cursor, total
+    
+    def changes_since(self, version, status=None, company=None, date_from=None, date_to=None,
+                      limit=None):
+        with self._lock:
+            changes = []
+            for application_id, changed_at in reversed(self._changed.items()):
+                if changed_at <= version:
+                    break
+                changes.append((changed_at, self._applications[application_id]))
+            deletions = []
+            for application_id, deleted_at in reversed(self._deleted.items()):
+                if deleted_at <= version:
+                    break
+                deletions.append((deleted_at, application_id))
+            current = self._version
+        filters = {'status': status, 'company': company, 'date_from': date_from, 'date_to': date_to}
+        return merge_changes(changes[::-1], deletions[::-1], version, current, limit, filters)
+    
+    def current_version(self):
+        return self._version
+    
+    def list_due_follow_ups(self, today_date):
+        return [
+            app for app in self._applications.values()
+            if app.get('follow_up_date') and app['follow_up_date'] <= today_date
+        ]
+    
+    def count(self):
+        return len(self._applications)
 
-        # Call Groq API
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            model="llama-3.1-8b-instant",  # Faster model
-            temperature=0.7,
-            max_tokens=300
-        )
-        
-        # Extract response
-        feedback = chat_completion.choices[0].message.content
+
+class SQLiteConnectionPool:
+    """
+    Per-process pool of SQLite connections in WAL mode, shared by the
+    SQLite-backed stores; connections are reused across requests
+    """
+    
+    def __init__(self, db_path, pool_size=8, timeout=30):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._pool = None
+        self._pool_pid = None
+        self._pool_lock = threading.Lock()
         
-        # Parse feedback (simple parsing)
-        feedback_sections = {
-            'raw_feedback': feedback,
-            'content_score': extract_score(feedback, 'Content Score'),
-            'communication_score': extract_score(feedback, 'Communication Score')
-        }
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection; commits on success, rolls back on error"""
+        with self._pool_lock:
+            # Connections must not cross a fork (e.g. gunicorn preload)
+            if self._pool_pid != os.getpid():
+                self._pool = queue.LifoQueue(maxsize=self.pool_size)
+                self._pool_pid = os.getpid()
+            pool = self._pool
         
-        return feedback_sections
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
         
-    except Exception as e:
-        # Return fallback feedback if API fails
-        return {
-            'raw_feedback': f"Error: {str(e)}. Please check your API key.",
-            'content_score': 5,
-            'communication_score': 5
-        }
-
-
-def extract_score(text, score_name):
-    """Helper function to extract score from feedback text"""
-    import re
-    pattern = f"{score_name}.*?(\d+)"
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        return int(match.group(1))
-    return 5  # Default score
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            try:
+                pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
 
 
-def detect_filler_words(answer):
+class SQLiteApplicationStore(ApplicationStore):
     """
-    Detect filler words in the answer
+    SQLite storage in WAL mode, shared by every worker process on the host
     
-    Parameters:
-    answer (str): User's answer text
+    The full application is stored as JSON; the columns used for lookups
+    (id, status, company, date_applied, follow_up_date, created_at, version)
+    are copied out and indexed, so fetching by id, filtering a page or
+    collecting recent changes never scans the whole table.
+    IDs are time-sortable, so the primary key also gives newest-first order.
+    Connections are pooled per process and reused across requests.
     """
     
-    filler_words = ['um', 'uh', 'like', 'you know', 'actually', 'basically', 'literally', 'kind of', 'sort of']
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS applications (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            follow_up_date TEXT,
+            created_at TEXT NOT NULL,
+            data TEXT NOT NULL,
+            company TEXT NOT NULL DEFAULT '',
+            date_applied TEXT NOT NULL DEFAULT '',
+            version INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS deleted_applications (
+            id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS store_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO store_meta (key, value) VALUES ('version', 0);
+    """
     
-    answer_lower = answer.lower()
-    found_fillers = {}
+    INDEXES = """
+        CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status);
+        CREATE INDEX IF NOT EXISTS idx_applications_follow_up ON applications (follow_up_date);
+        CREATE INDEX IF NOT EXISTS idx_applications_created ON applications (created_at);
+        CREATE INDEX IF NOT EXISTS idx_applications_company ON applications (company);
+        CREATE INDEX IF NOT EXISTS idx_applications_date_applied ON applications (date_applied);
+        CREATE INDEX IF NOT EXISTS idx_applications_version ON applications (version);
+        CREATE INDEX IF NOT EXISTS idx_deleted_applications_version ON deleted_applications (version);
+    """
     
-    for filler in filler_words:
-        count = answer_lower.count(filler)
-        if count > 0:
-            found_fillers[filler] = count
+    # Columns added after the first release; older databases are upgraded on open
+    MIGRATIONS = {
+        'company': (
+            "ALTER TABLE applications ADD COLUMN company TEXT NOT NULL DEFAULT ''",
+            "UPDATE applications SET company = lower(trim(coalesce(json_extract(data, '$.company'), '')))"
+        ),
+        'date_applied': (
+            "ALTER TABLE applications ADD COLUMN date_applied TEXT NOT NULL DEFAULT ''",
+            "UPDATE applications SET date_applied = coalesce(json_extract(data, '$.date_applied'), '')"
+        ),
+        'version': (
+            "ALTER TABLE applications ADD COLUMN version INTEGER NOT NULL DEFAULT 0",
+        ),
+    }
     
-    total_fillers = sum(found_fillers.values())
+    def __init__(self, db_path, pool_size=8, timeout=30):
+        self.db_path = db_path
+        self._connection = SQLiteConnectionPool(db_path, pool_size, timeout).connection
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(applications)')}
+            for column, statements in self.MIGRATIONS.items():
+                if column not in columns:
+                    for statement in statements:
+                        conn.execute(statement)
+            conn.executescript(self.INDEXES)
     
-    # Calculate confidence score based on filler words
-    word_count = len(answer.split())
-    if word_count > 0:
-        filler_percentage = (total_fillers / word_count) * 100
-        confidence_score = max(0, 100 - (filler_percentage * 10))
-    else:
-        confidence_score = 0
+    @staticmethod
+    def _next_version(conn):
+        # The UPDATE takes the write lock, so versions are unique across processes
+        conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'version'")
+        return conn.execute("SELECT value FROM store_meta WHERE key = 'version'").fetchone()[0]
     
-    return {
-        'filler_words': found_fillers,
-        'total_fillers': total_fillers,
-        'confidence_score': round(confidence_score, 1)
-    }
+    @staticmethod
+    def _row_values(application, version):
+        return (
+            application['status'],
+            application.get('follow_up_date'),
+            application['created_at'],
+            json.dumps(application),
+            _company_key(application.get('company')),
+            application.get('date_applied') or '',
+            version
+        )
+    
+    def add(self, application):
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT INTO applications (status, follow_up_date, created_at, data, company, date_applied, version, id) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                self._row_values(application, self._next_version(conn)) + (application['id'],)
+            )
+    
+    def get(self, application_id):
+        with self._connection() as conn:
+            row = conn.execute('SELECT data FROM applications WHERE id = ?', (application_id,)).fetchone()
+        return json_loads(row[0]) if row else None
+    
+    def update(self, application):
+        with self._connection() as conn:
+            conn.execute(
+                'UPDATE applications SET status = ?, follow_up_date = ?, created_at = ?, data = ?, '
+                'company = ?, date_applied = ?, version = ? WHERE id = ?',
+                self._row_values(application, self._next_version(conn)) + (application['id'],)
+            )
+    
+    def update_status(self, application_id, new_status):
+        with self._connection() as conn:
+            # Take the write lock before reading, so no other process can
+            # change the row between our read and our write
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT data FROM applications WHERE id = ?', (application_id,)).fetchone()
+            if row is None:
+                return None
+            application = update_application_status(json_loads(row[0]), new_status)
+            conn.execute(
+                'UPDATE applications SET status = ?, follow_up_date = ?, created_at = ?, data = ?, '
+                'company = ?, date_applied = ?, version = ? WHERE id = ?',
+                self._row_values(application, self._next_version(conn)) + (application_id,)
+            )
+        return application
+    
+    def delete(self, application_id):
+        with self._connection() as conn:
+            cursor = conn.execute('DELETE FROM applications WHERE id = ?', (application_id,))
+            if cursor.rowcount == 0:
+                return False
+            conn.execute(
+                'INSERT OR REPLACE INTO deleted_applications (id, version) VALUES (?, ?)',
+                (application_id, self._next_version(conn))
+            )
+        return True
+    
+    def list_applications(self):
+        with self._connection() as conn:
+            rows = conn.execute('SELECT data FROM applications ORDER BY id DESC').fetchall()
+        return [json_loads(row[0]) for row in rows]
+    
+    @staticmethod
+    def _filter_clauses(status=None, company=None, date_from=None, date_to=None):
+        clauses = []
+        params = []
+        for clause, value in (
+            ('status = ?', status),
+            ('company = ?', _company_key(company) if company else None),
+            ('date_applied >= ?', date_from),
+            ('date_applied <= ?', date_to),
+        ):
+            if value:
+                clauses.append(clause)
+                params.append(value)
+        return clauses, params
+    
+    def query_applications(self, status=None, company=None, date_from=None, date_to=None,
+                           cursor=None, limit=None):
+        clauses, params = self._filter_clauses(status, company, date_from, date_to)
+        where = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+        count_sql = 'SELECT COUNT(*) FROM applications' + where
+        count_params = list(params)
+        
+        if cursor:
+            clauses.append('id < ?')
+            params.append(cursor)
+        sql = 'SELECT data FROM applications'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY id DESC'
+        if limit is not None:
+            # One extra row tells us whether there is another page
+            sql += ' LIMIT ?'
+            params.append(limit + 1)
+        
+        with self._connection() as conn:
+            # One read transaction, so the count and the page agree
+            conn.execute('BEGIN')
+            rows = conn.execute(sql, params).fetchall()
+            total = conn.execute(count_sql, count_params).fetchone()[0]
+        page = [json_loads(row[0]) for row in rows[:limit]]
+        next_cursor = page[-1]['id'] if limit is not None and len(rows) > limit and page else None
+        return page, next_cursor, total
+    
+    def changes_since(self, version, status=None, company=None, date_from=None, date_to=None,
+                      limit=None):
+        # Fetching limit + 1 of each kind is enough to fill limit changes
+        bound = ' LIMIT ?' if limit is not None else ''
+        params = (version, limit + 1) if limit is not None else (version,)
+        with self._connection() as conn:
+            # Read the version first: anything written meanwhile is simply
+            # returned again by the next call
+            conn.execute('BEGIN')
+            current = self.current_version(conn)
+            rows = conn.execute(
+                'SELECT version, data FROM applications WHERE version > ? ORDER BY version' + bound, params
+            ).fetchall()
+            deleted = conn.execute(
+                'SELECT version, id FROM deleted_applications WHERE version > ? ORDER BY version' + bound, params
+            ).fetchall()
+        filters = {'status': status, 'company': company, 'date_from': date_from, 'date_to': date_to}
+        changes = [(changed_at, json_loads(data)) for changed_at, data in rows]
+        return merge_changes(changes, deleted, version, current, limit, filters)
+    
+    def current_version(self, conn=None):
+        if conn is not None:
+            return conn.execute("SELECT value FROM store_meta WHERE key = 'version'").fetchone()[0]
+        with self._connection() as conn:
+            return self.current_version(conn)
+    
+    def list_due_follow_ups(self, today_date):
+        with self._connection() as conn:
+            rows = conn.execute(
+                'SELECT data FROM applications WHERE follow_up_date <= ? ORDER BY follow_up_date',
+                (today_date,)
+            ).fetchall()
+        return [json_loads(row[0]) for row in rows]
+    
+    def count(self):
+        with self._connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM applications').fetchone()[0]
 
 
-def create_interview_session(company, role):
+def create_application_store(backend='sqlite', db_path=None):
     """
-    Create a new interview session
+    Create a job application store
     
     Parameters:
-    company (str): Company name
-    role (str): Job role
+    backend (str): 'sqlite' (persistent, shared across workers) or 'memory'
+    db_path (str): SQLite database file (for the sqlite backend)
+    """
+    if backend == 'memory':
+        return MemoryApplicationStore()
+    if backend == 'sqlite':
+        return SQLiteApplicationStore(db_path or os.path.join('data', 'careerbot.db'))
+    raise ValueError(f"Unknown application store backend: {backend}")
+
+
+# Running application statistics
+# Instead of recounting every application on each request, the counters
+# are kept up to date from the store's change feed (changes_since), which
+# also picks up writes made by other worker processes.
+FOLLOW_UP_STATUSES = ('Applied', 'Viewed')
+RESPONDED_STATUSES = ('Viewed', 'Interview Scheduled', 'Interviewed', 'Offer')
+
+
+class FollowUpReminderIndex:
     """
+    Priority queue of follow-up dates
     
-    from datetime import datetime
+    A min-heap of (follow_up_date, id). Rescheduling or removing an
+    application leaves its old entry behind as stale (it no longer matches
+    the live date) instead of searching the heap for it; stale entries are
+    skipped and compacted away once they outnumber the live ones.
+    """
     
-    session_id = f"interview_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    def __init__(self):
+        self._dates = {}  # id -> live follow-up date
+        self._heap = []
     
-    questions = get_interview_questions(company, role)
+    def __len__(self):
+        return len(self._dates)
     
-    session = {
-        'session_id': session_id,
-        'company': company,
-        'role': role,
-        'questions': questions,
-        'current_question': 0,
-        'answers': [],
-        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }
+    def schedule(self, application_id, follow_up_date):
+        """Set (or clear, with None) the follow-up date of an application"""
+        if not follow_up_date:
+            self.remove(application_id)
+            return
+        if self._dates.get(application_id) == follow_up_date:
+            return
+        self._dates[application_id] = follow_up_date
+        heapq.heappush(self._heap, (follow_up_date, application_id))
+        self._compact()
     
-    return session
+    def remove(self, application_id):
+        """Forget an application's follow-up"""
+        if self._dates.pop(application_id, None) is not None:
+            self._compact()
+    
+    def _compact(self):
+        if len(self._heap) > 2 * len(self._dates) + 64:
+            self._heap = [(date, app_id) for app_id, date in self._dates.items()]
+            heapq.heapify(self._heap)
+    
+    def next_due_date(self):
+        """Return the earliest scheduled follow-up date, or None"""
+        heap = self._heap
+        while heap and self._dates.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+    
+    def due(self, today_date):
+        """
+        Return ids whose follow-up is on or before today_date, most overdue first
+        
+        Parameters:
+        today_date (str): Today's date in YYYY-MM-DD format
+        """
+        heap = self._heap
+        due = {}
+        # Walk only the part of the heap that is <= today: a node's
+        # children are never earlier than the node itself
+        stack = [0] if heap else []
+        while stack:
+            i = stack.pop()
+            follow_up_date, application_id = heap[i]
+            if follow_up_date > today_date:
+                continue
+            if self._dates.get(application_id) == follow_up_date:
+                due[application_id] = follow_up_date
+            stack.extend(child for child in (2 * i + 1, 2 * i + 2) if child < len(heap))
+        return sorted(due, key=lambda app_id: (due[app_id], app_id))
 
 
-def calculate_overall_score(session):
+class ApplicationStatistics:
     """
-    Calculate overall interview performance score
+    Incrementally maintained job application statistics
     
-    Parameters:
-    session (dict): Interview session with answers
+    Keeps per-status counters, the response-rate numerator and a
+    FollowUpReminderIndex, so statistics cost O(1) and finding the k due
+    follow-ups costs O(k) instead of a scan over every application.
     """
     
-    if not session['answers']:
+    def __init__(self, store):
+        self.store = store
+        self.version = None  # last store version applied
+        self._lock = threading.Lock()
+        self._reset()
+    
+    def _reset(self):
+        self._statuses = {}  # id -> status
+        self.follow_ups = FollowUpReminderIndex()
+        self.status_counts = {}
+        self.responded = 0
+    
+    def _remove(self, application_id):
+        status = self._statuses.pop(application_id, None)
+        if status is None:
+            return
+        self.status_counts[status] -= 1
+        if not self.status_counts[status]:
+            del self.status_counts[status]
+        if status in RESPONDED_STATUSES:
+            self.responded -= 1
+        self.follow_ups.remove(application_id)
+    
+    def _apply(self, application):
+        application_id = application['id']
+        old_status = self._statuses.get(application_id)
+        if old_status is not None:
+            self.status_counts[old_status] -= 1
+            if not self.status_counts[old_status]:
+                del self.status_counts[old_status]
+            if old_status in RESPONDED_STATUSES:
+                self.responded -= 1
+        
+        status = application['status']
+        self._statuses[application_id] = status
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if status in RESPONDED_STATUSES:
+            self.responded += 1
+        
+        # Follows the rescheduling done by update_application_status:
+        # a new date moves the reminder, None (or a final status) drops it
+        if status in FOLLOW_UP_STATUSES:
+            self.follow_ups.schedule(application_id, application.get('follow_up_date'))
+        else:
+            self.follow_ups.remove(application_id)
+    
+    def sync(self):
+        """Apply the store's changes since the last call; returns the version reached"""
+        with self._lock:
+            version = self.store.current_version()
+            if version == self.version:
+                return version
+            if self.version is None:
+                # First use: the version was read before the rows, so
+                # nothing written in between is missed by the next delta
+                self._reset()
+                for application in self.store.list_applications():
+                    self._apply(application)
+            else:
+                changed, deleted, version = self.store.changes_since(self.version)
+                for application in changed:
+                    self._apply(application)
+                for application_id in deleted:
+                    self._remove(application_id)
+            self.version = version
+            return version
+    
+    def due_follow_ups(self, today_date, sync=True):
+        """
+        Return ids of applications whose follow-up is due, most overdue first
+        
+        Parameters:
+        today_date (str): Today's date in YYYY-MM-DD format
+        sync (bool): Pull the store's latest changes first
+        """
+        if sync:
+            self.sync()
+        with self._lock:
+            return self.follow_ups.due(today_date)
+    
+    def get_statistics(self, today_date=None):
+        """
+        Same result as get_application_statistics, without touching every application
+        
+        Parameters:
+        today_date (str): Today's date in YYYY-MM-DD format
+        """
+        if today_date is None:
+            today_date = datetime.now().strftime('%Y-%m-%d')
+        pending = len(self.due_follow_ups(today_date))
+        
+        with self._lock:
+            total = len(self._statuses)
+            if total == 0:
+                return {
+                    'total_applications': 0,
+                    'status_breakdown': {},
+                    'response_rate': 0,
+                    'pending_follow_ups': 0
+                }
+            status_counts = dict(self.status_counts)
+            responded = self.responded
+        
+        return {
+            'total_applications': total,
+            'status_breakdown': status_counts,
+            'response_rate': round((responded / total) * 100, 1),
+            'pending_follow_ups': pending,
+            'interviews': status_counts.get('Interview Scheduled', 0) + status_counts.get('Interviewed', 0),
+            'offers': status_counts.get('Offer', 0),
+            'rejections': status_counts.get('Rejected', 0)
+        }
+
+
+class ReminderScheduler:
+    """
+    Keeps today's follow-up reminders ready and pushes new ones as they fall due
+    
+    get_reminders() rebuilds the list only when the date or the store
+    version changes, from the k due applications. A background thread
+    (start()) re-checks every `interval` seconds and calls
+    on_due(reminders) with reminders not pushed yet today.
+    
+    With lock_path, only the process holding an exclusive lock on that file
+    runs the thread, so N web workers don't push every reminder N times.
+    (Without fcntl, e.g. on Windows, every process runs its own.)
+    """
+    
+    def __init__(self, statistics, interval=60, on_due=None, lock_path=None):
+        self.statistics = statistics
+        self.store = statistics.store
+        self.interval = interval
+        self.on_due = on_due
+        self.last_error = None
+        self._cache_key = None  # (today, version) the cached reminders were built for
+        self._reminders = []
+        self._notified = set()  # ids pushed to on_due on _notified_date
+        self._notified_date = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._thread_pid = None
+        self.lock_path = lock_path
+        self._lock_file = None  # Kept open while this process is the leader
+        self._lock_pid = None
+        self._lock_retry = (None, 0.0)  # (pid, monotonic time of the next attempt)
+    
+    def get_reminders(self, today_date=None):
+        """
+        Return today's reminders (same format as get_follow_up_reminders)
+        
+        Parameters:
+        today_date (str): Today's date in YYYY-MM-DD format
+        """
+        if today_date is None:
+            today_date = datetime.now().strftime('%Y-%m-%d')
+        
+        # Data read after the sync is at least this version, so caching
+        # under it can only be too new, never stale
+        key = (today_date, self.statistics.sync())
+        with self._lock:
+            if key == self._cache_key:
+                return self._reminders
+        
+        due_ids = self.statistics.due_follow_ups(today_date, sync=False)
+        due_applications = [app for app in map(self.store.get, due_ids) if app]
+        reminders = get_follow_up_reminders(due_applications, today_date)
+        
+        with self._lock:
+            self._cache_key = key
+            self._reminders = reminders
+        return reminders
+    
+    def run_pending(self, today_date=None):
+        """Refresh the reminders and push the ones that became due; returns them"""
+        if today_date is None:
+            today_date = datetime.now().strftime('%Y-%m-%d')
+        reminders = self.get_reminders(today_date)
+        
+        with self._lock:
+            if self._notified_date != today_date:
+                self._notified = set()
+                self._notified_date = today_date
+            new_reminders = [r for r in reminders if r['application']['id'] not in self._notified]
+            self._notified.update(r['application']['id'] for r in new_reminders)
+        
+        if new_reminders and self.on_due:
+            self.on_due(new_reminders)
+        return new_reminders
+    
+    def _run(self):
+        while True:
+            try:
+                self.run_pending()
+                self.last_error = None
+            except Exception as e:
+                # Keep running: a locked database or a failing callback
+                # should only delay reminders, not stop them
+                self.last_error = e
+            if self._stop.wait(self.interval):
+                return
+    
+    def start(self):
+        """
+        Start the background thread (again, if this process was forked)
+        
+        Processes that don't get the lock file retry at most every
+        `interval` seconds, so another one takes over if the leader exits.
+        Returns True if the thread runs in this process.
+        """
+        if self._thread_pid == os.getpid() and self._thread.is_alive():
+            return True
+        with self._lock:
+            if self._thread_pid == os.getpid() and self._thread.is_alive():
+                return True
+            if not self._acquire_leadership():
+                return False
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='reminder-scheduler', daemon=True)
+            self._thread_pid = os.getpid()
+            self._thread.start()
+            return True
+    
+    def _acquire_leadership(self):
+        """Take the exclusive lock on lock_path without waiting (caller holds self._lock)"""
+        pid = os.getpid()
+        if self.lock_path is None or fcntl is None or self._lock_pid == pid:
+            return True
+        if self._lock_retry[0] == pid and time.monotonic() < self._lock_retry[1]:
+            return False
+        
+        lock_file = open(self.lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            self._lock_retry = (pid, time.monotonic() + self.interval)
+            return False
+        # Released by the OS when this process exits
+        self._lock_file = lock_file
+        self._lock_pid = pid
+        return True
+    
+    def stop(self):
+        """Stop the background thread"""
+        self._stop.set()
+        if self._thread is not None and self._thread_pid == os.getpid():
+            self._thread.join()
+
+
+# Clients are created once and reused, so every feedback request shares a
+# pool of keep-alive connections instead of paying for a new TCP + TLS
+# handshake. Failed calls (connection errors, 408/429/5xx) are retried by
+# the SDK with exponential backoff.
+GROQ_MODEL = "llama-3.1-8b-instant"  # Faster model
+_groq_clients = {}  # (pid, api key) -> Groq
+_groq_client_lock = threading.Lock()
+_async_groq_clients = weakref.WeakKeyDictionary()  # event loop -> AsyncGroq
+
+
+def get_groq_api_key():
+    """Return the Groq API key from the environment"""
+    api_key = os.getenv('GROQ_API_KEY')
+    if not api_key:
+        raise Exception("GROQ_API_KEY not found in environment variables")
+    return api_key
+
+
+def get_llm_client_options(prefix='GROQ_'):
+    """
+    Timeouts, connection limits and retries for an LLM API client
+    
+    Read from <prefix>TIMEOUT, <prefix>CONNECT_TIMEOUT (seconds),
+    <prefix>MAX_CONNECTIONS and <prefix>MAX_RETRIES; unset values use the
+    defaults (30s, 5s, 20 connections, 2 retries)
+    
+    Parameters:
+    prefix (str): Environment variable prefix, e.g. 'GROQ_' or 'OPENAI_'
+    """
+    max_connections = int(os.getenv(prefix + 'MAX_CONNECTIONS', '20'))
+    return {
+        'timeout': httpx.Timeout(
+            float(os.getenv(prefix + 'TIMEOUT', '30')),
+            connect=float(os.getenv(prefix + 'CONNECT_TIMEOUT', '5'))
+        ),
+        'limits': httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=60
+        ),
+        'max_retries': int(os.getenv(prefix + 'MAX_RETRIES', '2'))
+    }
+
+
+def get_groq_client():
+    """Return the process-wide Groq client (created on first use)"""
+    api_key = get_groq_api_key()
+    key = (os.getpid(), api_key)
+    client = _groq_clients.get(key)
+    if client is None:
+        with _groq_client_lock:
+            client = _groq_clients.get(key)
+            if client is None:
+                # Drop clients inherited from a parent process or made with an old key
+                _groq_clients.clear()
+                options = get_llm_client_options('GROQ_')
+                client = Groq(
+                    api_key=api_key,
+                    max_retries=options['max_retries'],
+                    http_client=DefaultHttpxClient(timeout=options['timeout'], limits=options['limits'])
+                )
+                _groq_clients[key] = client
+    return client
+
+
+def get_async_groq_client():
+    """
+    Return the AsyncGroq client for the running event loop
+    
+    Async connection pools belong to one event loop, so there is one
+    client per loop; it goes away with the loop.
+    """
+    api_key = get_groq_api_key()
+    loop = asyncio.get_running_loop()
+    client = _async_groq_clients.get(loop)
+    if client is None or client.api_key != api_key:
+        options = get_llm_client_options('GROQ_')
+        client = AsyncGroq(
+            api_key=api_key,
+            max_retries=options['max_retries'],
+            http_client=DefaultAsyncHttpxClient(timeout=options['timeout'], limits=options['limits'])
+        )
+        _async_groq_clients[loop] = client
+    return client
+
+
+# Interview question bank (questions tagged by company, role family,
+# difficulty and competency). Lives in a data file so companies and
+# questions can be added without code changes.
+QUESTION_BANK_PATH = os.getenv(
+    'QUESTION_BANK_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'question_bank.json')
+)
+
+QUESTION_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-'&.+][a-z0-9]+)*")
+
+_question_bank = None
+_question_bank_lock = threading.Lock()
+
+
+def tokenize_name(name):
+    """Lowercase words of a company or role name (punctuation dropped)"""
+    return QUESTION_TOKEN_PATTERN.findall(name.lower())
+
+
+class WeightedPool:
+    """
+    Immutable set of question ids with precomputed alias tables (Vose's
+    alias method), so each weighted draw costs O(1) regardless of size
+    """
+    
+    def __init__(self, ids, weights):
+        self.ids = tuple(ids)
+        self.total_weight = float(sum(weights))
+        size = len(self.ids)
+        
+        probabilities = [0.0] * size
+        aliases = list(range(size))
+        scaled = [weight * size / self.total_weight for weight in weights] if size else []
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probabilities[low] = scaled[low]
+            aliases[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        for i in small + large:
+            probabilities[i] = 1.0
+        
+        self.probabilities = tuple(probabilities)
+        self.aliases = tuple(aliases)
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def draw(self, rng):
+        """Return one id, chosen with probability proportional to its weight"""
+        i = rng.randrange(len(self.ids))
+        return self.ids[i] if rng.random() < self.probabilities[i] else self.ids[self.aliases[i]]
+
+
+class QuestionBank:
+    """
+    Immutable, indexed interview question bank
+    
+    Questions are indexed by company, role family, difficulty and
+    competency. Questions with neither companies nor role families form the
+    'general' set used for companies the bank doesn't know; questions with
+    role families are added for matching roles at any company. Company and role names are
+    matched word by word against the aliases and keywords in the file, so
+    lookups don't slow down as companies are added.
+    """
+    
+    def __init__(self, bank_data, mtime=0):
+        self.mtime = mtime
+        self.questions = tuple(
+            MappingProxyType({
+                'id': i,
+                'text': entry['text'],
+                'companies': tuple(company.lower() for company in entry.get('companies', [])),
+                'role_families': tuple(entry.get('role_families', [])),
+                'difficulty': entry.get('difficulty', 'medium'),
+                'competencies': tuple(entry.get('competencies', [])),
+                'weight': float(entry.get('weight', 1))
+            })
+            for i, entry in enumerate(bank_data.get('questions', []))
+        )
+        
+        # Company aliases and role keywords, matched on whole words
+        self.company_aliases = {}
+        for company, aliases in bank_data.get('companies', {}).items():
+            for alias in [company] + list(aliases):
+                self.company_aliases[' '.join(tokenize_name(alias))] = company.lower()
+        # Earlier role families win when a role matches several ("Data Engineer")
+        self.role_keywords = {}
+        for rank, (family, keywords) in enumerate(bank_data.get('role_families', {}).items()):
+            for keyword in keywords:
+                self.role_keywords.setdefault(' '.join(tokenize_name(keyword)), (rank, family))
+        self._max_phrase_words = max(
+            [len(phrase.split()) for phrase in list(self.company_aliases) + list(self.role_keywords)] or [1]
+        )
+        
+        by_company, by_role_family, by_difficulty, by_competency = {}, {}, {}, {}
+        for question in self.questions:
+            if question['weight'] <= 0:
+                continue
+            # Role-specific questions reach every company through their role family pool
+            for company in question['companies'] or (() if question['role_families'] else ('general',)):
+                by_company.setdefault(company, []).append(question['id'])
+            for family in question['role_families']:
+                by_role_family.setdefault(family, []).append(question['id'])
+            by_difficulty.setdefault(question['difficulty'], []).append(question['id'])
+            for competency in question['competencies']:
+                by_competency.setdefault(competency, []).append(question['id'])
+        
+        self.by_company = self._build_pools(by_company)
+        self.by_role_family = self._build_pools(by_role_family)
+        self.by_difficulty = MappingProxyType({key: frozenset(ids) for key, ids in by_difficulty.items()})
+        self.by_competency = MappingProxyType({key: frozenset(ids) for key, ids in by_competency.items()})
+    
+    def _build_pools(self, index):
+        return MappingProxyType({
+            key: WeightedPool(ids, [self.questions[i]['weight'] for i in ids])
+            for key, ids in index.items()
+        })
+    
+    def _phrases(self, name):
+        """Every run of up to _max_phrase_words consecutive words in name"""
+        words = tokenize_name(name)
+        for size in range(1, self._max_phrase_words + 1):
+            for start in range(len(words) - size + 1):
+                yield ' '.join(words[start:start + size])
+    
+    def match_company(self, company):
+        """Return the bank's key for a company name, or 'general' if unknown"""
+        for phrase in self._phrases(company):
+            if phrase in self.company_aliases:
+                return self.company_aliases[phrase]
+        return 'general'
+    
+    def match_role_family(self, role):
+        """Return the role family for a job title, or None if none matches"""
+        matches = [self.role_keywords[phrase] for phrase in self._phrases(role) if phrase in self.role_keywords]
+        return min(matches)[1] if matches else None
+    
+    def select(self, company, role, num_questions=5, difficulty=None, competency=None, seed=None):
+        """
+        Pick questions for an interview by weighted sampling without replacement
+        
+        Draws come from the company's (or general) pool and the role
+        family's pool in proportion to their total weight, using the alias
+        tables; repeats and questions failing the filters are redrawn.
+        When redraws pile up (a small pool or a narrow filter) the rest is
+        picked exactly from the remaining candidates instead.
+        
+        Parameters:
+        company (str): Company name or type
+        role (str): Job role
+        num_questions (int): Number of questions to return
+        difficulty (str): Only questions of this difficulty (optional)
+        competency (str): Only questions testing this competency (optional)
+        seed (int): Random seed; the same seed and bank give the same questions
+        """
+        rng = random.Random(seed)
+        family = self.match_role_family(role)
+        pools = [self.by_company.get(self.match_company(company))]
+        if family is not None:
+            pools.append(self.by_role_family.get(family))
+        pools = [pool for pool in pools if pool]
+        
+        allowed = None
+        if difficulty is not None:
+            allowed = self.by_difficulty.get(difficulty, frozenset())
+        if competency is not None:
+            matching = self.by_competency.get(competency, frozenset())
+            allowed = matching if allowed is None else allowed & matching
+        
+        def accept(question_id):
+            roles = self.questions[question_id]['role_families']
+            return (allowed is None or question_id in allowed) and (not roles or family in roles)
+        
+        total_weight = sum(pool.total_weight for pool in pools)
+        chosen = []
+        seen = set()
+        attempts = 4 * num_questions + 16
+        while pools and len(chosen) < num_questions and attempts > 0:
+            attempts -= 1
+            target = rng.random() * total_weight
+            for pool in pools:
+                target -= pool.total_weight
+                if target < 0:
+                    break
+            question_id = pool.draw(rng)
+            if question_id not in seen:
+                seen.add(question_id)
+                if accept(question_id):
+                    chosen.append(question_id)
+        
+        if len(chosen) < num_questions:
+            # Exact weighted sampling without replacement over what's left
+            # (Efraimidis-Spirakis: keep the largest u ** (1 / weight))
+            picked = set(chosen)
+            weights = {}
+            for pool in pools:
+                for question_id in pool.ids:
+                    if question_id not in picked:
+                        weights[question_id] = weights.get(question_id, 0.0) + self.questions[question_id]['weight']
+            candidates = [
+                (rng.random() ** (1.0 / weight), question_id)
+                for question_id, weight in sorted(weights.items())
+                if accept(question_id)
+            ]
+            chosen.extend(question_id for _, question_id in heapq.nlargest(num_questions - len(chosen), candidates))
+        
+        return [self.questions[question_id] for question_id in chosen]
+    
+    def stats(self):
+        """Return the size of the bank and its indexes"""
+        return {
+            'questions': len(self.questions),
+            'companies': len(self.by_company),
+            'role_families': len(self.by_role_family),
+            'difficulties': sorted(self.by_difficulty),
+            'competencies': sorted(self.by_competency)
+        }
+
+
+def load_question_bank(path=None):
+    """
+    Load and index the question bank file
+    
+    Parameters:
+    path (str): Path to the question bank JSON file (defaults to QUESTION_BANK_PATH)
+    """
+    path = path or QUESTION_BANK_PATH
+    mtime = os.path.getmtime(path)
+    with open(path, 'r', encoding='utf-8') as file:
+        bank_data = json.load(file)
+    return QuestionBank(bank_data, mtime)
+
+
+def get_question_bank():
+    """
+    Return the current question bank, reloading it when the file changes
+    (the same way as get_skill_taxonomy)
+    """
+    global _question_bank
+    
+    bank = _question_bank
+    try:
+        mtime = os.path.getmtime(QUESTION_BANK_PATH)
+    except OSError:
+        if bank is not None:
+            return bank
+        raise
+    
+    if bank is not None and bank.mtime == mtime:
+        return bank
+    
+    with _question_bank_lock:
+        if _question_bank is not None and _question_bank.mtime == mtime:
+            return _question_bank
+        try:
+            _question_bank = load_question_bank(QUESTION_BANK_PATH)
+        except (OSError, ValueError, KeyError):
+            if _question_bank is None:
+                raise
+        return _question_bank
+
+
+def get_interview_questions(company, role, num_questions=5, difficulty=None, competency=None, seed=None):
+    """
+    Get interview questions based on company and role
+    
+    Parameters:
+    company (str): Company name or type
+    role (str): Job role
+    num_questions (int): Number of questions to return
+    difficulty (str): Only questions of this difficulty (optional)
+    competency (str): Only questions testing this competency (optional)
+    seed (int): Random seed, for a reproducible selection
+    """
+    questions = get_question_bank().select(
+        company, role, num_questions,
+        difficulty=difficulty, competency=competency, seed=seed
+    )
+    return [question['text'] for question in questions]
+
+
+def build_feedback_request(question, answer, model=GROQ_MODEL):
+    """
+    Build the chat completion arguments for analyzing an interview answer
+    
+    Parameters:
+    question (str): The interview question
+    answer (str): User's answer
+    model (str): Model name
+    """
+    
+    # Create prompt for AI analysis
+    prompt = f"""You are an expert interview coach. Analyze this interview answer and provide constructive feedback.
+
+Question: {question}
+
+Candidate's Answer: {answer}
+
+Provide feedback in the following format:
+1. Content Score (1-10): Rate how well they answered the question
+2. Communication Score (1-10): Rate clarity and structure
+3. Strengths: List 2-3 things they did well
+4. Areas for Improvement: List 2-3 specific suggestions
+5. Better Answer Example: Provide a brief example of a stronger answer
+
+Keep feedback honest but encouraging. Be specific and actionable."""
+
+    return {
+        'messages': [
+            {
+                "role": "user",
+                "content": prompt,
+            }
+        ],
+        'model': model,
+        'temperature': 0.7,
+        'max_tokens': 300
+    }
+
+
+def parse_interview_feedback(feedback):
+    """Split the AI feedback text into the raw text and its scores"""
+    
+    # Parse feedback (simple parsing)
+    return {
+        'raw_feedback': feedback,
+        'content_score': extract_score(feedback, 'Content Score'),
+        'communication_score': extract_score(feedback, 'Communication Score')
+    }
+
+
+def get_fallback_feedback(error):
+    """Feedback returned when the AI call fails"""
+    return {
+        'raw_feedback': f"Error: {str(error)}. Please check your API key.",
+        'content_score': 5,
+        'communication_score': 5,
+        'error': str(error)
+    }
+
+
+# Feedback backends
+# Every backend turns (question, answer) into feedback text in the format
+# requested by build_feedback_request, so they can be swapped or combined:
+# Groq (default), any OpenAI-compatible HTTP API, and a local mock for
+# load testing without an API key. LLM_BACKEND picks one, or several
+# separated by commas to route between them by measured latency.
+class FeedbackBackend(ABC):
+    """Interface for interview feedback generators"""
+    
+    name = 'backend'
+    
+    @abstractmethod
+    def generate(self, question, answer):
+        """Return the complete feedback text"""
+    
+    def stream(self, question, answer):
+        """Yield the feedback text in chunks as it is generated"""
+        yield self.generate(question, answer)
+    
+    async def generate_async(self, question, answer):
+        """Async version of generate()"""
+        return await asyncio.to_thread(self.generate, question, answer)
+    
+    def stats(self):
+        """Return backend metrics"""
+        return {'name': self.name}
+
+
+class GroqBackend(FeedbackBackend):
+    """Groq chat completions (uses the process-wide pooled clients)"""
+    
+    name = 'groq'
+    
+    def __init__(self, model=GROQ_MODEL):
+        self.model = model
+    
+    def generate(self, question, answer):
+        chat_completion = get_groq_client().chat.completions.create(
+            **build_feedback_request(question, answer, model=self.model)
+        )
+        return chat_completion.choices[0].message.content
+    
+    def stream(self, question, answer):
+        request = build_feedback_request(question, answer, model=self.model)
+        with get_groq_client().chat.completions.create(stream=True, **request) as stream:
+            for chunk in stream:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    yield text
+    
+    async def generate_async(self, question, answer):
+        chat_completion = await get_async_groq_client().chat.completions.create(
+            **build_feedback_request(question, answer, model=self.model)
+        )
+        return chat_completion.choices[0].message.content
+
+
+class OpenAICompatibleBackend(FeedbackBackend):
+    """
+    Any OpenAI-compatible chat completions API (OpenAI, vLLM, Ollama,
+    LM Studio, ...), pooled like Groq; timeouts and retries come from
+    OPENAI_TIMEOUT, OPENAI_CONNECT_TIMEOUT, OPENAI_MAX_RETRIES and
+    OPENAI_MAX_CONNECTIONS
+    """
+    
+    name = 'openai'
+    
+    def __init__(self, base_url=None, api_key=None, model=None):
+        self.base_url = base_url or os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY') or 'not-needed'  # local servers ignore it
+        self.model = model or os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+        self._client = None
+        self._client_pid = None
+        self._async_clients = weakref.WeakKeyDictionary()  # event loop -> AsyncOpenAI
+        self._lock = threading.Lock()
+    
+    def _get_client(self):
+        if self._client_pid != os.getpid():
+            with self._lock:
+                if self._client_pid != os.getpid():
+                    options = get_llm_client_options('OPENAI_')
+                    self._client = OpenAI(
+                        base_url=self.base_url,
+                        api_key=self.api_key,
+                        max_retries=options['max_retries'],
+                        http_client=httpx.Client(timeout=options['timeout'], limits=options['limits'])
+                    )
+                    self._client_pid = os.getpid()
+        return self._client
+    
+    def _get_async_client(self):
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            options = get_llm_client_options('OPENAI_')
+            client = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                max_retries=options['max_retries'],
+                http_client=httpx.AsyncClient(timeout=options['timeout'], limits=options['limits'])
+            )
+            self._async_clients[loop] = client
+        return client
+    
+    def generate(self, question, answer):
+        chat_completion = self._get_client().chat.completions.create(
+            **build_feedback_request(question, answer, model=self.model)
+        )
+        return chat_completion.choices[0].message.content
+    
+    def stream(self, question, answer):
+        request = build_feedback_request(question, answer, model=self.model)
+        with self._get_client().chat.completions.create(stream=True, **request) as stream:
+            for chunk in stream:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    yield text
+    
+    async def generate_async(self, question, answer):
+        chat_completion = await self._get_async_client().chat.completions.create(
+            **build_feedback_request(question, answer, model=self.model)
+        )
+        return chat_completion.choices[0].message.content
+
+
+class MockBackend(FeedbackBackend):
+    """
+    Local rule-based stand-in for an LLM
+    
+    Scores come from simple answer features (length, structure words,
+    numbers, filler words), so the same answer always gets the same
+    feedback. Each call waits `latency` seconds plus up to `jitter`
+    seconds (seeded, so runs are reproducible) to mimic a real API.
+    """
+    
+    name = 'mock'
+    STRUCTURE_WORDS = ('situation', 'task', 'action', 'result', 'because', 'learned', 'impact', 'improved')
+    
+    def __init__(self, latency=None, jitter=None, seed=0):
+        self.latency = float(os.getenv('MOCK_LLM_LATENCY', '0.5')) if latency is None else latency
+        self.jitter = float(os.getenv('MOCK_LLM_JITTER', '0.2')) if jitter is None else jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def _delay(self):
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+    
+    def feedback_text(self, question, answer):
+        """Build feedback text in the format the real backends are asked for"""
+        words = answer.split()
+        answer_lower = answer.lower()
+        structure = [word for word in self.STRUCTURE_WORDS if word in answer_lower]
+        fillers = detect_filler_words(answer)['total_fillers']
+        has_numbers = any(char.isdigit() for char in answer)
+        
+        content_score = max(1, min(10, 3 + min(len(words), 150) // 30 + len(structure) + has_numbers))
+        communication_score = max(1, min(10, 8 - fillers + (1 if 40 <= len(words) <= 200 else -1)))
+        
+        strengths = []
+        if structure:
+            strengths.append(f"Clear structure ({', '.join(structure[:3])})")
+        if has_numbers:
+            strengths.append("Uses concrete numbers")
+        if len(words) >= 40:
+            strengths.append("Gives enough detail")
+        improvements = []
+        if fillers:
+            improvements.append(f"Cut the {fillers} filler word{'s' if fillers != 1 else ''}")
+        if not has_numbers:
+            improvements.append("Quantify the result")
+        if len(structure) < 2:
+            improvements.append("Use the STAR method (Situation, Task, Action, Result)")
+        
+        return (
+            f"1. Content Score (1-10): {content_score}\n"
+            f"2. Communication Score (1-10): {communication_score}\n"
+            f"3. Strengths: {'; '.join(strengths) or 'Answered the question directly'}\n"
+            f"4. Areas for Improvement: {'; '.join(improvements) or 'Keep practicing the delivery'}\n"
+            f"5. Better Answer Example: Describe the situation, what you did, and the measurable result for: {question}\n"
+        )
+    
+    def generate(self, question, answer):
+        time.sleep(self._delay())
+        return self.feedback_text(question, answer)
+    
+    def stream(self, question, answer):
+        text = self.feedback_text(question, answer)
+        chunks = [text[i:i + 16] for i in range(0, len(text), 16)]
+        delay = self._delay() / len(chunks)
+        for chunk in chunks:
+            time.sleep(delay)
+            yield chunk
+    
+    async def generate_async(self, question, answer):
+        await asyncio.sleep(self._delay())
+        return self.feedback_text(question, answer)
+
+
+class LatencyRouter(FeedbackBackend):
+    """
+    Sends each request to the backend with the lowest recent latency
+    
+    Latency is an exponentially weighted moving average per backend.
+    Backends without a sample are tried first, and every `explore_every`
+    calls the others are tried too, so a recovered backend can win back
+    traffic. A failing backend gets a latency penalty and the request
+    moves on to the next one.
+    """
+    
+    name = 'router'
+    
+    def __init__(self, backends, alpha=0.2, explore_every=20, failure_penalty=30.0):
+        self.backends = list(backends)
+        self.alpha = alpha
+        self.explore_every = explore_every
+        self.failure_penalty = failure_penalty
+        self.latency = {backend.name: None for backend in self.backends}
+        self.requests = {backend.name: 0 for backend in self.backends}
+        self.failures = {backend.name: 0 for backend in self.backends}
+        self._calls = 0
+        self._lock = threading.Lock()
+    
+    def _order(self):
+        with self._lock:
+            self._calls += 1
+            ordered = sorted(
+                self.backends,
+                key=lambda backend: -1 if self.latency[backend.name] is None else self.latency[backend.name]
+            )
+            if self.explore_every and self._calls % self.explore_every == 0:
+                # Give the second best a turn to re-measure
+                ordered = ordered[1:2] + ordered[:1] + ordered[2:]
+        return ordered
+    
+    def _record(self, backend, seconds, failed=False):
+        with self._lock:
+            self.requests[backend.name] += 1
+            if failed:
+                self.failures[backend.name] += 1
+                seconds = max(seconds, self.failure_penalty)
+            previous = self.latency[backend.name]
+            self.latency[backend.name] = seconds if previous is None else \
+                (1 - self.alpha) * previous + self.alpha * seconds
+    
+    def generate(self, question, answer):
+        error = None
+        for backend in self._order():
+            started = time.monotonic()
+            try:
+                text = backend.generate(question, answer)
+            except Exception as e:
+                self._record(backend, time.monotonic() - started, failed=True)
+                error = e
+                continue
+            self._record(backend, time.monotonic() - started)
+            return text
+        raise error
+    
+    def stream(self, question, answer):
+        error = None
+        for backend in self._order():
+            started = time.monotonic()
+            chunks = backend.stream(question, answer)
+            try:
+                first = next(chunks, '')
+            except Exception as e:
+                # Nothing was sent yet, so another backend can take over
+                self._record(backend, time.monotonic() - started, failed=True)
+                error = e
+                continue
+            try:
+                yield first
+                yield from chunks
+            except GeneratorExit:
+                raise
+            except Exception:
+                self._record(backend, time.monotonic() - started, failed=True)
+                raise
+            self._record(backend, time.monotonic() - started)
+            return
+        raise error
+    
+    async def generate_async(self, question, answer):
+        error = None
+        for backend in self._order():
+            started = time.monotonic()
+            try:
+                text = await backend.generate_async(question, answer)
+            except Exception as e:
+                self._record(backend, time.monotonic() - started, failed=True)
+                error = e
+                continue
+            self._record(backend, time.monotonic() - started)
+            return text
+        raise error
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'backends': [
+                    {
+                        'name': backend.name,
+                        'latency_ms': None if self.latency[backend.name] is None else round(self.latency[backend.name] * 1000, 1),
+                        'requests': self.requests[backend.name],
+                        'failures': self.failures[backend.name]
+                    }
+                    for backend in self.backends
+                ]
+            }
+
+
+FEEDBACK_BACKENDS = {
+    'groq': GroqBackend,
+    'openai': OpenAICompatibleBackend,
+    'mock': MockBackend
+}
+_feedback_backend = None
+_feedback_backend_spec = None
+_feedback_backend_lock = threading.Lock()
+
+
+def create_feedback_backend(spec):
+    """
+    Create a feedback backend from a name, or comma-separated names for a LatencyRouter
+    
+    Parameters:
+    spec (str): e.g. 'groq', 'mock' or 'groq,openai'
+    """
+    names = list(dict.fromkeys(name.strip().lower() for name in spec.split(',') if name.strip()))
+    unknown = [name for name in names if name not in FEEDBACK_BACKENDS]
+    if not names or unknown:
+        raise ValueError(f"Unknown LLM backend: {', '.join(unknown) or spec!r}. Choose from: {', '.join(FEEDBACK_BACKENDS)}")
+    backends = [FEEDBACK_BACKENDS[name]() for name in names]
+    return backends[0] if len(backends) == 1 else LatencyRouter(backends)
+
+
+def get_feedback_backend():
+    """Return the process-wide feedback backend selected by LLM_BACKEND (default: groq)"""
+    global _feedback_backend, _feedback_backend_spec
+    spec = os.getenv('LLM_BACKEND', 'groq')
+    backend = _feedback_backend
+    if backend is None or spec != _feedback_backend_spec:
+        with _feedback_backend_lock:
+            # Another thread may have created it while we waited
+            if _feedback_backend is None or spec != _feedback_backend_spec:
+                _feedback_backend = create_feedback_backend(spec)
+                _feedback_backend_spec = spec
+            backend = _feedback_backend
+    return backend
+
+
+def analyze_interview_answer(question, answer, backend=None):
+    """
+    Use AI to analyze the interview answer and provide feedback
+    
+    Parameters:
+    question (str): The interview question
+    answer (str): User's answer
+    backend (FeedbackBackend): Feedback generator (default: get_feedback_backend())
+    """
+    
+    try:
+        backend = backend or get_feedback_backend()
+        return parse_interview_feedback(backend.generate(question, answer))
+        
+    except Exception as e:
+        # Return fallback feedback if API fails
+        return get_fallback_feedback(e)
+
+
+def stream_interview_answer(question, answer, backend=None):
+    """
+    Stream AI feedback for an interview answer
+    
+    Yields ('token', text) as the completion arrives, ('score', {key: value})
+    as soon as each score is complete, and finally ('feedback', dict) with
+    the same result analyze_interview_answer returns
+    
+    Parameters:
+    question (str): The interview question
+    answer (str): User's answer
+    backend (FeedbackBackend): Feedback generator (default: get_feedback_backend())
+    """
+    
+    parser = FeedbackScoreParser()
+    try:
+        backend = backend or get_feedback_backend()
+        for text in backend.stream(question, answer):
+            yield 'token', text
+            scores = parser.feed(text)
+            if scores:
+                yield 'score', scores
+    except Exception as e:
+        # Return fallback feedback if API fails
+        yield 'feedback', get_fallback_feedback(e)
+        return
+    
+    yield 'feedback', parser.finish()
+
+
+async def analyze_interview_answer_async(question, answer, backend=None):
+    """
+    Async version of analyze_interview_answer, so one worker can have
+    many feedback requests in flight (e.g. with asyncio.gather)
+    
+    Parameters:
+    question (str): The interview question
+    answer (str): User's answer
+    backend (FeedbackBackend): Feedback generator (default: get_feedback_backend())
+    """
+    
+    try:
+        backend = backend or get_feedback_backend()
+        return parse_interview_feedback(await backend.generate_async(question, answer))
+        
+    except Exception as e:
+        return get_fallback_feedback(e)
+
+
+# Cache of AI feedback for interview answers
+# Users often give the same answer to the same fixed question, so feedback
+# is reused for answers that are identical after normalization and,
+# optionally, for near-duplicates found with MinHash.
+ANSWER_PUNCTUATION = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+MINHASH_PERMUTATIONS = 128
+MINHASH_BANDS = 32  # LSH bands of 4 rows: answers this similar almost surely share one
+NEAR_DUPLICATE_THRESHOLD = 0.85  # estimated Jaccard similarity of word 1-2-grams
+NEAR_DUPLICATE_MIN_WORDS = 25  # shorter answers only match exactly
+_minhash_rng = np.random.default_rng(20240601)
+MINHASH_MULTIPLIERS = _minhash_rng.integers(1, 2 ** 63, MINHASH_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+MINHASH_OFFSETS = _minhash_rng.integers(0, 2 ** 63, MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+
+def normalize_answer(text):
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return ' '.join(text.lower().translate(ANSWER_PUNCTUATION).split())
+
+
+def minhash(words):
+    """
+    MinHash signature of a list of words, using word unigrams and bigrams
+    as features; the share of equal positions in two signatures estimates
+    the Jaccard similarity of the two texts
+    """
+    features = set(words)
+    features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), 'little') for f in features),
+        dtype=np.uint64, count=len(features)
+    )
+    # One hash permutation per row (multiply-add, wrapping at 2**64)
+    with np.errstate(over='ignore'):
+        permuted = hashes[None, :] * MINHASH_MULTIPLIERS[:, None] + MINHASH_OFFSETS[:, None]
+    return permuted.min(axis=1)
+
+
+class FeedbackCache:
+    """
+    Cache of interview feedback keyed on (question, normalized answer hash)
+    
+    Entries live in an LRUCache (size bound + TTL). With near_duplicates,
+    long answers also get a MinHash signature indexed by LSH bands, so a
+    lookup only compares against answers that share a band.
+    """
+    
+    def __init__(self, max_entries=1024, ttl_seconds=24 * 60 * 60, near_duplicates=True):
+        self.entries = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)  # key -> (signature, feedback)
+        self.near_duplicates = near_duplicates
+        self._bands = {}  # (question, band number, band bytes) -> keys
+        self._band_size = 0
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+    
+    def _signature(self, normalized):
+        words = normalized.split()
+        if not self.near_duplicates or len(words) < NEAR_DUPLICATE_MIN_WORDS:
+            return None
+        return minhash(words)
+    
+    @staticmethod
+    def _band_keys(question_key, signature):
+        rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+        return [
+            (question_key, band, signature[band * rows:(band + 1) * rows].tobytes())
+            for band in range(MINHASH_BANDS)
+        ]
+    
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+    
+    def get(self, question, answer):
+        """Return cached feedback for this answer (or a near-duplicate), or None"""
+        question_key = normalize_answer(question)
+        normalized = normalize_answer(answer)
+        entry = self.entries.get((question_key, hashlib.sha256(normalized.encode()).hexdigest()))
+        if entry is not None:
+            self._count('exact_hits')
+            return entry[1]
+        
+        signature = self._signature(normalized)
+        if signature is not None:
+            with self._lock:
+                candidates = set()
+                for band_key in self._band_keys(question_key, signature):
+                    candidates.update(self._bands.get(band_key, ()))
+            best, best_similarity = None, NEAR_DUPLICATE_THRESHOLD
+            for key in candidates:
+                entry = self.entries.get(key)
+                if entry is not None:
+                    similarity = np.count_nonzero(entry[0] == signature) / MINHASH_PERMUTATIONS
+                    if similarity >= best_similarity:
+                        best, best_similarity = entry[1], similarity
+            if best is not None:
+                self._count('near_hits')
+                return best
+        
+        self._count('misses')
+        return None
+    
+    def set(self, question, answer, feedback):
+        """Cache feedback for an answer (error fallbacks are not cached)"""
+        if 'error' in feedback:
+            return
+        question_key = normalize_answer(question)
+        normalized = normalize_answer(answer)
+        key = (question_key, hashlib.sha256(normalized.encode()).hexdigest())
+        signature = self._signature(normalized)
+        self.entries.set(key, (signature, feedback))
+        if signature is None:
+            return
+        
+        with self._lock:
+            for band_key in self._band_keys(question_key, signature):
+                self._bands.setdefault(band_key, set()).add(key)
+                self._band_size += 1
+            # Drop keys the LRU has evicted or expired once they pile up
+            if self._band_size > 2 * MINHASH_BANDS * self.entries.max_entries:
+                self._band_size = 0
+                for band_key in list(self._bands):
+                    keys = {k for k in self._bands[band_key] if k in self.entries}
+                    if keys:
+                        self._bands[band_key] = keys
+                        self._band_size += len(keys)
+                    else:
+                        del self._bands[band_key]
+    
+    def stats(self):
+        """Return cache metrics"""
+        lookups = self.exact_hits + self.near_hits + self.misses
+        return {
+            'size': len(self.entries),
+            'max_entries': self.entries.max_entries,
+            'exact_hits': self.exact_hits,
+            'near_hits': self.near_hits,
+            'misses': self.misses,
+            'evictions': self.entries.evictions,
+            'hit_rate': round((self.exact_hits + self.near_hits) / lookups * 100, 1) if lookups else 0
+        }
+
+
+# Limits on LLM calls
+# Each worker process sends at most `max_concurrent` requests at a time
+# (and, optionally, `rate_per_second` on average); the rest wait in a
+# bounded priority queue. Identical prompts already in flight share one
+# call. When the queue is full the caller gets LLMQueueFullError instead
+# of silently degraded feedback.
+PRIORITY_IN_PROGRESS = 0  # sessions that have already answered a question go first
+PRIORITY_NEW = 1
+
+
+class LLMQueueFullError(Exception):
+    """Raised when an LLM call cannot be queued (queue full or waited too long)"""
+
+
+class FeedbackUnavailableError(Exception):
+    """Raised when the AI feedback call failed (after its retries)"""
+
+
+class LLMRequestLimiter:
+    """
+    Semaphore + token bucket limiter with a bounded priority queue,
+    in-flight deduplication and queue metrics
+    """
+    
+    def __init__(self, max_concurrent=8, rate_per_second=None, burst=None, max_queue=100, queue_timeout=30):
+        self.max_concurrent = max_concurrent
+        self.rate_per_second = rate_per_second or None
+        self.burst = burst or max(1, max_concurrent)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = []  # heap of [priority, sequence]
+        self._sequence = 0
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._in_flight = {}  # dedup key -> Future
+        self._wait_times = deque(maxlen=1000)  # seconds, most recent calls
+        self.completed = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.peak_queue_depth = 0
+    
+    def _token_wait(self):
+        """Seconds until a rate-limit token is available (0 if one is ready)"""
+        if self.rate_per_second is None:
+            return 0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate_per_second)
+        self._refilled = now
+        return 0 if self._tokens >= 1 else (1 - self._tokens) / self.rate_per_second
+    
+    def _start(self, started):
+        if self.rate_per_second is not None:
+            self._tokens -= 1
+        self._active += 1
+        self._wait_times.append(time.monotonic() - started)
+    
+    def acquire(self, priority=PRIORITY_NEW):
+        """Wait for a slot; raises LLMQueueFullError if the queue is full or the wait times out"""
+        started = time.monotonic()
+        with self._cond:
+            if not self._waiting and self._active < self.max_concurrent and self._token_wait() == 0:
+                self._start(started)
+                return
+            if len(self._waiting) >= self.max_queue:
+                self.rejected += 1
+                raise LLMQueueFullError("The AI feedback queue is full, please try again in a moment")
+            
+            self._sequence += 1
+            entry = [priority, self._sequence]
+            heapq.heappush(self._waiting, entry)
+            self.peak_queue_depth = max(self.peak_queue_depth, len(self._waiting))
+            deadline = started + self.queue_timeout
+            
+            while True:
+                timeout = deadline - time.monotonic()
+                if self._waiting[0] is entry and self._active < self.max_concurrent:
+                    token_wait = self._token_wait()
+                    if token_wait == 0:
+                        heapq.heappop(self._waiting)
+                        self._start(started)
+                        # The next in line may be able to start too
+                        self._cond.notify_all()
+                        return
+                    timeout = min(timeout, token_wait)
+                if deadline <= time.monotonic():
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                    self.timed_out += 1
+                    self._cond.notify_all()
+                    raise LLMQueueFullError("Timed out waiting for AI feedback capacity, please try again")
+                self._cond.wait(timeout)
+    
+    def release(self):
+        """Give a slot back"""
+        with self._cond:
+            self._active -= 1
+            self.completed += 1
+            self._cond.notify_all()
+    
+    @contextmanager
+    def slot(self, priority=PRIORITY_NEW):
+        """Hold a slot for the duration of a with-block (e.g. a streamed completion)"""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+    
+    def run(self, key, function, priority=PRIORITY_NEW):
+        """
+        Call function() within a slot; concurrent calls with the same key
+        wait for the first one and share its result
+        
+        Parameters:
+        key (str): Identifies the request (e.g. a hash of the prompt)
+        function (callable): Makes the LLM call
+        priority (int): PRIORITY_IN_PROGRESS or PRIORITY_NEW (lower goes first)
+        """
+        with self._cond:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result()
+        
+        try:
+            with self.slot(priority):
+                result = function()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cond:
+                self._in_flight.pop(key, None)
+    
+    def stats(self):
+        """Return queue depth, concurrency and wait-time metrics"""
+        with self._cond:
+            waits = sorted(self._wait_times)
+            return {
+                'queue_depth': len(self._waiting),
+                'peak_queue_depth': self.peak_queue_depth,
+                'in_flight': self._active,
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'rate_per_second': self.rate_per_second,
+                'completed': self.completed,
+                'coalesced': self.coalesced,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+                'avg_wait_ms': round(sum(waits) / len(waits) * 1000, 1) if waits else 0,
+                'p95_wait_ms': round(waits[min(len(waits) - 1, int(0.95 * len(waits)))] * 1000, 1) if waits else 0
+            }
+
+
+def get_prompt_key(question, answer):
+    """Key identifying identical feedback prompts"""
+    return hashlib.sha256(f"{question}\0{answer}".encode()).hexdigest()
+
+
+def get_score_pattern(score_name):
+    """
+    Regex for a score in the feedback text, e.g. "Content Score (1-10): 8"
+    
+    The "(1-10)" scale copied from the prompt is skipped so it is not read
+    as the score.
+    """
+    return re.compile(re.escape(score_name) + r"(?:\s*\(\s*1\s*-\s*10\s*\))?.*?(\d+)", re.IGNORECASE)
+
+
+def extract_score(text, score_name):
+    """Helper function to extract score from feedback text"""
+    match = get_score_pattern(score_name).search(text)
+    if match:
+        return int(match.group(1))
+    return 5  # Default score
+
+
+FEEDBACK_SCORES = (
+    ('content_score', 'Content Score'),
+    ('communication_score', 'Communication Score')
+)
+
+
+class FeedbackScoreParser:
+    """
+    Picks the scores out of streamed feedback as soon as each one is complete
+    
+    A score sits on one line, so only lines finished since the last chunk
+    are searched (a half-streamed "1" could still become "10").
+    """
+    
+    def __init__(self):
+        self.text = ''
+        self.scores = {}
+        self._searched = 0  # text before this offset has been searched
+        self._patterns = [(key, get_score_pattern(name)) for key, name in FEEDBACK_SCORES]
+    
+    def feed(self, chunk):
+        """Add streamed text; returns the scores completed by it"""
+        self.text += chunk
+        end = self.text.rfind('\n') + 1
+        if end <= self._searched:
+            return {}
+        lines = self.text[self._searched:end]
+        self._searched = end
+        
+        found = {}
+        for key, pattern in self._patterns:
+            if key not in self.scores:
+                match = pattern.search(lines)
+                if match:
+                    found[key] = self.scores[key] = int(match.group(1))
+        return found
+    
+    def finish(self):
+        """Return the parsed feedback for the whole text (same as analyze_interview_answer)"""
+        return parse_interview_feedback(self.text)
+
+
+# Speech-quality analysis for interview answers
+# Fillers and hedges are matched on whole words in a single pass over the
+# tokens, so 'like' in 'likely' or 'um' in 'summary' no longer count.
+FILLER_PHRASES = ('um', 'uh', 'like', 'you know', 'actually', 'basically', 'literally', 'kind of', 'sort of')
+HEDGE_PHRASES = (
+    'i think', 'i guess', 'i believe', 'i feel like', 'i suppose', 'maybe', 'perhaps',
+    'probably', 'possibly', 'somewhat', 'more or less', 'not sure', 'i hope'
+)
+
+# Words, and runs of sentence-ending punctuation
+SPEECH_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)*|[.!?]+")
+# Drawn-out fillers ('umm', 'uhhh') count as the plain filler
+ELONGATED_FILLER_PATTERN = re.compile(r'u+m+|u+h+')
+# 'like' after these words is a verb ("I would like to"), not a filler
+LIKE_VERB_PRECEDERS = frozenset(['i', 'you', 'we', 'they', 'would', "i'd", "we'd", "you'd", "they'd", "don't", 'really'])
+
+
+def compile_phrase_matcher(phrases_by_kind):
+    """
+    Build a phrase matcher: first word -> ((words, kind, phrase), ...),
+    longest phrases first so 'i feel like' wins over 'like'
+    
+    Parameters:
+    phrases_by_kind (dict): kind (e.g. 'filler') -> iterable of phrases
+    """
+    matcher = {}
+    for kind, phrases in phrases_by_kind.items():
+        for phrase in phrases:
+            words = tuple(phrase.split())
+            matcher.setdefault(words[0], []).append((words, kind, phrase))
+    return MappingProxyType({
+        word: tuple(sorted(candidates, key=lambda candidate: -len(candidate[0])))
+        for word, candidates in matcher.items()
+    })
+
+
+SPEECH_PHRASE_MATCHER = compile_phrase_matcher({'filler': FILLER_PHRASES, 'hedge': HEDGE_PHRASES})
+
+
+def analyze_speech(answer):
+    """
+    Measure the speech quality of an answer in one pass over its words
+    
+    Returns filler and hedge counts, immediately repeated words ("the the",
+    "I I"), word and sentence counts, and the confidence score (based on
+    fillers per word, as before).
+    
+    Parameters:
+    answer (str): User's answer text
+    """
+    tokens = SPEECH_TOKEN_PATTERN.findall(answer.lower())
+    
+    counts = {'filler': {}, 'hedge': {}}
+    word_count = 0
+    sentence_count = 0
+    repeated_words = 0
+    previous = None
+    skip = 0
+    in_sentence = False
+    
+    for i, token in enumerate(tokens):
+        if token[0] in '.!?':
+            if in_sentence:
+                sentence_count += 1
+                in_sentence = False
+            previous = None
+            continue
+        
+        word_count += 1
+        in_sentence = True
+        if len(token) > 2 and ELONGATED_FILLER_PATTERN.fullmatch(token):
+            token = token[0] + token[-1]
+        if token == previous:
+            repeated_words += 1
+        
+        if skip:
+            skip -= 1
+        else:
+            for words, kind, phrase in SPEECH_PHRASE_MATCHER.get(token, ()):
+                if len(words) == 1 or tuple(tokens[i + 1:i + len(words)]) == words[1:]:
+                    if phrase == 'like' and previous in LIKE_VERB_PRECEDERS:
+                        continue
+                    counts[kind][phrase] = counts[kind].get(phrase, 0) + 1
+                    skip = len(words) - 1
+                    break
+        previous = token
+    
+    if in_sentence:
+        sentence_count += 1
+    
+    total_fillers = sum(counts['filler'].values())
+    
+    # Calculate confidence score based on filler words
+    if word_count > 0:
+        filler_percentage = (total_fillers / word_count) * 100
+        confidence_score = max(0, 100 - (filler_percentage * 10))
+    else:
+        confidence_score = 0
+    
+    return {
+        'filler_words': counts['filler'],
+        'total_fillers': total_fillers,
+        'confidence_score': round(confidence_score, 1),
+        'hedges': counts['hedge'],
+        'total_hedges': sum(counts['hedge'].values()),
+        'repeated_words': repeated_words,
+        'word_count': word_count,
+        'sentence_count': sentence_count,
+        'words_per_sentence': round(word_count / sentence_count, 1) if sentence_count else 0
+    }
+
+
+def detect_filler_words(answer):
+    """
+    Detect filler words in the answer (see analyze_speech for the other metrics)
+    
+    Parameters:
+    answer (str): User's answer text
+    """
+    return analyze_speech(answer)
+
+
+def _analyze_speech_chunk(answers):
+    """Worker-process entry point for analyze_speech_batch"""
+    return [analyze_speech(answer) for answer in answers]
+
+
+def analyze_speech_batch(answers, workers=None, chunk_size=500):
+    """
+    Analyze many answers (e.g. stored interview transcripts) at once
+    
+    Large batches are split into chunks analyzed in worker processes; the
+    summary is computed over the whole batch with numpy. Returns
+    (results, summary), with results in the same order as answers.
+    
+    Parameters:
+    answers (list): Answer texts
+    workers (int): Worker processes (default: CPU count; 1 = in this process)
+    chunk_size (int): Answers per worker task
+    """
+    answers = [str(answer) for answer in answers]
+    workers = workers or os.cpu_count() or 1
+    
+    if workers == 1 or len(answers) <= chunk_size:
+        results = _analyze_speech_chunk(answers)
+    else:
+        chunks = [answers[i:i + chunk_size] for i in range(0, len(answers), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = [result for chunk in pool.map(_analyze_speech_chunk, chunks) for result in chunk]
+    
+    return results, summarize_speech(results)
+
+
+def summarize_speech(results):
+    """
+    Aggregate analyze_speech results into batch-level metrics
+    
+    Parameters:
+    results (list): analyze_speech results
+    """
+    if not results:
+        return {'answers': 0}
+    
+    columns = ('confidence_score', 'total_fillers', 'total_hedges', 'repeated_words', 'word_count', 'sentence_count')
+    metrics = np.array([[result[column] for column in columns] for result in results], dtype=float)
+    confidence, fillers, hedges, repeated, words, sentences = metrics.T
+    total_words = max(words.sum(), 1.0)
+    
+    filler_totals = {}
+    hedge_totals = {}
+    for result in results:
+        for phrase, count in result['filler_words'].items():
+            filler_totals[phrase] = filler_totals.get(phrase, 0) + count
+        for phrase, count in result['hedges'].items():
+            hedge_totals[phrase] = hedge_totals.get(phrase, 0) + count
+    
+    return {
+        'answers': len(results),
+        'avg_confidence': round(float(confidence.mean()), 1),
+        'median_confidence': round(float(np.median(confidence)), 1),
+        'p10_confidence': round(float(np.percentile(confidence, 10)), 1),
+        'fillers_per_100_words': round(float(fillers.sum() / total_words * 100), 2),
+        'hedges_per_100_words': round(float(hedges.sum() / total_words * 100), 2),
+        'repeated_words_per_100_words': round(float(repeated.sum() / total_words * 100), 2),
+        'avg_words_per_sentence': round(float(words.sum() / max(sentences.sum(), 1.0)), 1),
+        'answers_with_fillers': int((fillers > 0).sum()),
+        'top_fillers': dict(sorted(filler_totals.items(), key=lambda item: -item[1])[:5]),
+        'top_hedges': dict(sorted(hedge_totals.items(), key=lambda item: -item[1])[:5])
+    }
+
+
+def create_interview_session(company, role, difficulty=None, competency=None, seed=None):
+    """
+    Create a new interview session
+    
+    Parameters:
+    company (str): Company name
+    role (str): Job role
+    difficulty (str): Only ask questions of this difficulty (optional)
+    competency (str): Only ask questions testing this competency (optional)
+    seed (int): Question selection seed; a random one is chosen (and stored
+        in the session) if not given, so any session can be replayed
+    """
+    
+    from datetime import datetime
+    
+    session_id = generate_id('interview_')
+    
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    questions = get_interview_questions(company, role, difficulty=difficulty, competency=competency, seed=seed)
+    if not questions:
+        raise ValueError('No interview questions match the selected difficulty and competency')
+    
+    session = {
+        'session_id': session_id,
+        'company': company,
+        'role': role,
+        'questions': questions,
+        'question_seed': seed,
+        'current_question': 0,
+        'answers': [],
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    
+    return session
+
+
+def calculate_overall_score(session):
+    """
+    Calculate overall interview performance score
+    
+    Parameters:
+    session (dict): Interview session with answers
+    """
+    
+    if not session['answers']:
         return {
             'overall_score': 0,
             'content_avg': 0,
@@ -1001,4 +4365,485 @@ def calculate_overall_score(session):
         'content_avg': round(content_avg, 1),
         'communication_avg': round(communication_avg, 1),
         'confidence_avg': round(confidence_avg, 1)
-    }
\ No newline at end of file
+    }
+
+# Storage for interview sessions
+# Sessions expire after a period of inactivity (TTL, renewed on every
+# save) and the store is bounded: past max_entries the least recently
+# active sessions are evicted. The SQLite and Redis backends are shared by
+# every worker, so an interview can continue on any worker or node.
+class SessionStore(ABC):
+    """Interface for interview session storage backends"""
+    
+    @abstractmethod
+    def get(self, session_id):
+        """Return the session with this id, or None if missing or expired"""
+    
+    @abstractmethod
+    def save(self, session):
+        """Store a session (new or changed) and renew its TTL"""
+    
+    @abstractmethod
+    def delete(self, session_id):
+        """Remove a session"""
+    
+    @abstractmethod
+    def stats(self):
+        """Return store metrics"""
+
+
+class MemorySessionStore(SessionStore):
+    """In-process sessions (an LRUCache): fastest, but one copy per worker"""
+    
+    def __init__(self, max_entries=10000, ttl_seconds=6 * 60 * 60):
+        self.sessions = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    
+    def get(self, session_id):
+        return self.sessions.get(session_id)
+    
+    def save(self, session):
+        self.sessions.set(session['session_id'], session)
+    
+    def delete(self, session_id):
+        self.sessions.pop(session_id)
+    
+    def stats(self):
+        return dict(self.sessions.stats(), backend='memory')
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Sessions in SQLite (WAL), shared by every worker process on the host
+    
+    Expired and excess sessions are purged every `cleanup_every` saves,
+    using the indexes on expires_at and updated_at.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS interview_sessions (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_interview_sessions_expires ON interview_sessions (expires_at);
+        CREATE INDEX IF NOT EXISTS idx_interview_sessions_updated ON interview_sessions (updated_at);
+    """
+    
+    def __init__(self, db_path, max_entries=10000, ttl_seconds=6 * 60 * 60, cleanup_every=50):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cleanup_every = cleanup_every
+        self.evictions = 0
+        self._saves = 0
+        self._connection = SQLiteConnectionPool(db_path).connection
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+    
+    def get(self, session_id):
+        with self._connection() as conn:
+            row = conn.execute(
+                'SELECT data FROM interview_sessions WHERE id = ? AND expires_at > ?',
+                (session_id, time.time())
+            ).fetchone()
+        return json_loads(row[0]) if row else None
+    
+    def save(self, session):
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO interview_sessions (id, data, updated_at, expires_at) VALUES (?, ?, ?, ?)',
+                (session['session_id'], json.dumps(session), now, now + self.ttl_seconds)
+            )
+        self._saves += 1
+        if self._saves % self.cleanup_every == 0:
+            self.cleanup()
+    
+    def delete(self, session_id):
+        with self._connection() as conn:
+            conn.execute('DELETE FROM interview_sessions WHERE id = ?', (session_id,))
+    
+    def cleanup(self):
+        """Delete expired sessions, then the least recently active ones over max_entries"""
+        with self._connection() as conn:
+            conn.execute('DELETE FROM interview_sessions WHERE expires_at <= ?', (time.time(),))
+            excess = conn.execute('SELECT COUNT(*) FROM interview_sessions').fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    'DELETE FROM interview_sessions WHERE id IN '
+                    '(SELECT id FROM interview_sessions ORDER BY updated_at LIMIT ?)',
+                    (excess,)
+                )
+                self.evictions += excess
+    
+    def stats(self):
+        with self._connection() as conn:
+            size = conn.execute(
+                'SELECT COUNT(*) FROM interview_sessions WHERE expires_at > ?', (time.time(),)
+            ).fetchone()[0]
+        return {'backend': 'sqlite', 'size': size, 'max_entries': self.max_entries, 'evictions': self.evictions}
+
+
+class LocalRedis:
+    """
+    In-process stand-in for a Redis server, implementing only the
+    commands RedisSessionStore uses (with the redis-py signatures), so the
+    Redis backend can run in development and tests without a server
+    """
+    
+    def __init__(self):
+        self._values = {}  # key -> (value, expires_at or None)
+        self._sorted_sets = {}  # key -> {member: score}
+        self._lock = threading.Lock()
+    
+    def get(self, name):
+        with self._lock:
+            entry = self._values.get(name)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= time.monotonic():
+                del self._values[name]
+                return None
+            return entry[0]
+    
+    def set(self, name, value, ex=None):
+        if isinstance(value, str):
+            value = value.encode()
+        with self._lock:
+            self._values[name] = (value, time.monotonic() + ex if ex else None)
+        return True
+    
+    def delete(self, *names):
+        with self._lock:
+            return sum(
+                (self._values.pop(name, None) is not None) + (self._sorted_sets.pop(name, None) is not None)
+                for name in names
+            )
+    
+    def zadd(self, name, mapping):
+        with self._lock:
+            members = self._sorted_sets.setdefault(name, {})
+            added = sum(1 for member in mapping if member not in members)
+            members.update(mapping)
+            return added
+    
+    def zrem(self, name, *members):
+        with self._lock:
+            sorted_set = self._sorted_sets.get(name, {})
+            return sum(sorted_set.pop(member, None) is not None for member in members)
+    
+    def zcard(self, name):
+        with self._lock:
+            return len(self._sorted_sets.get(name, {}))
+    
+    def zpopmin(self, name, count=1):
+        with self._lock:
+            sorted_set = self._sorted_sets.get(name, {})
+            lowest = sorted(sorted_set.items(), key=lambda item: item[1])[:count]
+            for member, _ in lowest:
+                del sorted_set[member]
+            return [(member.encode() if isinstance(member, str) else member, score) for member, score in lowest]
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Sessions in Redis (or anything speaking its protocol), shared by
+    every worker and node
+    
+    Redis expires each session key itself (SET ... EX); a sorted set of
+    last-save times gives the LRU order for the max_entries bound.
+    """
+    
+    def __init__(self, client, max_entries=10000, ttl_seconds=6 * 60 * 60, prefix='careerbot:session:'):
+        self.client = client
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.index_key = prefix + 'lru'
+        self.evictions = 0
+    
+    def get(self, session_id):
+        value = self.client.get(self.prefix + session_id)
+        return json.loads(value) if value is not None else None
+    
+    def save(self, session):
+        session_id = session['session_id']
+        self.client.set(self.prefix + session_id, json.dumps(session), ex=self.ttl_seconds)
+        self.client.zadd(self.index_key, {session_id: time.time()})
+        
+        excess = self.client.zcard(self.index_key) - self.max_entries
+        if excess > 0:
+            evicted = [member.decode() for member, _ in self.client.zpopmin(self.index_key, excess)]
+            self.client.delete(*[self.prefix + member for member in evicted])
+            self.evictions += len(evicted)
+    
+    def delete(self, session_id):
+        self.client.delete(self.prefix + session_id)
+        self.client.zrem(self.index_key, session_id)
+    
+    def stats(self):
+        return {
+            'backend': 'redis',
+            'size': self.client.zcard(self.index_key),  # includes sessions that expired since
+            'max_entries': self.max_entries,
+            'evictions': self.evictions
+        }
+
+
+def create_session_store(backend='sqlite', db_path=None, redis_url=None,
+                         max_entries=10000, ttl_seconds=6 * 60 * 60):
+    """
+    Create an interview session store
+    
+    Parameters:
+    backend (str): 'sqlite' (shared across workers), 'memory', or 'redis'
+    db_path (str): SQLite database file (for the sqlite backend)
+    redis_url (str): Redis server URL (for the redis backend); without
+        one, an in-process LocalRedis stand-in is used
+    max_entries (int): Most sessions kept before evicting the least recently active
+    ttl_seconds (int): Seconds of inactivity before a session expires
+    """
+    if backend == 'memory':
+        return MemorySessionStore(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    if backend == 'sqlite':
+        return SQLiteSessionStore(
+            db_path or os.path.join('data', 'careerbot.db'),
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds
+        )
+    if backend == 'redis':
+        if redis_url:
+            try:
+                import redis
+            except ImportError:
+                raise ValueError("The redis backend needs the 'redis' package (pip install redis)")
+            client = redis.Redis.from_url(redis_url)
+        else:
+            client = LocalRedis()
+        return RedisSessionStore(client, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unknown session store backend: {backend}")
+
+
+# Response compression and static asset caching
+COMPRESSIBLE_MIMETYPES = frozenset([
+    'text/html', 'text/css', 'text/plain', 'text/javascript', 'application/javascript',
+    'application/json', 'image/svg+xml'
+])
+
+# Asset metadata; variants maps content encoding (None = uncompressed) -> bytes
+StaticAsset = namedtuple('StaticAsset', ['path', 'mtime', 'version', 'mimetype', 'variants'])
+
+
+def get_content_encodings():
+    """Content encodings this server can produce, most preferred first"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def choose_content_encoding(accept_encodings):
+    """
+    Pick the best content encoding the client accepts
+    
+    Parameters:
+    accept_encodings (Accept): Parsed Accept-Encoding header (request.accept_encodings)
+    """
+    return accept_encodings.best_match(get_content_encodings())
+
+
+def compress_body(data, encoding, level=6):
+    """
+    Compress a response body
+    
+    Parameters:
+    data (bytes): Uncompressed body
+    encoding (str): 'gzip' or 'br'
+    level (int): 1 (fastest) to 9 (smallest); brotli uses the matching quality up to 11
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=11 if level >= 9 else level)
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+class StaticAssetCache:
+    """
+    In-memory copies of the static files, each with a content hash (for
+    cache-busting URLs) and precompressed variants for every supported
+    encoding
+    
+    Variants written to disk by write_precompressed (script.js.gz,
+    script.js.br) are used when at least as new as the file; otherwise the
+    file is compressed once at maximum level. Files are re-read when their
+    mtime changes.
+    """
+    
+    def __init__(self, static_folder, max_file_size=1024 * 1024):
+        self.static_folder = static_folder
+        self.max_file_size = max_file_size
+        self._assets = {}
+        self._lock = threading.Lock()
+    
+    def get(self, filename):
+        """Return the StaticAsset for filename, or None if it isn't cached"""
+        path = safe_join(self.static_folder, filename)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path) or stat.st_size > self.max_file_size:
+            return None
+        
+        asset = self._assets.get(filename)
+        if asset is not None and asset.mtime == stat.st_mtime:
+            return asset
+        with self._lock:
+            asset = self._assets.get(filename)
+            if asset is None or asset.mtime != stat.st_mtime:
+                asset = self._load(path, stat.st_mtime)
+                self._assets[filename] = asset
+        return asset
+    
+    def version(self, filename):
+        """Return the content hash of a static file, or None"""
+        asset = self.get(filename)
+        return asset.version if asset is not None else None
+    
+    def _load(self, path, mtime):
+        with open(path, 'rb') as file:
+            data = file.read()
+        mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        
+        variants = {None: data}
+        if mimetype in COMPRESSIBLE_MIMETYPES:
+            for encoding in get_content_encodings():
+                variants[encoding] = self._read_precompressed(path, encoding, mtime) or compress_body(data, encoding, level=9)
+        
+        return StaticAsset(
+            path=path,
+            mtime=mtime,
+            version=hashlib.sha256(data).hexdigest()[:12],
+            mimetype=mimetype,
+            variants=MappingProxyType(variants)
+        )
+    
+    @staticmethod
+    def _read_precompressed(path, encoding, mtime):
+        variant_path = path + ('.br' if encoding == 'br' else '.gz')
+        try:
+            if os.path.getmtime(variant_path) < mtime:
+                return None
+            with open(variant_path, 'rb') as file:
+                return file.read()
+        except OSError:
+            return None
+    
+    def write_precompressed(self):
+        """
+        Write .gz (and .br) files next to every compressible static file
+        Returns the paths written
+        """
+        written = []
+        for root, _, files in os.walk(self.static_folder):
+            for name in sorted(files):
+                if name.endswith(('.gz', '.br')):
+                    continue
+                filename = os.path.relpath(os.path.join(root, name), self.static_folder).replace(os.sep, '/')
+                asset = self.get(filename)
+                if asset is None:
+                    continue
+                for encoding, data in asset.variants.items():
+                    if encoding is None:
+                        continue
+                    variant_path = asset.path + ('.br' if encoding == 'br' else '.gz')
+                    with open(variant_path, 'wb') as file:
+                        file.write(data)
+                    written.append(variant_path)
+        return written
+
+
+def compress_stream(chunks, level=6):
+    """
+    gzip-compress a streamed response body chunk by chunk, flushing after
+    each chunk so the client still receives data as it is produced
+    
+    Parameters:
+    chunks (iterable): Body chunks (bytes or str)
+    level (int): Compression level, 1 (fastest) to 9 (smallest)
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# Response shaping for large JSON payloads
+def parse_fields(value):
+    """
+    Parse a ?fields= parameter ("scores,answers.content_score") into
+    a tree of the keys to keep, or None to keep everything
+    
+    Parameters:
+    value (str): Comma-separated dotted paths
+    """
+    if not value:
+        return None
+    tree = {}
+    for path in value.split(','):
+        keys = [key.strip() for key in path.split('.') if key.strip()]
+        node = tree
+        for depth, key in enumerate(keys):
+            if key in node and node[key] is None:
+                break  # A shorter path already keeps this whole value
+            if depth == len(keys) - 1:
+                node[key] = None
+            else:
+                node = node.setdefault(key, {})
+    return tree or None
+
+
+def select_fields(data, fields):
+    """
+    Keep only the selected keys of data (applied to every item of a list)
+    
+    Parameters:
+    data: Dict or list of dicts to filter
+    fields (dict): Tree from parse_fields; None keeps a value whole
+    """
+    if fields is None:
+        return data
+    if isinstance(data, list):
+        return [select_fields(item, fields) for item in data]
+    if isinstance(data, dict):
+        return {key: select_fields(data[key], subfields) for key, subfields in fields.items() if key in data}
+    return data
+
+
+def stream_json_array(items, dumps, chunk_size=200):
+    """
+    Encode a list as a JSON array in chunks, for streaming responses
+    
+    The first bytes go out before the whole list is encoded, and no more
+    than chunk_size items are held as text at once.
+    
+    Parameters:
+    items (iterable): Values to encode
+    dumps (callable): Function encoding one value as JSON text
+    chunk_size (int): Items per yielded chunk
+    """
+    yield '['
+    chunk = []
+    first = True
+    for item in items:
+        chunk.append(dumps(item))
+        if len(chunk) >= chunk_size:
+            yield ('' if first else ',') + ','.join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield ('' if first else ',') + ','.join(chunk)
+    yield ']'